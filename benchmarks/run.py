@@ -0,0 +1,432 @@
+"""
+Throughput / latency benchmarks for the pricing engines.
+
+Usage (from the repository root):
+    python benchmarks/run.py                          # full sweep, summary table on stderr
+    python benchmarks/run.py --quick -o bench.json    # small sizes, write results
+    python benchmarks/run.py --filter binomial        # only cases whose id contains "binomial"
+    python benchmarks/run.py -o new.json --compare baseline.json --tolerance 0.15
+
+Each case prices a chain of options (optionally across a thread pool) and reports
+ns/option, options/sec, paths/sec (Monte Carlo) and peak RSS. By default every case
+runs in a fresh interpreter so the RSS high-water mark belongs to that case alone.
+With --compare, cases slower than the baseline by more than the tolerance are listed
+and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, List, Optional
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from derivatives_pricer.domain.enums import BarrierType
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+
+MARKET = MarketState(spot_price=100.0, risk_free_rate=0.05, volatility=0.20, dividend_yield=0.01)
+
+@dataclass
+class BenchmarkCase:
+    """
+    One point of the sweep.
+
+    `build` returns a zero-argument callable that performs the measured work once.
+    If the callable is also a context manager, it is entered around the
+    measurement (e.g. to own a thread pool).
+    `options` is the number of contracts priced per call and `paths` the number of
+    simulated paths per call (0 for non-simulation engines).
+    """
+    engine: str
+    mode: str
+    params: Dict[str, int]
+    options: int
+    build: Callable[[], Callable[[], object]]
+    paths: int = 0
+
+    @property
+    def case_id(self) -> str:
+        settings = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.engine}/{self.mode}/{settings}"
+
+@dataclass
+class BenchmarkResult:
+    case_id: str
+    engine: str
+    mode: str
+    params: Dict[str, int]
+    options: int
+    repeats: int
+    best_seconds: float
+    median_seconds: float
+    ns_per_option: float
+    options_per_sec: float
+    paths_per_sec: Optional[float]
+    peak_rss_kb: int
+    extra: Dict[str, float] = field(default_factory=dict)
+
+# --- Chains ---
+
+def _american_put_chain(n: int, expiry: float = 1.0) -> List[VanillaOption]:
+    strikes = np.linspace(80.0, 120.0, n) if n > 1 else [100.0]
+    return [VanillaOption.american_put(float(k), expiry) for k in strikes]
+
+def _european_call_chain(n: int, expiry: float = 1.0) -> List[VanillaOption]:
+    strikes = np.linspace(80.0, 120.0, n) if n > 1 else [100.0]
+    return [VanillaOption.european_call(float(k), expiry) for k in strikes]
+
+class _ThreadedChain:
+    """Prices a chain across a thread pool that lives as long as the `with` block."""
+
+    def __init__(self, engine, chain, threads: int):
+        self._engine = engine
+        self._chain = chain
+        self._threads = threads
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "_ThreadedChain":
+        self._pool = ThreadPoolExecutor(max_workers=self._threads).__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        pool, self._pool = self._pool, None
+        return pool.__exit__(*exc_info)
+
+    def __call__(self) -> List[float]:
+        return list(self._pool.map(lambda option: self._engine.price(option, MARKET), self._chain))
+
+def _price_chain(engine, chain, threads: int) -> Callable[[], object]:
+    if threads <= 1:
+        return lambda: [engine.price(option, MARKET) for option in chain]
+    return _ThreadedChain(engine, chain, threads)
+
+# --- Case registry ---
+
+def black_scholes_cases(quick: bool) -> List[BenchmarkCase]:
+    from derivatives_pricer.engines.analytic import BlackScholesEngine
+    cases = []
+    for chain in ([1, 1000] if quick else [1, 1000, 20000]):
+        cases.append(BenchmarkCase(
+            "black_scholes", "scalar", {"chain": chain}, chain,
+            lambda chain=chain: _price_chain(BlackScholesEngine(), _european_call_chain(chain), 1),
+        ))
+    return cases
+
+def binomial_cases(quick: bool) -> List[BenchmarkCase]:
+    from derivatives_pricer.engines.binomial import BinomialPricingEngine
+    cases = []
+    steps_grid = [100, 500] if quick else [100, 500, 1000, 2000]
+    chain_grid = [1, 20] if quick else [1, 50]
+    for steps in steps_grid:
+        for chain in chain_grid:
+            cases.append(BenchmarkCase(
+                "binomial", "scalar", {"steps": steps, "chain": chain}, chain,
+                lambda steps=steps, chain=chain: _price_chain(
+                    BinomialPricingEngine(step_count=steps), _american_put_chain(chain), 1),
+            ))
+            cases.append(BenchmarkCase(
+                "binomial", "greeks_batch", {"steps": steps, "chain": chain}, chain,
+                lambda steps=steps, chain=chain: (
+                    lambda engine=BinomialPricingEngine(step_count=steps), opts=_american_put_chain(chain):
+                        engine.price_with_greeks_batch(opts, MARKET)),
+            ))
+    for steps in steps_grid:
+        # Reference NumPy lattice, to track the gain of the fused kernel.
+        cases.append(BenchmarkCase(
+            "binomial", "numpy_backend", {"steps": steps, "chain": 1}, 1,
+            lambda steps=steps: _price_chain(
+                BinomialPricingEngine(step_count=steps, backend="numpy"), _american_put_chain(1), 1),
+        ))
+    for threads in ([2] if quick else [2, 4, 8]):
+        chain = 20 if quick else 50
+        cases.append(BenchmarkCase(
+            "binomial", "threads", {"steps": 500, "chain": chain, "threads": threads}, chain,
+            lambda threads=threads, chain=chain: _price_chain(
+                BinomialPricingEngine(step_count=500), _american_put_chain(chain), threads),
+        ))
+    return cases
+
+def monte_carlo_cases(quick: bool) -> List[BenchmarkCase]:
+    from derivatives_pricer.engines.monte_carlo import MonteCarloEngine
+    cases = []
+    path_grid = [10_000, 50_000] if quick else [10_000, 100_000, 250_000]
+    step_grid = [50] if quick else [50, 100, 250]
+    payoffs = {
+        "european": VanillaOption.european_call(100.0, 1.0),
+        "barrier": ExoticOption.barrier_up_out_call(100.0, 150.0, 1.0),
+        "asian": ExoticOption.asian_call(100.0, 1.0),
+    }
+    for mode, option in payoffs.items():
+        for paths in path_grid:
+            for steps in step_grid:
+                cases.append(BenchmarkCase(
+                    "monte_carlo", mode, {"paths": paths, "steps": steps}, 1,
+                    lambda paths=paths, steps=steps, option=option: (
+                        lambda engine=MonteCarloEngine(num_paths=paths, num_steps=steps, seed=7):
+                            engine.price(option, MARKET)),
+                    paths=paths,
+                ))
+    for paths in path_grid:
+        cases.append(BenchmarkCase(
+            "monte_carlo", "float32", {"paths": paths, "steps": 50}, 1,
+            lambda paths=paths: (
+                lambda engine=MonteCarloEngine(num_paths=paths, num_steps=50, seed=7, dtype=np.float32):
+                    engine.price(payoffs["european"], MARKET)),
+            paths=paths,
+        ))
+    for paths in path_grid:
+        cases.append(BenchmarkCase(
+            "monte_carlo", "numpy_backend", {"paths": paths, "steps": 50}, 1,
+            lambda paths=paths: (
+                lambda engine=MonteCarloEngine(num_paths=paths, num_steps=50, seed=7, backend="numpy"):
+                    engine.price(payoffs["european"], MARKET)),
+            paths=paths,
+        ))
+    barrier_book = [
+        ExoticOption.barrier_option(100.0, level, barrier_type, 1.0, is_call=is_call)
+        for level in (80.0, 90.0, 110.0, 120.0, 130.0) for barrier_type in BarrierType for is_call in (True, False)
+    ]
+    for paths in path_grid:
+        cases.append(BenchmarkCase(
+            "monte_carlo", "payoff_set", {"paths": paths, "steps": 50, "chain": len(barrier_book)},
+            len(barrier_book),
+            lambda paths=paths: (
+                lambda engine=MonteCarloEngine(num_paths=paths, num_steps=50, seed=7):
+                    engine.price_many(barrier_book, MARKET)),
+            paths=paths,
+        ))
+    for threads in ([2] if quick else [2, 4]):
+        chain = 4 if quick else 8
+        cases.append(BenchmarkCase(
+            "monte_carlo", "threads", {"paths": 20_000, "steps": 50, "chain": chain, "threads": threads},
+            chain,
+            lambda threads=threads, chain=chain: _price_chain(
+                MonteCarloEngine(num_paths=20_000, num_steps=50, seed=7), _european_call_chain(chain), threads),
+            paths=20_000 * chain,
+        ))
+    return cases
+
+def american_approximation_cases(quick: bool) -> List[BenchmarkCase]:
+    from derivatives_pricer.engines.american import AmericanApproximationEngine, AMERICAN_METHODS
+    from derivatives_pricer.instruments.batch import InstrumentBatch
+    cases = []
+    for method in AMERICAN_METHODS:
+        for chain in ([1000] if quick else [1000, 20000]):
+            cases.append(BenchmarkCase(
+                "american_approximation", method, {"chain": chain}, chain,
+                lambda method=method, chain=chain: (
+                    lambda engine=AmericanApproximationEngine(method),
+                           batch=InstrumentBatch.from_instruments(_american_put_chain(chain)):
+                        engine.price_batch(batch, MARKET)),
+            ))
+    return cases
+
+def barrier_lattice_cases(quick: bool) -> List[BenchmarkCase]:
+    from derivatives_pricer.engines.barrier_lattice import BarrierLatticeEngine, BARRIER_MESHES
+    option = ExoticOption.barrier_up_out_call(100.0, 150.0, 1.0)
+    cases = []
+    for mesh in BARRIER_MESHES:
+        for steps in ([200] if quick else [200, 400, 800]):
+            cases.append(BenchmarkCase(
+                "barrier_lattice", mesh, {"steps": steps}, 1,
+                lambda mesh=mesh, steps=steps: (
+                    lambda engine=BarrierLatticeEngine(step_count=steps, mesh=mesh):
+                        engine.price(option, MARKET)),
+            ))
+    return cases
+
+def multi_asset_cases(quick: bool) -> List[BenchmarkCase]:
+    from derivatives_pricer.domain.market import MultiAssetMarketState
+    from derivatives_pricer.engines.multi_asset import MultiAssetMonteCarloEngine
+    cases = []
+    paths = 100_000
+    for assets in ([20] if quick else [5, 20, 50]):
+        correlation = np.full((assets, assets), 0.3)
+        np.fill_diagonal(correlation, 1.0)
+        market = MultiAssetMarketState([100.0] * assets, [0.25] * assets, correlation, 0.05, [0.01] * assets)
+        payoffs = {
+            "basket": ExoticOption.basket_option([1.0 / assets] * assets, 100.0, 1.0),
+            "worst_of": ExoticOption.worst_of_option([100.0] * assets, 0.9, 1.0, is_call=False),
+        }
+        for mode, option in payoffs.items():
+            cases.append(BenchmarkCase(
+                "multi_asset", mode, {"assets": assets, "paths": paths}, 1,
+                lambda option=option, market=market: (
+                    lambda engine=MultiAssetMonteCarloEngine(num_paths=paths, seed=7):
+                        engine.price(option, market)),
+                paths=paths,
+            ))
+    return cases
+
+def calibration_cases(quick: bool) -> List[BenchmarkCase]:
+    from derivatives_pricer.calibration import (
+        OptionChain, HestonCalibrator, HestonParameters, MertonCalibrator, SVICalibrator, heston_price
+    )
+    expiries = [0.1, 0.25, 0.5, 1.0, 2.0] if quick else [0.05, 0.1, 0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0]
+    expiry, strike = (a.ravel() for a in np.meshgrid(expiries, np.linspace(70.0, 140.0, 15), indexing="ij"))
+    is_call = strike >= MARKET.spot_price
+    template = OptionChain(MARKET.spot_price, MARKET.risk_free_rate, MARKET.dividend_yield, strike, expiry,
+                           is_call, np.ones_like(strike))
+    prices = heston_price(HestonParameters(0.04, 1.5, 0.06, 0.6, -0.7), template)
+    chain = OptionChain(MARKET.spot_price, MARKET.risk_free_rate, MARKET.dividend_yield, strike, expiry,
+                        is_call, prices)
+    cases = []
+    for mode, calibrator_type in (("svi", SVICalibrator), ("heston", HestonCalibrator), ("merton", MertonCalibrator)):
+        # Cold fit of the whole surface, from the model's generic first guess.
+        cases.append(BenchmarkCase(
+            "calibration", mode, {"quotes": len(chain)}, len(chain),
+            lambda calibrator_type=calibrator_type: (
+                lambda: calibrator_type(warm_start=False).calibrate(chain)),
+        ))
+    return cases
+
+CASE_FACTORIES = [black_scholes_cases, binomial_cases, monte_carlo_cases, american_approximation_cases,
+                  barrier_lattice_cases, multi_asset_cases, calibration_cases]
+
+def all_cases(quick: bool) -> List[BenchmarkCase]:
+    return [case for factory in CASE_FACTORIES for case in factory(quick)]
+
+# --- Measurement ---
+
+def peak_rss_kb() -> int:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return int(usage / 1024) if sys.platform == "darwin" else int(usage)
+
+def measure(case: BenchmarkCase, min_time: float, max_repeats: int) -> BenchmarkResult:
+    work = case.build()
+    timings: List[float] = []
+    with work if isinstance(work, AbstractContextManager) else nullcontext():
+        work()  # warm-up: imports, caches, JIT
+        spent = 0.0
+        while len(timings) < max_repeats and (spent < min_time or len(timings) < 3):
+            start = time.perf_counter()
+            work()
+            elapsed = time.perf_counter() - start
+            timings.append(elapsed)
+            spent += elapsed
+
+    best = min(timings)
+    median = float(np.median(timings))
+    return BenchmarkResult(
+        case_id=case.case_id,
+        engine=case.engine,
+        mode=case.mode,
+        params=case.params,
+        options=case.options,
+        repeats=len(timings),
+        best_seconds=best,
+        median_seconds=median,
+        ns_per_option=median * 1e9 / case.options,
+        options_per_sec=case.options / median,
+        paths_per_sec=case.paths / median if case.paths else None,
+        peak_rss_kb=peak_rss_kb(),
+    )
+
+def _run_isolated(case_id: str, args: argparse.Namespace) -> BenchmarkResult:
+    cmd = [sys.executable, os.path.abspath(__file__), "--case", case_id,
+           "--min-time", str(args.min_time), "--max-repeats", str(args.max_repeats)]
+    if args.quick:
+        cmd.append("--quick")
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return BenchmarkResult(**json.loads(out.strip().splitlines()[-1]))
+
+# --- Comparison ---
+
+def compare(current: List[dict], baseline: List[dict], tolerance: float) -> List[str]:
+    """
+    Returns one message per case whose median ns/option grew by more than `tolerance`
+    (relative) against the baseline. Cases missing from either side are ignored.
+    """
+    previous = {row["case_id"]: row for row in baseline}
+    regressions = []
+    for row in current:
+        old = previous.get(row["case_id"])
+        if old is None:
+            continue
+        ratio = row["ns_per_option"] / old["ns_per_option"]
+        if ratio > 1.0 + tolerance:
+            regressions.append(
+                f"{row['case_id']}: {old['ns_per_option']:.0f} -> {row['ns_per_option']:.0f} ns/option "
+                f"({(ratio - 1.0) * 100:+.1f}%)"
+            )
+    return regressions
+
+def environment() -> Dict[str, str]:
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": str(os.cpu_count()),
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="small sweep for smoke runs")
+    parser.add_argument("--filter", default="", help="only run cases whose id contains this text")
+    parser.add_argument("-o", "--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed relative slowdown")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds to spend per case")
+    parser.add_argument("--max-repeats", type=int, default=50)
+    parser.add_argument("--no-isolate", action="store_true", help="run all cases in this process")
+    parser.add_argument("--list", action="store_true", help="print case ids and exit")
+    parser.add_argument("--case", help=argparse.SUPPRESS)  # internal: run one case, print JSON
+    args = parser.parse_args(argv)
+
+    cases = all_cases(args.quick)
+
+    if args.case:
+        case = next(c for c in cases if c.case_id == args.case)
+        print(json.dumps(asdict(measure(case, args.min_time, args.max_repeats))))
+        return 0
+
+    cases = [c for c in cases if args.filter in c.case_id]
+    if args.list:
+        print("\n".join(c.case_id for c in cases))
+        return 0
+
+    results = []
+    for case in cases:
+        if args.no_isolate:
+            result = measure(case, args.min_time, args.max_repeats)
+        else:
+            result = _run_isolated(case.case_id, args)
+        results.append(asdict(result))
+        paths = f"{result.paths_per_sec:>12.3g} paths/s" if result.paths_per_sec else ""
+        print(f"{result.case_id:<60}{result.ns_per_option:>14.0f} ns/opt"
+              f"{result.options_per_sec:>12.3g} opt/s{result.peak_rss_kb / 1024:>8.0f} MiB {paths}",
+              file=sys.stderr)
+
+    report = {"environment": environment(), "results": results}
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.compare}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+from .quotes import OptionChain
+from .calibrator import Calibration, ChainCalibrator
+from .heston import HestonParameters, HestonCalibrator, heston_price
+from .merton import MertonParameters, MertonCalibrator, merton_price
+from .svi import SVIParameters, SVISurface, SVICalibrator
@@ -0,0 +1,114 @@
+from abc import ABC, abstractmethod
+from dataclasses import astuple, dataclass
+from typing import Generic, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from derivatives_pricer.calibration.quotes import OptionChain
+from derivatives_pricer.common import instrumentation
+from derivatives_pricer.math.optimize import levenberg_marquardt
+
+P = TypeVar("P")
+
+@dataclass(frozen=True)
+class Calibration(Generic[P]):
+    """
+    Attributes:
+        parameters: Fitted model parameters.
+        rmse: Root mean square of the weighted residuals (roughly a volatility error
+            with vega weights).
+        iterations: Levenberg-Marquardt iterations.
+        converged: Whether the optimizer met its tolerance.
+        elapsed: Wall-clock seconds.
+    """
+    parameters: P
+    rmse: float
+    iterations: int
+    converged: bool
+    elapsed: float
+
+class ChainCalibrator(ABC, Generic[P]):
+    """
+    Fits a model's parameters to an OptionChain by weighted least squares on prices.
+
+    Subclasses provide the parameter type, its bounds, a first guess, and the model
+    prices with their Jacobian for the whole chain in one call. Each calibration
+    starts from the previous result (warm start), so recalibrating to the next market
+    snapshot typically takes a few iterations.
+    """
+    parameter_type: type
+    lower: Tuple[float, ...]
+    upper: Tuple[float, ...]
+
+    def __init__(self, initial: Optional[P] = None, warm_start: bool = True, vega_weighted: bool = True,
+                 max_iterations: int = 100):
+        """
+        Args:
+            initial: Starting point of the first calibration (a model-specific guess
+                from the chain when None).
+            warm_start: Start every later calibration from the previous result.
+            vega_weighted: Weight price residuals by 1 / vega, i.e. fit implied
+                volatilities to first order; otherwise fit raw prices.
+            max_iterations: Levenberg-Marquardt iteration cap.
+        """
+        if max_iterations <= 0:
+            raise ValueError(f"Parameter 'max_iterations' must be positive, got {max_iterations}")
+        self._initial = initial
+        self._warm_start = warm_start
+        self._vega_weighted = vega_weighted
+        self._max_iterations = max_iterations
+        self._last: Optional[Calibration[P]] = None
+
+    @property
+    def last(self) -> Optional[Calibration[P]]:
+        """Result of the most recent calibration."""
+        return self._last
+
+    def calibrate(self, chain: OptionChain, initial: Optional[P] = None) -> Calibration[P]:
+        """Fits the chain; `initial` overrides the warm start for this call."""
+        if initial is None and self._warm_start and self._last is not None:
+            initial = self._last.parameters
+        if initial is None:
+            initial = self._initial if self._initial is not None else self.initial_guess(chain)
+
+        weights = chain.vega_weights() if self._vega_weighted else np.ones(len(chain))
+
+        def residuals(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            price, jacobian = self.prices_and_jacobian(x, chain)
+            return weights * (price - chain.price), weights[:, None] * jacobian
+
+        with instrumentation.span("calibration.fit"):
+            result = levenberg_marquardt(residuals, np.array(astuple(initial), dtype=float),
+                                         np.array(self.lower), np.array(self.upper),
+                                         max_iterations=self._max_iterations)
+        instrumentation.increment("calibration.iterations", result.iterations)
+        self._last = Calibration(
+            parameters=self.parameter_type(*map(float, result.x)),
+            rmse=float(np.sqrt(2.0 * result.cost / len(chain))),
+            iterations=result.iterations,
+            converged=result.converged,
+            elapsed=result.elapsed,
+        )
+        return self._last
+
+    def prices(self, parameters: P, chain: OptionChain) -> np.ndarray:
+        """Model prices of every quote in the chain."""
+        return self.prices_and_jacobian(np.array(astuple(parameters), dtype=float), chain)[0]
+
+    @abstractmethod
+    def initial_guess(self, chain: OptionChain) -> P:
+        pass
+
+    @abstractmethod
+    def prices_and_jacobian(self, x: np.ndarray, chain: OptionChain) -> Tuple[np.ndarray, np.ndarray]:
+        """Model prices [quotes] and their derivatives [quotes, parameters] at parameter vector x."""
+        pass
+
+def atm_variance(chain: OptionChain) -> float:
+    """Implied variance of the quote closest to the money, a scale for first guesses."""
+    iv = chain.implied_volatility
+    usable = np.isfinite(iv)
+    if not np.any(usable):
+        return 0.04
+    row = np.argmin(np.where(usable, np.abs(chain.log_moneyness), np.inf))
+    return float(iv[row] ** 2)
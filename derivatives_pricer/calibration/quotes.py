@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional
+
+import numpy as np
+
+from derivatives_pricer.domain.analytic_formulas import (
+    black_scholes_price_vectorized, black_scholes_vega_vectorized, implied_volatility_vectorized
+)
+
+@dataclass(frozen=True, eq=False)
+class OptionChain:
+    """
+    European option quotes on one underlying, as columns with one row per quote.
+
+    `strike`, `expiry` and `price` are float64, `is_call` bool. The market inputs that
+    are not calibrated (spot, rate, dividend yield) are scalars. Derived columns
+    (forward log-moneyness, implied volatility, vega) are computed once.
+    """
+    spot: float
+    risk_free_rate: float
+    dividend_yield: float
+    strike: np.ndarray
+    expiry: np.ndarray
+    is_call: np.ndarray
+    price: np.ndarray
+
+    def __post_init__(self):
+        columns = {name: np.asarray(getattr(self, name), dtype=np.float64) for name in ("strike", "expiry", "price")}
+        columns["is_call"] = np.asarray(self.is_call, dtype=bool)
+        n = len(columns["strike"])
+        for name, column in columns.items():
+            column = np.broadcast_to(column, (n,)) if column.ndim == 0 else column
+            if column.ndim != 1 or len(column) != n:
+                raise ValueError(f"Column '{name}' must be 1D with {n} rows, got shape {column.shape}")
+            object.__setattr__(self, name, column)
+        if np.any(columns["expiry"] <= 0) or np.any(columns["strike"] <= 0):
+            raise ValueError("Quotes need positive strikes and expiries")
+
+    @classmethod
+    def from_implied_vols(cls, spot: float, risk_free_rate: float, dividend_yield: float, strike, expiry,
+                          implied_volatility, is_call=None) -> "OptionChain":
+        """Chain priced from Black-Scholes volatilities; out-of-the-money options by default."""
+        strike, expiry, implied_volatility = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (strike, expiry, implied_volatility))
+        )
+        if is_call is None:
+            is_call = strike >= spot * np.exp((risk_free_rate - dividend_yield) * expiry)
+        price = black_scholes_price_vectorized(spot, strike, expiry, risk_free_rate, implied_volatility,
+                                               dividend_yield, is_call)
+        return cls(spot, risk_free_rate, dividend_yield, strike, expiry, is_call, price)
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    def __getitem__(self, index) -> "OptionChain":
+        """Row selection (slices, integer arrays or masks)."""
+        return OptionChain(self.spot, self.risk_free_rate, self.dividend_yield, self.strike[index],
+                           self.expiry[index], self.is_call[index], self.price[index])
+
+    @property
+    def expiries(self) -> np.ndarray:
+        """Distinct expiries, ascending."""
+        return np.unique(self.expiry)
+
+    @cached_property
+    def forward(self) -> np.ndarray:
+        return self.spot * np.exp((self.risk_free_rate - self.dividend_yield) * self.expiry)
+
+    @cached_property
+    def log_moneyness(self) -> np.ndarray:
+        """k = log(K / F) per quote."""
+        return np.log(self.strike / self.forward)
+
+    @cached_property
+    def implied_volatility(self) -> np.ndarray:
+        return implied_volatility_vectorized(self.price, self.spot, self.strike, self.expiry,
+                                             self.risk_free_rate, self.dividend_yield, self.is_call)
+
+    @cached_property
+    def vega(self) -> np.ndarray:
+        """Black-Scholes vega at the quoted implied volatility."""
+        return black_scholes_vega_vectorized(self.spot, self.strike, self.expiry, self.risk_free_rate,
+                                             self.implied_volatility, self.dividend_yield)
+
+    def vega_weights(self, floor: Optional[float] = None) -> np.ndarray:
+        """
+        1 / vega per quote, so price residuals times these weights approximate
+        implied volatility errors. Vegas are floored at `floor` (default 1% of the
+        largest) so far wings do not dominate.
+        """
+        vega = np.nan_to_num(self.vega, nan=0.0)
+        floor = 0.01 * float(np.max(vega)) if floor is None else floor
+        return 1.0 / np.maximum(vega, max(floor, 1e-12))
@@ -0,0 +1,156 @@
+"""
+SVI volatility smiles (Gatheral 2004): per-expiry fits and the surface they span.
+
+Each expiry's total implied variance w = sigma_imp^2 T is fitted in forward
+log-moneyness k = log(K / F) by
+
+    w(k) = a + b (rho (k - m) + sqrt((k - m)^2 + sigma^2)).
+
+The parametrization is closed-form with an analytic Jacobian, so a slice fit is a
+small least-squares problem on the quoted implied variances, without any option
+pricing in the loop. The no-arbitrage constraints between slices (no calendar
+spread, no butterfly) are not imposed.
+"""
+import time
+from dataclasses import astuple, dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from derivatives_pricer.calibration.calibrator import Calibration
+from derivatives_pricer.calibration.quotes import OptionChain
+from derivatives_pricer.common import instrumentation
+from derivatives_pricer.math.optimize import levenberg_marquardt
+
+@dataclass(frozen=True)
+class SVIParameters:
+    """
+    Attributes:
+        a: Overall level of total variance.
+        b: Slope of the wings.
+        rho: Skew, in (-1, 1).
+        m: Horizontal shift of the smile's minimum.
+        sigma: Curvature around the minimum.
+    """
+    a: float
+    b: float
+    rho: float
+    m: float
+    sigma: float
+
+    def total_variance(self, log_moneyness) -> np.ndarray:
+        shifted = np.asarray(log_moneyness, dtype=float) - self.m
+        return self.a + self.b * (self.rho * shifted + np.sqrt(shifted * shifted + self.sigma * self.sigma))
+
+    def implied_volatility(self, log_moneyness, expiry: float) -> np.ndarray:
+        return np.sqrt(np.maximum(self.total_variance(log_moneyness), 0.0) / expiry)
+
+    def jacobian(self, log_moneyness) -> np.ndarray:
+        """Derivatives [quotes, 5] of the total variance with respect to (a, b, rho, m, sigma)."""
+        shifted = np.asarray(log_moneyness, dtype=float) - self.m
+        root = np.sqrt(shifted * shifted + self.sigma * self.sigma)
+        return np.stack([
+            np.ones_like(shifted),
+            self.rho * shifted + root,
+            self.b * shifted,
+            -self.b * (self.rho + shifted / root),
+            self.b * self.sigma / root,
+        ], axis=1)
+
+@dataclass(frozen=True)
+class SVISurface:
+    """
+    SVI slices at increasing expiries. Between slices total variance is interpolated
+    linearly in expiry at fixed log-moneyness; outside them it is scaled in
+    proportion to expiry from the nearest slice.
+    """
+    expiries: Tuple[float, ...]
+    slices: Tuple[SVIParameters, ...]
+
+    def total_variance(self, log_moneyness, expiry: float) -> np.ndarray:
+        expiries = self.expiries
+        if expiry <= expiries[0]:
+            return self.slices[0].total_variance(log_moneyness) * expiry / expiries[0]
+        if expiry >= expiries[-1]:
+            return self.slices[-1].total_variance(log_moneyness) * expiry / expiries[-1]
+        right = int(np.searchsorted(expiries, expiry))
+        left = right - 1
+        weight = (expiry - expiries[left]) / (expiries[right] - expiries[left])
+        return ((1.0 - weight) * self.slices[left].total_variance(log_moneyness)
+                + weight * self.slices[right].total_variance(log_moneyness))
+
+    def implied_volatility(self, log_moneyness, expiry: float) -> np.ndarray:
+        return np.sqrt(np.maximum(self.total_variance(log_moneyness, expiry), 0.0) / expiry)
+
+class SVICalibrator:
+    """
+    Fits one SVI slice per expiry of a chain by Levenberg-Marquardt on total
+    implied variance. With warm starts, each expiry starts from its slice in the
+    previous calibration, else from the slice fitted just before it.
+    """
+    lower = (-1.0, 0.0, -0.999, -2.0, 1e-4)
+    upper = (4.0, 10.0, 0.999, 2.0, 5.0)
+
+    def __init__(self, warm_start: bool = True, max_iterations: int = 100):
+        if max_iterations <= 0:
+            raise ValueError(f"Parameter 'max_iterations' must be positive, got {max_iterations}")
+        self._warm_start = warm_start
+        self._max_iterations = max_iterations
+        self._last: Optional[Calibration[SVISurface]] = None
+
+    @property
+    def last(self) -> Optional[Calibration[SVISurface]]:
+        """Result of the most recent calibration."""
+        return self._last
+
+    def calibrate(self, chain: OptionChain) -> Calibration[SVISurface]:
+        """
+        Fits every expiry with at least five usable quotes (the number of SVI
+        parameters); `rmse` is the implied volatility error over all fitted quotes.
+        """
+        start = time.perf_counter()
+        previous: Dict[float, SVIParameters] = {}
+        if self._warm_start and self._last is not None:
+            previous = dict(zip(self._last.parameters.expiries, self._last.parameters.slices))
+
+        implied_volatility = chain.implied_volatility
+        usable = np.isfinite(implied_volatility)
+        expiries, slices = [], []
+        squared_error, quotes, iterations, converged = 0.0, 0, 0, True
+        with instrumentation.span("calibration.fit"):
+            for expiry in chain.expiries:
+                rows = usable & (chain.expiry == expiry)
+                if np.count_nonzero(rows) < len(self.lower):
+                    continue
+                k = chain.log_moneyness[rows]
+                variance = implied_volatility[rows] ** 2 * expiry
+                initial = previous.get(float(expiry), slices[-1] if slices else None)
+                if initial is None:
+                    initial = SVIParameters(a=0.5 * float(np.min(variance)), b=0.1, rho=-0.3, m=0.0, sigma=0.1)
+                result = levenberg_marquardt(
+                    lambda x: _slice_residuals(x, k, variance), np.array(astuple(initial), dtype=float),
+                    np.array(self.lower), np.array(self.upper), max_iterations=self._max_iterations,
+                )
+                fitted = SVIParameters(*map(float, result.x))
+                expiries.append(float(expiry))
+                slices.append(fitted)
+                squared_error += float(np.sum((fitted.implied_volatility(k, expiry) - implied_volatility[rows]) ** 2))
+                quotes += len(k)
+                iterations += result.iterations
+                converged = converged and result.converged
+        if not slices:
+            raise ValueError("No expiry has enough quotes with an implied volatility to fit a slice")
+        instrumentation.increment("calibration.iterations", iterations)
+
+        self._last = Calibration(
+            parameters=SVISurface(tuple(expiries), tuple(slices)),
+            rmse=float(np.sqrt(squared_error / quotes)),
+            iterations=iterations,
+            converged=converged,
+            elapsed=time.perf_counter() - start,
+        )
+        return self._last
+
+def _slice_residuals(x: np.ndarray, log_moneyness: np.ndarray, variance: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    parameters = SVIParameters(*x)
+    return parameters.total_variance(log_moneyness) - variance, parameters.jacobian(log_moneyness)
@@ -0,0 +1,219 @@
+"""
+Opt-in timing, counting and memory instrumentation for the pricing hot paths.
+
+Engines wrap their phases in `span("engine.phase")` and report sizes through
+`increment("engine.counter", n)`. Nothing is recorded until a sink is installed with
+`enable(...)`; while disabled, `span` returns a shared no-op context manager and
+`increment` returns immediately, so the calls can stay in production code.
+"""
+import logging
+import threading
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+class InstrumentationSink(ABC):
+    """Receives completed spans and counter increments."""
+
+    @abstractmethod
+    def record_span(self, name: str, seconds: float, peak_memory: Optional[int]) -> None:
+        """
+        Args:
+            name: Span name, e.g. "monte_carlo.simulate".
+            seconds: Wall-clock duration.
+            peak_memory: Peak bytes allocated above the level at span entry, or None
+                when memory tracking is off.
+        """
+        pass
+
+    @abstractmethod
+    def record_count(self, name: str, value: int) -> None:
+        pass
+
+@dataclass
+class SpanStats:
+    """Aggregate of all completed spans sharing a name."""
+    count: int = 0
+    total_seconds: float = 0.0
+    min_seconds: float = float("inf")
+    max_seconds: float = 0.0
+    peak_memory: Optional[int] = None
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+class InMemorySink(InstrumentationSink):
+    """Thread-safe aggregator of span statistics and counter totals."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans: Dict[str, SpanStats] = {}
+        self.counters: Dict[str, int] = {}
+
+    def record_span(self, name: str, seconds: float, peak_memory: Optional[int]) -> None:
+        with self._lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.count += 1
+            stats.total_seconds += seconds
+            stats.min_seconds = min(stats.min_seconds, seconds)
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            if peak_memory is not None:
+                stats.peak_memory = max(stats.peak_memory or 0, peak_memory)
+
+    def record_count(self, name: str, value: int) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+
+    def report(self) -> str:
+        """Human-readable table of spans (slowest total first) and counters."""
+        with self._lock:
+            lines = [f"{'span':<32}{'count':>8}{'total ms':>12}{'mean us':>12}{'peak KiB':>10}"]
+            for name, s in sorted(self.spans.items(), key=lambda kv: -kv[1].total_seconds):
+                peak = f"{s.peak_memory / 1024:.0f}" if s.peak_memory is not None else "-"
+                lines.append(
+                    f"{name:<32}{s.count:>8}{s.total_seconds * 1e3:>12.3f}"
+                    f"{s.mean_seconds * 1e6:>12.1f}{peak:>10}"
+                )
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<32}{value:>8}")
+            return "\n".join(lines)
+
+class LoggingSink(InstrumentationSink):
+    """Emits one log record per span and counter increment."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self._logger = logger or logging.getLogger("derivatives_pricer.instrumentation")
+        self._level = level
+
+    def record_span(self, name: str, seconds: float, peak_memory: Optional[int]) -> None:
+        if peak_memory is None:
+            self._logger.log(self._level, "span %s %.1f us", name, seconds * 1e6)
+        else:
+            self._logger.log(self._level, "span %s %.1f us peak=%d B", name, seconds * 1e6, peak_memory)
+
+    def record_count(self, name: str, value: int) -> None:
+        self._logger.log(self._level, "count %s +%d", name, value)
+
+class CallbackSink(InstrumentationSink):
+    """Forwards spans and counts to user callables, e.g. a metrics client."""
+
+    def __init__(self,
+                 on_span: Callable[[str, float, Optional[int]], None],
+                 on_count: Optional[Callable[[str, int], None]] = None):
+        self._on_span = on_span
+        self._on_count = on_count
+
+    def record_span(self, name: str, seconds: float, peak_memory: Optional[int]) -> None:
+        self._on_span(name, seconds, peak_memory)
+
+    def record_count(self, name: str, value: int) -> None:
+        if self._on_count is not None:
+            self._on_count(name, value)
+
+# --- Global switch ---
+
+_sink: Optional[InstrumentationSink] = None
+_track_memory = False
+_started_tracemalloc = False
+_local = threading.local()
+
+def enable(sink: InstrumentationSink, track_memory: bool = False) -> None:
+    """
+    Installs `sink` as the process-wide receiver.
+
+    With `track_memory`, tracemalloc is started and every span reports its peak
+    allocation. Spans reset tracemalloc's peak, so if another tracemalloc session
+    is already running it is left alone and spans report no memory. tracemalloc
+    slows allocation-heavy code noticeably and its peak is process-wide, so
+    concurrent spans see each other.
+    """
+    global _sink, _track_memory, _started_tracemalloc
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+    _track_memory = track_memory and _started_tracemalloc
+    _sink = sink
+
+def disable() -> None:
+    """Removes the sink and stops tracemalloc if `enable` started it."""
+    global _sink, _track_memory, _started_tracemalloc
+    _sink = None
+    _track_memory = False
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+
+def is_enabled() -> bool:
+    return _sink is not None
+
+def increment(name: str, value: int = 1) -> None:
+    sink = _sink
+    if sink is not None:
+        sink.record_count(name, value)
+
+def span(name: str):
+    """Context manager timing the enclosed block under `name`."""
+    sink = _sink
+    if sink is None:
+        return _NULL_SPAN
+    return _Span(sink, name, _track_memory)
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ("_sink", "_name", "_track_memory", "_start", "_base_memory", "_outer_peak", "child_peak")
+
+    def __init__(self, sink: InstrumentationSink, name: str, track_memory: bool):
+        self._sink = sink
+        self._name = name
+        self._track_memory = track_memory and tracemalloc.is_tracing()
+        self.child_peak = 0
+
+    def __enter__(self):
+        if self._track_memory:
+            # tracemalloc has a single peak register. Remember the peak reached so far
+            # (it belongs to the enclosing span) before resetting it for this span.
+            self._base_memory, self._outer_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            _span_stack().append(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self._start
+        peak_memory = None
+        if self._track_memory:
+            stack = _span_stack()
+            stack.pop()
+            peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+            peak_memory = max(peak - self._base_memory, 0)
+            if stack:
+                parent = stack[-1]
+                parent.child_peak = max(parent.child_peak, peak, self._outer_peak)
+        self._sink.record_span(self._name, elapsed, peak_memory)
+        return False
+
+def _span_stack() -> List[_Span]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
@@ -1,25 +1,52 @@
+import inspect
 from functools import wraps
 from typing import Callable, Any, TypeVar
 
+from derivatives_pricer.common import instrumentation
+
 F = TypeVar('F', bound=Callable[..., Any])
 
+_MISSING = object()
+
+def _argument_getter(func: Callable, param_name: str) -> Callable[[tuple, dict], Any]:
+    """
+    Resolves where `param_name` lives in a call to `func` once, at decoration time,
+    so each call costs a tuple index or dict lookup instead of a signature bind.
+    """
+    signature = inspect.signature(func)
+    if param_name not in signature.parameters:
+        raise TypeError(f"{func.__qualname__} has no parameter '{param_name}'")
+    parameter = signature.parameters[param_name]
+    default = None if parameter.default is inspect.Parameter.empty else parameter.default
+    positional = [
+        name for name, p in signature.parameters.items()
+        if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    index = positional.index(param_name) if param_name in positional else None
+
+    def get(args: tuple, kwargs: dict) -> Any:
+        value = kwargs.get(param_name, _MISSING)
+        if value is not _MISSING:
+            return value
+        if index is not None and index < len(args):
+            return args[index]
+        return default
+    return get
+
 def validate_positive(param_name: str) -> Callable[[F], F]:
     """
     Decorator to ensure a specific parameter is positive > 0.
     """
     def decorator(func: F) -> F:
+        get = _argument_getter(func, param_name)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Map args to names
-            import inspect
-            sig = inspect.signature(func)
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            
-            val = bound_args.arguments.get(param_name)
+            with instrumentation.span("validation.bind"):
+                val = get(args, kwargs)
             if val is not None and isinstance(val, (int, float)) and val <= 0:
                 raise ValueError(f"Parameter '{param_name}' must be positive, got {val}")
-            
+
             return func(*args, **kwargs)
         return wrapper # type: ignore
     return decorator
@@ -29,17 +56,15 @@ def validate_probability(param_name: str) -> Callable[[F], F]:
     Ensure parameter is between 0 and 1.
     """
     def decorator(func: F) -> F:
+        get = _argument_getter(func, param_name)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            import inspect
-            sig = inspect.signature(func)
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            
-            val = bound_args.arguments.get(param_name)
+            with instrumentation.span("validation.bind"):
+                val = get(args, kwargs)
             if val is not None and isinstance(val, (int, float)) and not (0 <= val <= 1):
                 raise ValueError(f"Parameter '{param_name}' must be a probability [0,1], got {val}")
-            
+
             return func(*args, **kwargs)
         return wrapper # type: ignore
     return decorator
@@ -0,0 +1,391 @@
+"""
+Bulk readers and writers for trade and market files.
+
+Everything maps straight into the columnar InstrumentBatch / MarketStateBatch
+containers; no per-row Python objects are created.
+
+Formats:
+    CSV            read_trades_csv / iter_trades_csv / write_trades_csv and the
+                   *_markets_csv equivalents. Parsed with pyarrow.csv when pyarrow is
+                   installed, otherwise with NumPy's C loadtxt parser.
+    .npy columns   save_columns / load_columns: one .npy file per column in a
+                   directory, loaded memory-mapped by default, so many processes can
+                   share one on-disk book.
+    .npz           save_npz / load_npz: one archive, read fully into memory (np.load
+                   cannot memory-map .npz members; use .npy columns for that).
+    Parquet        write_parquet / read_parquet / iter_parquet (requires pyarrow).
+
+Results are streamed back to disk chunk by chunk with NpyResultWriter or
+CsvResultWriter; `price_chunks` ties a chunked reader, an engine and a writer
+together so memory stays bounded by the chunk size.
+"""
+import importlib.util
+import itertools
+import os
+from dataclasses import fields
+from typing import Dict, Iterable, Iterator, List, Optional, Type, TypeVar, Union
+
+import numpy as np
+
+from derivatives_pricer.domain.enums import OptionType, ExerciseStyle, BarrierType, PayoffKind
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+from derivatives_pricer.instruments.batch import InstrumentBatch, EUROPEAN, VANILLA, NO_BARRIER
+
+B = TypeVar("B", InstrumentBatch, MarketStateBatch)
+
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Column -> (enum for categorical columns or None for numeric, default or None if required)
+_SCHEMAS = {
+    InstrumentBatch: {
+        "strike": (None, None),
+        "expiry": (None, None),
+        "option_type": (OptionType, None),
+        "exercise": (ExerciseStyle, EUROPEAN),
+        "payoff_kind": (PayoffKind, VANILLA),
+        "barrier": (None, np.nan),
+        "barrier_type": (BarrierType, NO_BARRIER),
+    },
+    MarketStateBatch: {
+        "spot_price": (None, None),
+        "risk_free_rate": (None, None),
+        "volatility": (None, None),
+        "dividend_yield": (None, 0.0),
+    },
+}
+
+def _column_names(batch_type: Type[B]) -> List[str]:
+    return [f.name for f in fields(batch_type)]
+
+def _build(batch_type: Type[B], columns: Dict[str, np.ndarray], rows: int) -> B:
+    """
+    Fills optional columns with their defaults, validates required ones and checks
+    categorical columns hold only codes of their enum, whatever the file format.
+    """
+    values = {}
+    for name, (enum, default) in _SCHEMAS[batch_type].items():
+        if name in columns:
+            if enum is not None:
+                _check_codes(columns[name], enum, name, default)
+            values[name] = columns[name]
+        elif default is None:
+            raise ValueError(f"Missing required column '{name}' for {batch_type.__name__}")
+        else:
+            values[name] = np.full(rows, default)
+    return batch_type(**values)
+
+def _check_codes(codes: np.ndarray, enum, name: str, blank: Optional[int]) -> None:
+    valid = sorted({member.value for member in enum} | ({blank} if blank is not None else set()))
+    unknown = np.setdiff1d(codes, valid)
+    if len(unknown):
+        raise ValueError(f"Unknown code {unknown[0]} in column '{name}'; expected one of {valid}")
+
+# --- CSV ---
+
+def _encode_categorical(values: np.ndarray, enum, name: str, blank: int) -> np.ndarray:
+    """
+    Maps a column of enum names (case-insensitive) or integer codes to int8 codes.
+    Only the distinct values are looked up; blanks map to `blank`. Integer codes
+    must be values of `enum` (or `blank`).
+    """
+    valid = {member.value for member in enum} | ({blank} if blank is not None else set())
+    unique, inverse = np.unique(values, return_inverse=True)
+    codes = np.empty(len(unique), dtype=np.int8)
+    for i, text in enumerate(unique):
+        text = str(text).strip()
+        if text == "":
+            if blank is None:
+                raise ValueError(f"Column '{name}' is required but has blank values")
+            codes[i] = blank
+        elif text.lstrip("-").isdigit():
+            if int(text) not in valid:
+                raise ValueError(f"Unknown code {text} in column '{name}'; expected one of {sorted(valid)}")
+            codes[i] = int(text)
+        else:
+            try:
+                codes[i] = enum[text.upper()].value
+            except KeyError:
+                raise ValueError(f"Unknown value '{text}' in column '{name}'") from None
+    return codes[inverse.reshape(-1)]
+
+def _parse_csv_lines(lines: List[str], header: List[str], batch_type: Type[B]) -> B:
+    schema = _SCHEMAS[batch_type]
+    unknown = set(header) - set(schema)
+    if unknown:
+        raise ValueError(f"Unknown columns {sorted(unknown)} for {batch_type.__name__}")
+
+    columns: Dict[str, np.ndarray] = {}
+    # Plain numeric columns go through the float parser; categorical columns and
+    # columns that may be blank (barrier) are read as fixed-width strings.
+    numeric = [i for i, name in enumerate(header) if schema[name][0] is None and name != "barrier"]
+    textual = [i for i, name in enumerate(header) if i not in numeric]
+    if lines:
+        if numeric:
+            parsed = np.loadtxt(lines, delimiter=",", usecols=numeric, dtype=np.float64, ndmin=2)
+            for j, i in enumerate(numeric):
+                columns[header[i]] = parsed[:, j]
+        if textual:
+            parsed = np.loadtxt(lines, delimiter=",", usecols=textual, dtype=str, ndmin=2)
+            for j, i in enumerate(textual):
+                name = header[i]
+                enum = schema[name][0]
+                if enum is None:
+                    text = np.char.strip(parsed[:, j])
+                    columns[name] = np.where(text == "", "nan", text).astype(np.float64)
+                else:
+                    columns[name] = _encode_categorical(parsed[:, j], enum, name, schema[name][1])
+    else:
+        for name in header:
+            columns[name] = np.empty(0, dtype=np.float64 if schema[name][0] is None else np.int8)
+    return _build(batch_type, columns, len(lines))
+
+def _read_header(fh) -> List[str]:
+    return [name.strip() for name in _read_raw_header(fh)]
+
+def _read_raw_header(fh) -> List[str]:
+    """Header names exactly as written, which is how pyarrow names the columns."""
+    return fh.readline().rstrip("\r\n").split(",")
+
+def _iter_csv(path: str, batch_type: Type[B], chunk_rows: int) -> Iterator[B]:
+    with open(path, "r") as fh:
+        header = _read_header(fh)
+        while True:
+            lines = [line for line in itertools.islice(fh, chunk_rows) if line.strip()]
+            if not lines:
+                return
+            yield _parse_csv_lines(lines, header, batch_type)
+
+def _read_csv(path: str, batch_type: Type[B]) -> B:
+    if PYARROW_AVAILABLE:
+        return _read_csv_arrow(path, batch_type)
+    with open(path, "r") as fh:
+        header = _read_header(fh)
+        lines = [line for line in fh if line.strip()]
+    return _parse_csv_lines(lines, header, batch_type)
+
+def _read_csv_arrow(path: str, batch_type: Type[B]) -> B:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    schema = _SCHEMAS[batch_type]
+    with open(path, "r") as fh:
+        raw_header = _read_raw_header(fh)
+    header = [name.strip() for name in raw_header]
+    unknown = set(header) - set(schema)
+    if unknown:
+        raise ValueError(f"Unknown columns {sorted(unknown)} for {batch_type.__name__}")
+    # Categorical columns stay strings so names and codes are both accepted.
+    column_types = {raw: (pa.float64() if schema[name][0] is None else pa.string())
+                    for raw, name in zip(raw_header, header)}
+    table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(column_types=column_types))
+
+    columns = {}
+    for raw, name in zip(raw_header, header):
+        enum = schema[name][0]
+        column = table.column(raw).combine_chunks()
+        if enum is None:
+            columns[name] = column.fill_null(np.nan).to_numpy()
+        else:
+            # Dictionary-encode so only distinct values are looked up in Python.
+            encoded = column.fill_null("").dictionary_encode()
+            codes = _encode_categorical(
+                encoded.dictionary.to_numpy(zero_copy_only=False).astype(str), enum, name, schema[name][1]
+            )
+            columns[name] = codes[encoded.indices.to_numpy()]
+    return _build(batch_type, columns, table.num_rows)
+
+def _format_columns(batch: B) -> List[np.ndarray]:
+    schema = _SCHEMAS[type(batch)]
+    out = []
+    for name in _column_names(type(batch)):
+        column = getattr(batch, name)
+        enum = schema[name][0]
+        if enum is None:
+            text = np.char.mod("%.17g", column)
+            out.append(np.where(np.isnan(column), "", text))
+        else:
+            names = {0: ""}
+            names.update({member.value: member.name for member in enum})
+            lookup = np.array([names.get(code, str(code)) for code in range(max(names) + 1)])
+            out.append(lookup[column])
+    return out
+
+def _write_csv(batch: B, path: str, chunk_rows: int = 1_000_000) -> None:
+    with open(path, "w") as fh:
+        fh.write(",".join(_column_names(type(batch))) + "\n")
+        for start in range(0, len(batch), chunk_rows):
+            chunk = batch[start:start + chunk_rows]
+            np.savetxt(fh, np.column_stack(_format_columns(chunk)), fmt="%s", delimiter=",")
+
+def read_trades_csv(path: str) -> InstrumentBatch:
+    """
+    Reads a trade file with a header row. Required columns: strike, expiry,
+    option_type. Optional: exercise, payoff_kind, barrier, barrier_type.
+    Categorical columns accept enum names (CALL, AMERICAN, BARRIER, UP_AND_OUT, ...)
+    or their integer codes.
+    """
+    return _read_csv(path, InstrumentBatch)
+
+def iter_trades_csv(path: str, chunk_rows: int = 1_000_000) -> Iterator[InstrumentBatch]:
+    """Reads a trade file `chunk_rows` rows at a time."""
+    return _iter_csv(path, InstrumentBatch, chunk_rows)
+
+def write_trades_csv(batch: InstrumentBatch, path: str) -> None:
+    _write_csv(batch, path)
+
+def read_markets_csv(path: str) -> MarketStateBatch:
+    """Reads a market file with columns spot_price, risk_free_rate, volatility[, dividend_yield]."""
+    return _read_csv(path, MarketStateBatch)
+
+def iter_markets_csv(path: str, chunk_rows: int = 1_000_000) -> Iterator[MarketStateBatch]:
+    return _iter_csv(path, MarketStateBatch, chunk_rows)
+
+def write_markets_csv(batch: MarketStateBatch, path: str) -> None:
+    _write_csv(batch, path)
+
+# --- NumPy ---
+
+def save_columns(batch: B, directory: str) -> None:
+    """Writes one `<column>.npy` file per column into `directory`."""
+    os.makedirs(directory, exist_ok=True)
+    for name in _column_names(type(batch)):
+        np.save(os.path.join(directory, f"{name}.npy"), getattr(batch, name))
+
+def load_columns(directory: str, batch_type: Type[B], mmap: bool = True) -> B:
+    """
+    Loads a directory written by `save_columns`. With `mmap` the columns are read-only
+    memory maps: pages are read on demand and shared between processes.
+    """
+    columns = {}
+    rows = None
+    for name in _column_names(batch_type):
+        path = os.path.join(directory, f"{name}.npy")
+        if os.path.exists(path):
+            columns[name] = np.load(path, mmap_mode="r" if mmap else None)
+            rows = len(columns[name])
+    if rows is None:
+        raise FileNotFoundError(f"No {batch_type.__name__} columns found in {directory}")
+    return _build(batch_type, columns, rows)
+
+def save_npz(batch: B, path: str, compressed: bool = False) -> None:
+    columns = {name: getattr(batch, name) for name in _column_names(type(batch))}
+    (np.savez_compressed if compressed else np.savez)(path, **columns)
+
+def load_npz(path: str, batch_type: Type[B]) -> B:
+    """Loads an archive written by `save_npz` into memory."""
+    with np.load(path) as archive:
+        columns = {name: archive[name] for name in archive.files}
+    rows = len(next(iter(columns.values()))) if columns else 0
+    return _build(batch_type, columns, rows)
+
+# --- Parquet ---
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError("Parquet support requires pyarrow (pip install pyarrow)")
+    import pyarrow
+    import pyarrow.parquet
+    return pyarrow, pyarrow.parquet
+
+def write_parquet(batch: B, path: str) -> None:
+    """Writes the columns as-is; categorical columns are stored as int8 codes."""
+    pa, pq = _require_pyarrow()
+    table = pa.table({name: getattr(batch, name) for name in _column_names(type(batch))})
+    pq.write_table(table, path)
+
+def _batch_from_arrow(record_batch, batch_type: Type[B]) -> B:
+    columns = {
+        name: record_batch.column(name).to_numpy()
+        for name in record_batch.schema.names
+        if name in _SCHEMAS[batch_type]
+    }
+    return _build(batch_type, columns, record_batch.num_rows)
+
+def read_parquet(path: str, batch_type: Type[B]) -> B:
+    _, pq = _require_pyarrow()
+    table = pq.read_table(path).combine_chunks()
+    return _batch_from_arrow(table, batch_type)
+
+def iter_parquet(path: str, batch_type: Type[B], chunk_rows: int = 1_000_000) -> Iterator[B]:
+    _, pq = _require_pyarrow()
+    for record_batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+        yield _batch_from_arrow(record_batch, batch_type)
+
+# --- Results ---
+
+class NpyResultWriter:
+    """
+    Streams float results into a preallocated memory-mapped .npy file of `rows` rows.
+    """
+
+    def __init__(self, path: str, rows: int, dtype: np.dtype = np.float64):
+        self._out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(rows,))
+        self._position = 0
+
+    def write(self, values: np.ndarray) -> None:
+        end = self._position + len(values)
+        if end > len(self._out):
+            raise ValueError(f"Writing past the preallocated {len(self._out)} rows")
+        self._out[self._position:end] = values
+        self._position = end
+
+    @property
+    def rows_written(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        self._out.flush()
+
+    def __enter__(self) -> "NpyResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class CsvResultWriter:
+    """Appends float results to a one-column CSV file, chunk by chunk."""
+
+    def __init__(self, path: str, header: str = "price", fmt: str = "%.10g"):
+        self._fh = open(path, "w")
+        self._fh.write(header + "\n")
+        self._fmt = fmt
+        self._position = 0
+
+    def write(self, values: np.ndarray) -> None:
+        np.savetxt(self._fh, np.asarray(values).reshape(-1, 1), fmt=self._fmt)
+        self._position += len(values)
+
+    @property
+    def rows_written(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> "CsvResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def price_chunks(engine,
+                 chunks: Iterable[InstrumentBatch],
+                 market: Union[MarketState, Iterable[MarketStateBatch]],
+                 writer: Union[NpyResultWriter, CsvResultWriter]) -> int:
+    """
+    Prices a stream of trade chunks with `engine.price_batch` and writes each chunk's
+    results before reading the next. `market` is one MarketState for the whole book
+    or an iterable of MarketStateBatch chunks aligned with `chunks`.
+
+    Returns:
+        Number of rows priced.
+    """
+    markets = itertools.repeat(market) if isinstance(market, MarketState) else iter(market)
+    rows = 0
+    for trades in chunks:
+        chunk_market = next(markets, None)
+        if chunk_market is None:
+            raise ValueError(f"Market chunks ran out after {rows} trade rows")
+        writer.write(engine.price_batch(trades, chunk_market))
+        rows += len(trades)
+    return rows
@@ -1,3 +1,3 @@
-from .enums import OptionType, ExerciseStyle, BarrierType
-from .market import MarketState
+from .enums import OptionType, ExerciseStyle, BarrierType, PayoffKind
+from .market import MarketState, MarketStateBatch, MultiAssetMarketState
 from .interfaces import ValuationInstrument
@@ -0,0 +1,277 @@
+"""
+Closed-form approximations for American calls and puts.
+
+Every function broadcasts its arguments like `black_scholes_price_vectorized`:
+(spot, strike, time_to_expiry, risk_free_rate, volatility, dividend_yield, is_call).
+Contracts where early exercise never pays (calls with dividend_yield <= 0, puts with
+risk_free_rate <= 0) get the European price; expired contracts get intrinsic value.
+
+    barone_adesi_whaley       Barone-Adesi & Whaley (1987) quadratic approximation.
+    ju_zhong                  Ju & Zhong (1999): BAW boundary plus a second-order
+                              correction to the early-exercise premium.
+    bjerksund_stensland_2002  Two-step flat exercise boundary (Bjerksund & Stensland
+                              2002); puts via the put-call transformation.
+
+The BAW and Ju-Zhong critical prices are solved by Newton's method on all
+contracts at once (`critical_price`).
+"""
+import math
+from typing import Tuple
+
+import numpy as np
+
+from derivatives_pricer.domain.analytic_formulas import black_scholes_price_vectorized
+from derivatives_pricer.math.analytics import norm_cdf_array, norm_pdf_array, bivariate_norm_cdf_array
+
+def _broadcast(spot, strike, time_to_expiry, risk_free_rate, volatility, dividend_yield, is_call):
+    arrays = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (spot, strike, time_to_expiry, risk_free_rate,
+                                              volatility, dividend_yield)),
+        np.asarray(is_call, dtype=bool)
+    )
+    return [np.array(x, dtype=x.dtype).ravel() for x in arrays], arrays[0].shape
+
+def _early_exercise_mask(T, r, q, is_call) -> np.ndarray:
+    return (T > 0) & np.where(is_call, q > 0, r > 0)
+
+def _baseline(S, K, T, r, sigma, q, is_call) -> np.ndarray:
+    """European price (intrinsic when expired); the answer wherever exercise is never early."""
+    return black_scholes_price_vectorized(S, K, T, r, sigma, q, is_call)
+
+def _quadratic_setup(T, r, sigma, q, phi):
+    """
+    BAW/Ju-Zhong exponent lambda(h) with h = 1 - exp(-rT), plus the pieces Ju-Zhong
+    reuses. alpha / h is returned on its own: it tends to 2 / (sigma^2 T) as r -> 0,
+    where alpha and h are both zero (calls with r = 0 < q still exercise early).
+    """
+    variance = sigma * sigma
+    alpha = 2.0 * r / variance
+    beta = 2.0 * (r - q) / variance
+    h = -np.expm1(-r * T)
+    rate_over_h = np.divide(r, h, out=1.0 / T, where=h != 0)
+    alpha_over_h = 2.0 * rate_over_h / variance
+    root = np.sqrt((beta - 1.0) ** 2 + 4.0 * alpha_over_h)
+    lam = 0.5 * (-(beta - 1.0) + phi * root)
+    return alpha, alpha_over_h, beta, h, root, lam
+
+def critical_price(strike, time_to_expiry, risk_free_rate, volatility, dividend_yield, is_call,
+                   tolerance: float = 1e-10, max_iterations: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    BAW early-exercise boundary S*, solved for every contract at once.
+
+    Newton's method on g(S) = phi(S - K) - V_E(S) - phi(1 - e^{-qT} N(phi d1)) S / lambda,
+    started from the BAW seed and safeguarded by bisection on a bracket around S*.
+    Converged contracts drop out of the iteration.
+    Inputs must be contracts with early exercise (see module docstring).
+
+    Returns:
+        (S*, lambda) arrays of the broadcast shape.
+    """
+    arrays = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (strike, time_to_expiry, risk_free_rate, volatility, dividend_yield)),
+        np.asarray(is_call, dtype=bool)
+    )
+    shape = arrays[0].shape
+    K, T, r, sigma, q, is_call = (np.array(x).ravel() for x in arrays)
+    phi = np.where(is_call, 1.0, -1.0)
+    _, _, beta, _, _, lam = _quadratic_setup(T, r, sigma, q, phi)
+
+    # Seed: interpolate between K and the perpetual boundary (BAW 1987, eqs. 26-27).
+    variance = sigma * sigma
+    perpetual_root = np.sqrt((beta - 1.0) ** 2 + 8.0 * r / variance)
+    lam_inf = 0.5 * (-(beta - 1.0) + phi * perpetual_root)
+    s_inf = K / (1.0 - 1.0 / lam_inf)
+    vol_t = sigma * np.sqrt(T)
+    bT = (r - q) * T
+    with np.errstate(over="ignore", invalid="ignore"):
+        seed_h = np.where(is_call, -(bT + 2.0 * vol_t) * K / (s_inf - K), (bT - 2.0 * vol_t) * K / (K - s_inf))
+        seed = np.where(is_call, K + (s_inf - K) * (1.0 - np.exp(seed_h)), s_inf + (K - s_inf) * np.exp(seed_h))
+
+    # S* > K for calls and 0 < S* < K for puts. Low volatility with a large carry can
+    # throw the seed outside; the perpetual boundary always lies inside.
+    lower = np.where(is_call, K, 0.0)
+    upper = np.where(is_call, np.inf, K)
+    S = np.where(np.isfinite(seed) & (seed > lower) & (seed < upper), seed, s_inf)
+
+    carry = np.exp(-q * T)
+    active = np.ones(len(S), dtype=bool)
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for _ in range(max_iterations):
+            idx = np.flatnonzero(active)
+            if len(idx) == 0:
+                break
+            s, k, t, rr, sg, qq, ph, lm, cy, vt, lo, hi = (
+                x[idx] for x in (S, K, T, r, sigma, q, phi, lam, carry, vol_t, lower, upper))
+            d1 = (np.log(s / k) + (rr - qq + 0.5 * sg * sg) * t) / vt
+            n_phi_d1 = norm_cdf_array(ph * d1)
+            european = _baseline(s, k, t, rr, sg, qq, ph > 0)
+            g = ph * (s - k) - european - ph * (1.0 - cy * n_phi_d1) * s / lm
+            dg = ph * (1.0 - cy * n_phi_d1) * (1.0 - 1.0 / lm) + cy * norm_pdf_array(d1) / (vt * lm)
+            # phi * g < 0 means S* lies above s; shrink the bracket around S*.
+            above = ph * g < 0
+            lo = np.where(above, s, lo)
+            hi = np.where(above, hi, s)
+            lower[idx], upper[idx] = lo, hi
+            # Newton step, or bisection when it leaves the bracket (doubling while
+            # a call's bracket is still unbounded).
+            s_new = s - g / dg
+            bisection = np.where(np.isinf(hi), 2.0 * s, 0.5 * (lo + hi))
+            s_new = np.where(np.isfinite(s_new) & (s_new > lo) & (s_new < hi), s_new, bisection)
+            S[idx] = s_new
+            active[idx] = np.abs(s_new - s) > tolerance * k
+    return S.reshape(shape), lam.reshape(shape)
+
+def barone_adesi_whaley(spot, strike, time_to_expiry, risk_free_rate, volatility,
+                        dividend_yield, is_call) -> np.ndarray:
+    (S, K, T, r, sigma, q, is_call), shape = _broadcast(spot, strike, time_to_expiry, risk_free_rate,
+                                                        volatility, dividend_yield, is_call)
+    out = _baseline(S, K, T, r, sigma, q, is_call)
+    m = _early_exercise_mask(T, r, q, is_call)
+    if np.any(m):
+        S, K, T, r, sigma, q, is_call = (x[m] for x in (S, K, T, r, sigma, q, is_call))
+        phi = np.where(is_call, 1.0, -1.0)
+        s_star, lam = critical_price(K, T, r, sigma, q, is_call)
+        d1 = (np.log(s_star / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * np.sqrt(T))
+        premium = phi * (s_star / lam) * (1.0 - np.exp(-q * T) * norm_cdf_array(phi * d1))
+        european = out[m]
+        # (S / S*) ** lambda <= 1 on the continuation side; elsewhere it would overflow.
+        hold = phi * (s_star - S) > 0
+        continuation = european + premium * np.where(hold, S / s_star, 1.0) ** lam
+        out[m] = np.maximum(np.where(hold, continuation, phi * (S - K)), european)
+    return out.reshape(shape)
+
+def ju_zhong(spot, strike, time_to_expiry, risk_free_rate, volatility,
+             dividend_yield, is_call) -> np.ndarray:
+    (S, K, T, r, sigma, q, is_call), shape = _broadcast(spot, strike, time_to_expiry, risk_free_rate,
+                                                        volatility, dividend_yield, is_call)
+    out = _baseline(S, K, T, r, sigma, q, is_call)
+    m = _early_exercise_mask(T, r, q, is_call)
+    if np.any(m):
+        S, K, T, r, sigma, q, is_call = (x[m] for x in (S, K, T, r, sigma, q, is_call))
+        phi = np.where(is_call, 1.0, -1.0)
+        alpha, alpha_over_h, beta, h, root, lam = _quadratic_setup(T, r, sigma, q, phi)
+        s_star, _ = critical_price(K, T, r, sigma, q, is_call)
+
+        vol_t = sigma * np.sqrt(T)
+        h_a = phi * (s_star - K) - _baseline(s_star, K, T, r, sigma, q, is_call)
+        # alpha * d lambda / dh; lambda' alone diverges as r -> 0 but this product does not.
+        alpha_lam_prime = -phi * alpha_over_h * alpha_over_h / root
+
+        # alpha * dV_E/dh at S*, with h = 1 - exp(-rT): alpha * (dV_E/dT) / (r exp(-rT)).
+        forward_star = s_star * np.exp((r - q) * T)
+        d1 = (np.log(forward_star / K) + 0.5 * vol_t * vol_t) / vol_t
+        d2 = d1 - vol_t
+        alpha_dv_dh = (forward_star * norm_pdf_array(d1) / vol_t
+                       - phi * forward_star * norm_cdf_array(phi * d1) * 2.0 * q / (sigma * sigma)
+                       + alpha * phi * K * norm_cdf_array(phi * d2))
+
+        denom = 2.0 * lam + beta - 1.0
+        b = (1.0 - h) * alpha_lam_prime / (2.0 * denom)
+        c = -((1.0 - h) / denom) * (alpha_dv_dh / h_a + alpha_over_h + alpha_lam_prime / denom)
+        hold = phi * (s_star - S) > 0
+        ratio = np.where(hold, S / s_star, 1.0)
+        log_ratio = np.log(ratio)
+        chi = b * log_ratio * log_ratio + c * log_ratio
+
+        european = out[m]
+        continuation = european + h_a * ratio ** lam / (1.0 - chi)
+        out[m] = np.maximum(np.where(hold, continuation, phi * (S - K)), european)
+    return out.reshape(shape)
+
+# --- Bjerksund-Stensland 2002 ---
+
+def _bs_phi(S, T, gamma, H, I, r, b, sigma):
+    vol_t = sigma * np.sqrt(T)
+    lam = (-r + gamma * b + 0.5 * gamma * (gamma - 1.0) * sigma * sigma) * T
+    d = -(np.log(S / H) + (b + (gamma - 0.5) * sigma * sigma) * T) / vol_t
+    kappa = 2.0 * b / (sigma * sigma) + 2.0 * gamma - 1.0
+    return np.exp(lam) * S ** gamma * (
+        norm_cdf_array(d) - (I / S) ** kappa * norm_cdf_array(d - 2.0 * np.log(I / S) / vol_t)
+    )
+
+def _bs_psi(S, T, gamma, H, I2, I1, t1, r, b, sigma, rho):
+    drift_1 = (b + (gamma - 0.5) * sigma * sigma) * t1
+    drift_2 = (b + (gamma - 0.5) * sigma * sigma) * T
+    vol_1 = sigma * np.sqrt(t1)
+    vol_2 = sigma * np.sqrt(T)
+    e1 = (np.log(S / I1) + drift_1) / vol_1
+    e2 = (np.log(I2 * I2 / (S * I1)) + drift_1) / vol_1
+    e3 = (np.log(S / I1) - drift_1) / vol_1
+    e4 = (np.log(I2 * I2 / (S * I1)) - drift_1) / vol_1
+    f1 = (np.log(S / H) + drift_2) / vol_2
+    f2 = (np.log(I2 * I2 / (S * H)) + drift_2) / vol_2
+    f3 = (np.log(I1 * I1 / (S * H)) + drift_2) / vol_2
+    f4 = (np.log(S * I1 * I1 / (H * I2 * I2)) + drift_2) / vol_2
+    lam = -r + gamma * b + 0.5 * gamma * (gamma - 1.0) * sigma * sigma
+    kappa = 2.0 * b / (sigma * sigma) + 2.0 * gamma - 1.0
+    return np.exp(lam * T) * S ** gamma * (
+        bivariate_norm_cdf_array(-e1, -f1, rho)
+        - (I2 / S) ** kappa * bivariate_norm_cdf_array(-e2, -f2, rho)
+        - (I1 / S) ** kappa * bivariate_norm_cdf_array(-e3, -f3, -rho)
+        + (I1 / I2) ** kappa * bivariate_norm_cdf_array(-e4, -f4, -rho)
+    )
+
+# t1 / T is fixed by the method, so the bivariate correlation is a constant.
+_BS2002_SPLIT = 0.5 * (math.sqrt(5.0) - 1.0)
+_BS2002_RHO = math.sqrt(_BS2002_SPLIT)
+
+def _bs2002_trigger(t, K, b, sigma, b_0, b_inf):
+    """
+    Flat exercise trigger for horizon t, between B0 and B_inf. With a strongly negative
+    carry b t + 2 sigma sqrt(t) turns negative and would put the trigger below the
+    strike; flooring it at sigma sqrt(t) keeps the boundary usable for low volatility.
+    """
+    vol_t = sigma * np.sqrt(t)
+    scale = K * K / ((b_inf - b_0) * b_0)
+    return b_0 + (b_inf - b_0) * (1.0 - np.exp(-np.maximum(b * t + 2.0 * vol_t, vol_t) * scale))
+
+def _bjerksund_stensland_call(S, K, T, r, b, sigma):
+    """BS2002 call for carry b < r."""
+    t1 = _BS2002_SPLIT * T
+    variance = sigma * sigma
+    beta = (0.5 - b / variance) + np.sqrt((b / variance - 0.5) ** 2 + 2.0 * r / variance)
+    b_inf = beta / (beta - 1.0) * K
+    b_0 = np.maximum(K, r / (r - b) * K)
+    i1 = _bs2002_trigger(t1, K, b, sigma, b_0, b_inf)
+    i2 = _bs2002_trigger(T, K, b, sigma, b_0, b_inf)
+    # The value is homogeneous of degree one in (S, K, I1, I2). Working in units of I2
+    # keeps S ** beta and I ** -beta finite when beta is large (low volatility).
+    x, k, j = S / i2, K / i2, i1 / i2
+    alpha_2 = 1.0 - k
+
+    rho = _BS2002_RHO
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        alpha_1 = (j - k) * j ** (-beta)
+        value = i2 * (
+            alpha_2 * x ** beta
+            - alpha_2 * _bs_phi(x, t1, beta, 1.0, 1.0, r, b, sigma)
+            + _bs_phi(x, t1, 1.0, 1.0, 1.0, r, b, sigma)
+            - _bs_phi(x, t1, 1.0, j, 1.0, r, b, sigma)
+            - k * _bs_phi(x, t1, 0.0, 1.0, 1.0, r, b, sigma)
+            + k * _bs_phi(x, t1, 0.0, j, 1.0, r, b, sigma)
+            + alpha_1 * _bs_phi(x, t1, beta, j, 1.0, r, b, sigma)
+            - alpha_1 * _bs_psi(x, T, beta, j, 1.0, j, t1, r, b, sigma, rho)
+            + _bs_psi(x, T, 1.0, j, 1.0, j, t1, r, b, sigma, rho)
+            - _bs_psi(x, T, 1.0, k, 1.0, j, t1, r, b, sigma, rho)
+            - k * _bs_psi(x, T, 0.0, j, 1.0, j, t1, r, b, sigma, rho)
+            + k * _bs_psi(x, T, 0.0, k, 1.0, j, t1, r, b, sigma, rho)
+        )
+    return np.where(S >= i2, S - K, value)
+
+def bjerksund_stensland_2002(spot, strike, time_to_expiry, risk_free_rate, volatility,
+                             dividend_yield, is_call) -> np.ndarray:
+    (S, K, T, r, sigma, q, is_call), shape = _broadcast(spot, strike, time_to_expiry, risk_free_rate,
+                                                        volatility, dividend_yield, is_call)
+    out = _baseline(S, K, T, r, sigma, q, is_call)
+    m = _early_exercise_mask(T, r, q, is_call)
+    if np.any(m):
+        S, K, T, r, sigma, q, is_call = (x[m] for x in (S, K, T, r, sigma, q, is_call))
+        # Put(S, K, r, q) = Call(K, S, r=q, q=r): swap spot/strike and the two rates.
+        spot_ = np.where(is_call, S, K)
+        strike_ = np.where(is_call, K, S)
+        rate_ = np.where(is_call, r, q)
+        carry_ = np.where(is_call, r - q, q - r)
+        call = _bjerksund_stensland_call(spot_, strike_, T, rate_, carry_, sigma)
+        # Far below the trigger the series can overflow; the premium there is nil.
+        out[m] = np.where(np.isfinite(call), np.maximum(call, out[m]), out[m])
+    return out.reshape(shape)
@@ -1,5 +1,8 @@
+import math
+
 import numpy as np
-from scipy.stats import norm
+
+from derivatives_pricer.math.analytics import norm_cdf, norm_cdf_array
 
 def black_scholes_price(
     spot: float,
@@ -15,12 +18,107 @@ def black_scholes_price(
         intrinsic = spot - strike if is_call else strike - spot
         return max(intrinsic, 0.0)
 
-    d1 = (np.log(spot / strike) + (risk_free_rate - dividend_yield + 0.5 * volatility**2) * time_to_expiry) / (volatility * np.sqrt(time_to_expiry))
-    d2 = d1 - volatility * np.sqrt(time_to_expiry)
+    # Plain `math` on Python floats: no array allocation or ufunc dispatch.
+    vol_sqrt_t = volatility * math.sqrt(time_to_expiry)
+    forward_leg = spot * math.exp(-dividend_yield * time_to_expiry)
+    strike_leg = strike * math.exp(-risk_free_rate * time_to_expiry)
+    if vol_sqrt_t <= 0:
+        # No volatility: the payoff on the forward is certain, discounted intrinsic value.
+        intrinsic = forward_leg - strike_leg if is_call else strike_leg - forward_leg
+        return max(intrinsic, 0.0)
+
+    d1 = (math.log(spot / strike) + (risk_free_rate - dividend_yield + 0.5 * volatility * volatility) * time_to_expiry) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
 
     if is_call:
-        price = spot * np.exp(-dividend_yield * time_to_expiry) * norm.cdf(d1) - strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2)
+        price = forward_leg * norm_cdf(d1) - strike_leg * norm_cdf(d2)
     else:
-        price = strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2) - spot * np.exp(-dividend_yield * time_to_expiry) * norm.cdf(-d1)
-        
+        price = strike_leg * norm_cdf(-d2) - forward_leg * norm_cdf(-d1)
+
     return float(price)
+
+def black_scholes_price_vectorized(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    time_to_expiry: np.ndarray,
+    risk_free_rate: np.ndarray,
+    volatility: np.ndarray,
+    dividend_yield: np.ndarray,
+    is_call: np.ndarray
+) -> np.ndarray:
+    """
+    Broadcasting version of `black_scholes_price`.
+    All arguments are array-likes broadcast against each other; expired contracts
+    (time_to_expiry <= 0) are worth their intrinsic value.
+    """
+    spot, strike, T, r, sigma, q, is_call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (spot, strike, time_to_expiry, risk_free_rate,
+                                              volatility, dividend_yield)),
+        np.asarray(is_call, dtype=bool)
+    )
+    live = T > 0
+    safe_T = np.where(live, T, 1.0)
+
+    vol_sqrt_t = sigma * np.sqrt(safe_T)
+    d1 = (np.log(spot / strike) + (r - q + 0.5 * sigma**2) * safe_T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    forward_leg = spot * np.exp(-q * safe_T)
+    strike_leg = strike * np.exp(-r * safe_T)
+
+    call = forward_leg * norm_cdf_array(d1) - strike_leg * norm_cdf_array(d2)
+    put = strike_leg * norm_cdf_array(-d2) - forward_leg * norm_cdf_array(-d1)
+    price = np.where(is_call, call, put)
+
+    intrinsic = np.maximum(np.where(is_call, spot - strike, strike - spot), 0.0)
+    return np.where(live, price, intrinsic)
+
+def black_scholes_vega_vectorized(spot, strike, time_to_expiry, risk_free_rate, volatility,
+                                  dividend_yield) -> np.ndarray:
+    """d price / d volatility (the same for calls and puts); broadcasts like the price."""
+    from derivatives_pricer.math.analytics import norm_pdf_array
+    spot, strike, T, r, sigma, q = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (spot, strike, time_to_expiry, risk_free_rate,
+                                              volatility, dividend_yield))
+    )
+    sqrt_t = np.sqrt(np.maximum(T, 0.0))
+    vol_sqrt_t = np.maximum(sigma * sqrt_t, 1e-300)
+    d1 = (np.log(spot / strike) + (r - q + 0.5 * sigma**2) * T) / vol_sqrt_t
+    return spot * np.exp(-q * T) * norm_pdf_array(d1) * sqrt_t
+
+def implied_volatility_vectorized(price, spot, strike, time_to_expiry, risk_free_rate, dividend_yield,
+                                  is_call, tolerance: float = 1e-10, max_iterations: int = 100) -> np.ndarray:
+    """
+    Black-Scholes volatility reproducing each `price`, elementwise.
+
+    Newton steps on the volatility, safeguarded by a bisection bracket [1e-4, 5]: a
+    step that would leave the bracket, or that has a vanishing vega, bisects instead.
+    Prices outside the no-arbitrage bounds, contracts already expired, and rows not
+    converged within `max_iterations` (e.g. volatilities outside the bracket) give NaN.
+    """
+    price, spot, strike, T, r, q, is_call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (price, spot, strike, time_to_expiry, risk_free_rate,
+                                              dividend_yield)),
+        np.asarray(is_call, dtype=bool)
+    )
+    forward_leg = spot * np.exp(-q * T)
+    strike_leg = strike * np.exp(-r * T)
+    lower_bound = np.maximum(np.where(is_call, forward_leg - strike_leg, strike_leg - forward_leg), 0.0)
+    upper_bound = np.where(is_call, forward_leg, strike_leg)
+    valid = (T > 0) & (price > lower_bound) & (price < upper_bound)
+
+    low = np.full(price.shape, 1e-4)
+    high = np.full(price.shape, 5.0)
+    sigma = np.full(price.shape, 0.2)
+    converged = np.zeros(price.shape, dtype=bool)
+    for _ in range(max_iterations):
+        diff = black_scholes_price_vectorized(spot, strike, T, r, sigma, q, is_call) - price
+        converged = np.abs(diff) <= tolerance * np.maximum(price, 1.0)
+        if np.all(~valid | converged):
+            break
+        high = np.where(diff > 0, sigma, high)
+        low = np.where(diff <= 0, sigma, low)
+        vega = black_scholes_vega_vectorized(spot, strike, T, r, sigma, q)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = sigma - diff / vega
+        sigma = np.where((newton > low) & (newton < high), newton, 0.5 * (low + high))
+    return np.where(valid & converged, sigma, np.nan)
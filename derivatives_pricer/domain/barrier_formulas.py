@@ -0,0 +1,56 @@
+"""
+Closed-form prices of continuously monitored single-barrier options without rebate
+(Merton 1973; Reiner & Rubinstein 1991, as tabulated in Haug's "Complete Guide").
+
+`barrier_price` broadcasts its arguments like `black_scholes_price_vectorized`. The
+barrier is assumed untouched at valuation: contracts already through it should be
+priced as the vanilla (knock-in) or as zero (knock-out) by the caller. Knock-outs
+follow from in-out parity, knock-out = vanilla - knock-in.
+"""
+import numpy as np
+
+from derivatives_pricer.domain.analytic_formulas import black_scholes_price_vectorized
+from derivatives_pricer.math.analytics import norm_cdf_array
+
+def barrier_price(spot, strike, barrier, time_to_expiry, risk_free_rate, volatility, dividend_yield,
+                  is_call, is_up, is_knock_in) -> np.ndarray:
+    """European barrier option price; `is_up` / `is_knock_in` select the barrier type."""
+    S, K, H, T, r, sigma, q, is_call, is_up, is_knock_in = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (spot, strike, barrier, time_to_expiry, risk_free_rate,
+                                              volatility, dividend_yield)),
+        np.asarray(is_call, dtype=bool), np.asarray(is_up, dtype=bool), np.asarray(is_knock_in, dtype=bool)
+    )
+    phi = np.where(is_call, 1.0, -1.0)
+    eta = np.where(is_up, -1.0, 1.0)
+    b = r - q
+    vol_t = sigma * np.sqrt(T)
+    mu = (b - 0.5 * sigma**2) / sigma**2
+    carry = S * np.exp((b - r) * T)
+    discount = K * np.exp(-r * T)
+    ratio = H / S
+
+    x1 = np.log(S / K) / vol_t + (1.0 + mu) * vol_t
+    x2 = np.log(S / H) / vol_t + (1.0 + mu) * vol_t
+    y1 = np.log(H * H / (S * K)) / vol_t + (1.0 + mu) * vol_t
+    y2 = np.log(H / S) / vol_t + (1.0 + mu) * vol_t
+
+    A = phi * carry * norm_cdf_array(phi * x1) - phi * discount * norm_cdf_array(phi * (x1 - vol_t))
+    B = phi * carry * norm_cdf_array(phi * x2) - phi * discount * norm_cdf_array(phi * (x2 - vol_t))
+    reflected_s = phi * carry * ratio ** (2.0 * (mu + 1.0))
+    reflected_k = phi * discount * ratio ** (2.0 * mu)
+    C = reflected_s * norm_cdf_array(eta * y1) - reflected_k * norm_cdf_array(eta * (y1 - vol_t))
+    D = reflected_s * norm_cdf_array(eta * y2) - reflected_k * norm_cdf_array(eta * (y2 - vol_t))
+
+    high_strike = K > H
+    # Knock-in values by (call/put, down/up, strike above/below the barrier).
+    knock_in = np.select(
+        [is_call & ~is_up, is_call & is_up, ~is_call & ~is_up, ~is_call & is_up],
+        [
+            np.where(high_strike, C, A - B + D),
+            np.where(high_strike, A, B - C + D),
+            np.where(high_strike, B - C + D, A),
+            np.where(high_strike, A - B + D, C),
+        ],
+    )
+    vanilla = black_scholes_price_vectorized(S, K, T, r, sigma, q, is_call)
+    return np.where(is_knock_in, knock_in, vanilla - knock_in)
@@ -14,3 +14,8 @@ class BarrierType(Enum):
     UP_AND_IN = auto()
     DOWN_AND_OUT = auto()
     DOWN_AND_IN = auto()
+
+class PayoffKind(Enum):
+    VANILLA = auto()
+    BARRIER = auto()
+    ASIAN = auto()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 import numpy as np
 from derivatives_pricer.domain.enums import ExerciseStyle  # Assuming enums still exist or we deprecate usage
 
@@ -9,26 +10,53 @@ class ExerciseStrategy(ABC):
     @abstractmethod
     def apply(self, intrinsic_value: np.ndarray, continuation_value: np.ndarray) -> np.ndarray:
         pass
+
+    @property
+    def allows_early_exercise(self) -> bool:
+        """False when `apply` ignores the intrinsic value, so callers may skip computing it."""
+        return True
+
+    def apply_inplace(self, intrinsic_value: np.ndarray, continuation_value: np.ndarray) -> np.ndarray:
+        """
+        In-place variant of `apply`: overwrites and returns `continuation_value`.
+        Strategies without an allocation-free implementation copy the result of `apply`.
+        """
+        result = self.apply(intrinsic_value, continuation_value)
+        if result is not continuation_value:
+            continuation_value[...] = result
+        return continuation_value
         
     @property
     @abstractmethod
     def style(self) -> str:
         pass
 
+@dataclass(frozen=True)
 class EuropeanExercise(ExerciseStrategy):
     """No early exercise. Value is continuation value."""
     def apply(self, intrinsic_value: np.ndarray, continuation_value: np.ndarray) -> np.ndarray:
         return continuation_value
+
+    @property
+    def allows_early_exercise(self) -> bool:
+        return False
+
+    def apply_inplace(self, intrinsic_value: np.ndarray, continuation_value: np.ndarray) -> np.ndarray:
+        return continuation_value
         
     @property
     def style(self) -> str:
         return "European"
 
+@dataclass(frozen=True)
 class AmericanExercise(ExerciseStrategy):
     """Early exercise allowed. Max(Intrinsic, Continuation)."""
     def apply(self, intrinsic_value: np.ndarray, continuation_value: np.ndarray) -> np.ndarray:
         return np.maximum(intrinsic_value, continuation_value)
 
+    def apply_inplace(self, intrinsic_value: np.ndarray, continuation_value: np.ndarray) -> np.ndarray:
+        return np.maximum(continuation_value, intrinsic_value, out=continuation_value)
+
     @property
     def style(self) -> str:
         return "American"
@@ -1,4 +1,8 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Sequence, Tuple
+
+import numpy as np
 
 @dataclass(frozen=True)
 class MarketState:
@@ -10,3 +14,116 @@ class MarketState:
     risk_free_rate: float  # Annualized, continuously compounded
     volatility: float      # Annualized standard deviation
     dividend_yield: float = 0.0 # Continuous dividend yield
+
+# Columns of MarketStateBatch, in field order (the MarketState field order).
+MARKET_COLUMNS = ("spot_price", "risk_free_rate", "volatility", "dividend_yield")
+
+@dataclass(frozen=True, eq=False)
+class MarketStateBatch:
+    """
+    Structure-of-arrays counterpart of MarketState: one row per market.
+    Columns are 1D float64 arrays of equal length. Arrays that already have the
+    right dtype are used as-is (no copy), so a batch can view existing data.
+    """
+    spot_price: np.ndarray
+    risk_free_rate: np.ndarray
+    volatility: np.ndarray
+    dividend_yield: np.ndarray
+
+    def __post_init__(self):
+        columns = {name: np.asarray(getattr(self, name), dtype=np.float64) for name in MARKET_COLUMNS}
+        n = len(columns["spot_price"])
+        for name, column in columns.items():
+            if column.ndim != 1 or len(column) != n:
+                raise ValueError(f"Column '{name}' must be 1D with {n} rows, got shape {column.shape}")
+            object.__setattr__(self, name, column)
+
+    def __len__(self) -> int:
+        return len(self.spot_price)
+
+    def __getitem__(self, index) -> "MarketStateBatch":
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 or None)
+        return MarketStateBatch(*(getattr(self, name)[index] for name in MARKET_COLUMNS))
+
+    @classmethod
+    def from_states(cls, states: Sequence[MarketState]) -> "MarketStateBatch":
+        return cls(*(np.array([getattr(s, name) for s in states], dtype=np.float64) for name in MARKET_COLUMNS))
+
+    @classmethod
+    def broadcast(cls, state: MarketState, rows: int) -> "MarketStateBatch":
+        """A batch of `rows` identical markets backed by read-only zero-stride views."""
+        return cls(*(np.broadcast_to(np.float64(getattr(state, name)), (rows,)) for name in MARKET_COLUMNS))
+
+    def to_states(self) -> List[MarketState]:
+        return [MarketState(*map(float, row)) for row in zip(*(getattr(self, name) for name in MARKET_COLUMNS))]
+
+    def state(self, row: int) -> MarketState:
+        return MarketState(*(float(getattr(self, name)[row]) for name in MARKET_COLUMNS))
+
+@dataclass(frozen=True)
+class MultiAssetMarketState:
+    """
+    Market of several underlyings sharing one risk-free rate.
+
+    Per-asset fields are tuples (any sequence is converted on construction) and the
+    correlation matrix is a tuple of rows, so the state is immutable and hashable
+    like MarketState and can key caches. The `*_array` views are built once.
+    """
+    spot_prices: Tuple[float, ...]
+    volatilities: Tuple[float, ...]
+    correlation: Tuple[Tuple[float, ...], ...]
+    risk_free_rate: float
+    dividend_yields: Tuple[float, ...] = ()
+
+    def __post_init__(self):
+        spots = tuple(float(x) for x in self.spot_prices)
+        n = len(spots)
+        vols = tuple(float(x) for x in self.volatilities)
+        dividends = tuple(float(x) for x in self.dividend_yields) or (0.0,) * n
+        correlation = tuple(tuple(float(x) for x in row) for row in np.asarray(self.correlation, dtype=float))
+        if n == 0 or len(vols) != n or len(dividends) != n:
+            raise ValueError(f"Spots, volatilities and dividend yields must have the same length, "
+                             f"got {n}, {len(vols)}, {len(dividends)}")
+        matrix = np.array(correlation, dtype=float)
+        if matrix.shape != (n, n):
+            raise ValueError(f"Correlation must be {n}x{n}, got shape {matrix.shape}")
+        if not np.allclose(matrix, matrix.T, rtol=0.0, atol=1e-12) or not np.allclose(np.diag(matrix), 1.0):
+            raise ValueError("Correlation must be symmetric with a unit diagonal")
+        if np.any(np.abs(matrix) > 1.0 + 1e-12):
+            raise ValueError("Correlations must lie in [-1, 1]")
+        object.__setattr__(self, "spot_prices", spots)
+        object.__setattr__(self, "volatilities", vols)
+        object.__setattr__(self, "dividend_yields", dividends)
+        object.__setattr__(self, "correlation", correlation)
+        object.__setattr__(self, "risk_free_rate", float(self.risk_free_rate))
+
+    @property
+    def num_assets(self) -> int:
+        return len(self.spot_prices)
+
+    @cached_property
+    def spot_array(self) -> np.ndarray:
+        return _read_only(self.spot_prices)
+
+    @cached_property
+    def volatility_array(self) -> np.ndarray:
+        return _read_only(self.volatilities)
+
+    @cached_property
+    def dividend_array(self) -> np.ndarray:
+        return _read_only(self.dividend_yields)
+
+    @cached_property
+    def correlation_matrix(self) -> np.ndarray:
+        return _read_only(self.correlation)
+
+    def asset(self, index: int) -> MarketState:
+        """The single-asset market of one underlying."""
+        return MarketState(self.spot_prices[index], self.risk_free_rate, self.volatilities[index],
+                           self.dividend_yields[index])
+
+def _read_only(values) -> np.ndarray:
+    array = np.array(values, dtype=np.float64)
+    array.flags.writeable = False
+    return array
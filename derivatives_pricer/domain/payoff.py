@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Tuple
 import numpy as np
 from derivatives_pricer.domain.enums import BarrierType
 
@@ -14,6 +15,15 @@ class Payoff(ABC):
     @abstractmethod
     def __call__(self, prices: np.ndarray) -> np.ndarray:
         pass
+
+    def evaluate_into(self, prices: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        In-place variant of `__call__`: writes the payoff into `out` and returns it.
+        `out` must not alias `prices`. Payoffs without an allocation-free
+        implementation fall back to copying the result of `__call__`.
+        """
+        out[...] = self(prices)
+        return out
     
     @property
     @abstractmethod
@@ -39,6 +49,10 @@ class CallPayoff(VanillaPayoff):
     def __call__(self, prices: np.ndarray) -> np.ndarray:
         S = self._get_terminal_prices(prices)
         return np.maximum(S - self.strike, 0.0)
+
+    def evaluate_into(self, prices: np.ndarray, out: np.ndarray) -> np.ndarray:
+        np.subtract(self._get_terminal_prices(prices), self.strike, out=out)
+        return np.maximum(out, 0.0, out=out)
     
     @property
     def name(self) -> str:
@@ -49,6 +63,10 @@ class PutPayoff(VanillaPayoff):
     def __call__(self, prices: np.ndarray) -> np.ndarray:
         S = self._get_terminal_prices(prices)
         return np.maximum(self.strike - S, 0.0)
+
+    def evaluate_into(self, prices: np.ndarray, out: np.ndarray) -> np.ndarray:
+        np.subtract(self.strike, self._get_terminal_prices(prices), out=out)
+        return np.maximum(out, 0.0, out=out)
         
     @property
     def name(self) -> str:
@@ -113,3 +131,68 @@ class AsianPayoff(Payoff):
     @property
     def name(self) -> str:
         return "Asian (Arithmetic)"
+
+# --- Multi-Asset Payoffs ---
+# Prices are [assets, paths] terminal values or [steps, assets, paths] full paths.
+# Each payoff reduces the assets to one number per path and hands it to a vanilla
+# `underlying_payoff` (CallPayoff / PutPayoff), like BarrierPayoff does.
+
+def _terminal_assets(prices: np.ndarray) -> np.ndarray:
+    if prices.ndim == 3:
+        return prices[-1]
+    if prices.ndim != 2:
+        raise ValueError("Multi-asset payoffs require [assets, paths] or [steps, assets, paths] prices")
+    return prices
+
+@dataclass(frozen=True)
+class BasketPayoff(Payoff):
+    """Vanilla payoff on the weighted sum of terminal prices."""
+    weights: Tuple[float, ...]
+    underlying_payoff: Payoff
+
+    def __call__(self, prices: np.ndarray) -> np.ndarray:
+        S = _terminal_assets(prices)
+        if S.shape[0] != len(self.weights):
+            raise ValueError(f"Basket has {len(self.weights)} weights, prices have {S.shape[0]} assets")
+        basket = np.asarray(self.weights, dtype=S.dtype) @ S
+        return self.underlying_payoff(basket)
+
+    @property
+    def name(self) -> str:
+        return f"Basket {self.underlying_payoff.name}"
+
+@dataclass(frozen=True)
+class SpreadPayoff(Payoff):
+    """Vanilla payoff on S[long_asset] - S[short_asset]."""
+    underlying_payoff: Payoff
+    long_asset: int = 0
+    short_asset: int = 1
+
+    def __call__(self, prices: np.ndarray) -> np.ndarray:
+        S = _terminal_assets(prices)
+        return self.underlying_payoff(S[self.long_asset] - S[self.short_asset])
+
+    @property
+    def name(self) -> str:
+        return f"Spread {self.underlying_payoff.name}"
+
+@dataclass(frozen=True)
+class WorstOfPayoff(Payoff):
+    """
+    Vanilla payoff on the worst performance, min_i S_i / reference_levels[i]; the
+    underlying payoff's strike is a performance level (1.0 = at the money).
+    """
+    reference_levels: Tuple[float, ...]
+    underlying_payoff: Payoff
+
+    def __call__(self, prices: np.ndarray) -> np.ndarray:
+        S = _terminal_assets(prices)
+        levels = np.asarray(self.reference_levels, dtype=S.dtype)
+        if S.shape[0] != len(levels):
+            raise ValueError(f"Worst-of has {len(levels)} reference levels, prices have {S.shape[0]} assets")
+        worst = np.min(S / levels[:, None], axis=0)
+        return self.underlying_payoff(worst)
+
+    @property
+    def name(self) -> str:
+        return f"Worst-of {self.underlying_payoff.name}"
@@ -0,0 +1,173 @@
+"""
+Single-pass evaluation of many payoffs over one simulation.
+
+Evaluating N options on the same paths one `payoff(paths)` call at a time sweeps the
+[steps, paths] matrix N times: every barrier recomputes the path max or min and every
+Asian the path mean. A PayoffSet recognises vanilla, barrier and Asian payoffs,
+works out which path statistics the whole set needs (terminal, max, min, average),
+computes each of them once, and then evaluates all payoffs of a kind with a single
+[payoffs, paths] broadcast over strikes and barrier levels. Payoffs it does not
+recognise are called on the full paths as usual.
+"""
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, List, Optional, Sequence
+
+import numpy as np
+
+from derivatives_pricer.domain.enums import BarrierType
+from derivatives_pricer.domain.payoff import AsianPayoff, BarrierPayoff, CallPayoff, PutPayoff
+
+TERMINAL = "terminal"
+MAXIMUM = "maximum"
+MINIMUM = "minimum"
+AVERAGE = "average"
+
+@dataclass(frozen=True)
+class PathStatistics:
+    """
+    Per-path summaries of a simulation, each an array over paths (None when not
+    computed). Like the payoffs, they cover the simulated dates and exclude S0.
+    """
+    terminal: Optional[np.ndarray] = None
+    maximum: Optional[np.ndarray] = None
+    minimum: Optional[np.ndarray] = None
+    average: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_paths(cls, prices: np.ndarray, required: FrozenSet[str]) -> "PathStatistics":
+        """Reduces terminal prices [paths] or full paths [steps, paths] to the `required` statistics."""
+        paths = prices if prices.ndim == 2 else prices[None, :]
+        return cls(
+            terminal=paths[-1] if TERMINAL in required else None,
+            maximum=np.max(paths, axis=0) if MAXIMUM in required else None,
+            minimum=np.min(paths, axis=0) if MINIMUM in required else None,
+            average=np.mean(paths, axis=0) if AVERAGE in required else None,
+        )
+
+@dataclass(frozen=True)
+class _Group:
+    """Payoffs of one shape: max(sign * (statistic - strike), 0), optionally gated by a barrier."""
+    rows: np.ndarray
+    sign: np.ndarray
+    strike: np.ndarray
+    statistic: str
+    # Barrier gate: the path crossed `level` when gate_statistic >= level (up) or <= level (down);
+    # the payoff is alive when crossed == knock_in.
+    gate_statistic: Optional[str] = None
+    level: Optional[np.ndarray] = None
+    knock_in: Optional[np.ndarray] = None
+
+    def evaluate(self, stats: PathStatistics, out: np.ndarray) -> None:
+        values = getattr(stats, self.statistic)[None, :] - self.strike[:, None]
+        values *= self.sign[:, None]
+        np.maximum(values, 0.0, out=values)
+        if self.gate_statistic is not None:
+            extreme = getattr(stats, self.gate_statistic)[None, :]
+            if self.gate_statistic == MAXIMUM:
+                crossed = extreme >= self.level[:, None]
+            else:
+                crossed = extreme <= self.level[:, None]
+            values *= crossed == self.knock_in[:, None]
+        out[self.rows] = values
+
+_UP = (BarrierType.UP_AND_OUT, BarrierType.UP_AND_IN)
+_KNOCK_IN = (BarrierType.UP_AND_IN, BarrierType.DOWN_AND_IN)
+
+def _vanilla_sign(payoff) -> Optional[float]:
+    if type(payoff) is CallPayoff:
+        return 1.0
+    if type(payoff) is PutPayoff:
+        return -1.0
+    return None
+
+class PayoffSet:
+    """
+    A fixed list of payoffs evaluated together on the same paths.
+
+    `evaluate(prices)` returns a [len(payoffs), paths] array whose row i equals
+    `payoffs[i](prices)`. Any callable taking the path matrix is accepted; only
+    CallPayoff, PutPayoff, BarrierPayoff over a call/put, and AsianPayoff are fused.
+    """
+
+    def __init__(self, payoffs: Sequence[Callable[[np.ndarray], np.ndarray]]):
+        self._payoffs = list(payoffs)
+        # Per kind: (row, sign, strike[, barrier level, knock-in]).
+        collected = {"vanilla": [], "asian": [], "up": [], "down": []}
+        generic: List[int] = []
+        for row, payoff in enumerate(self._payoffs):
+            sign = _vanilla_sign(payoff)
+            if sign is not None:
+                collected["vanilla"].append((row, sign, payoff.strike))
+            elif type(payoff) is AsianPayoff:
+                sign = 1.0 if payoff.underlying_payoff_type == "Call" else -1.0
+                collected["asian"].append((row, sign, payoff.strike))
+            elif type(payoff) is BarrierPayoff and _vanilla_sign(payoff.underlying_payoff) is not None:
+                kind = "up" if payoff.barrier_type in _UP else "down"
+                collected[kind].append((row, _vanilla_sign(payoff.underlying_payoff),
+                                        payoff.underlying_payoff.strike, payoff.barrier,
+                                        payoff.barrier_type in _KNOCK_IN))
+            else:
+                generic.append(row)
+
+        statistics = {"vanilla": TERMINAL, "asian": AVERAGE, "up": TERMINAL, "down": TERMINAL}
+        gates = {"up": MAXIMUM, "down": MINIMUM}
+        self._groups: List[_Group] = []
+        for kind, entries in collected.items():
+            if not entries:
+                continue
+            columns = list(zip(*entries))
+            group = dict(rows=np.array(columns[0], dtype=np.intp), sign=np.array(columns[1]),
+                         strike=np.array(columns[2], dtype=float), statistic=statistics[kind])
+            if kind in gates:
+                group.update(gate_statistic=gates[kind], level=np.array(columns[3], dtype=float),
+                             knock_in=np.array(columns[4], dtype=bool))
+            self._groups.append(_Group(**group))
+        self._generic = generic
+
+    def __len__(self) -> int:
+        return len(self._payoffs)
+
+    @property
+    def payoffs(self) -> List[Callable[[np.ndarray], np.ndarray]]:
+        return list(self._payoffs)
+
+    @property
+    def required_statistics(self) -> FrozenSet[str]:
+        """Path statistics the fused payoffs read."""
+        needed = set()
+        for group in self._groups:
+            needed.add(group.statistic)
+            if group.gate_statistic is not None:
+                needed.add(group.gate_statistic)
+        return frozenset(needed)
+
+    @property
+    def needs_paths(self) -> bool:
+        """True when some payoff is not fused and must see the full path matrix."""
+        return bool(self._generic)
+
+    def statistics(self, prices: np.ndarray) -> PathStatistics:
+        return PathStatistics.from_paths(prices, self.required_statistics)
+
+    def evaluate(self, prices: np.ndarray) -> np.ndarray:
+        """Payoffs [len(self), paths] of every member on the same prices."""
+        return self.evaluate_statistics(self.statistics(prices), prices)
+
+    def evaluate_statistics(self, stats: PathStatistics, prices: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Payoffs from precomputed statistics (e.g. accumulated by a fused simulation).
+        `prices` is only needed when `needs_paths` is True.
+        """
+        if not self._payoffs:
+            return np.empty((0, 0))
+        reference = next(x for x in (stats.terminal, stats.average, stats.maximum, stats.minimum, prices)
+                         if x is not None)
+        out = np.empty((len(self._payoffs), reference.shape[-1]), dtype=reference.dtype)
+        for group in self._groups:
+            group.evaluate(stats, out)
+        if self._generic:
+            if prices is None:
+                raise ValueError("Payoffs without a fused form need the full price paths")
+            for row in self._generic:
+                out[row] = self._payoffs[row](prices)
+        return out
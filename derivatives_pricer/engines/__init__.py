@@ -1,4 +1,55 @@
-from .interface import PricingEngine
-from .binomial import BinomialPricingEngine
-from .analytic import BlackScholesEngine
-from .monte_carlo import MonteCarloEngine
+"""
+Pricing engines.
+
+Engines are imported on first attribute access (PEP 562), so `import
+derivatives_pricer.engines` stays cheap and a job that only needs one engine never
+loads the others or their dependencies.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    "PricingEngine": ".interface",
+    "BinomialPricingEngine": ".binomial",
+    "BlackScholesEngine": ".analytic",
+    "MonteCarloEngine": ".monte_carlo",
+    "AmericanApproximationEngine": ".american",
+    "AmericanPriceTable": ".american_table",
+    "AmericanTableEngine": ".american_table",
+    "BarrierLatticeEngine": ".barrier_lattice",
+    "MultiAssetMonteCarloEngine": ".multi_asset",
+    "CorrelatedGBM": ".multi_asset",
+    "CachedPricingEngine": ".cache",
+    "CacheStats": ".cache",
+    "ScenarioEngine": ".scenario",
+    "ScenarioGrid": ".scenario",
+    "ParallelPortfolioPricer": ".parallel",
+    "IncrementalValuator": ".incremental",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+if TYPE_CHECKING:
+    from .interface import PricingEngine
+    from .binomial import BinomialPricingEngine
+    from .analytic import BlackScholesEngine
+    from .monte_carlo import MonteCarloEngine
+    from .american import AmericanApproximationEngine
+    from .american_table import AmericanPriceTable, AmericanTableEngine
+    from .barrier_lattice import BarrierLatticeEngine
+    from .multi_asset import MultiAssetMonteCarloEngine, CorrelatedGBM
+    from .cache import CachedPricingEngine, CacheStats
+    from .scenario import ScenarioEngine, ScenarioGrid
+    from .parallel import ParallelPortfolioPricer
+    from .incremental import IncrementalValuator
@@ -0,0 +1,331 @@
+"""
+Precomputed American price tables.
+
+American vanilla prices are homogeneous of degree one in (spot, strike), so for a
+fixed rate and dividend yield V / K depends only on x = ln(S / K), T and sigma.
+AmericanPriceTable stores V / K, delta, gamma * K and theta / K for calls and puts on
+an x x T x sigma grid, built once with the batched lattice, plus the early-exercise
+boundary S* / K per (T, sigma). AmericanTableEngine serves prices and Greeks by
+multilinear interpolation (in sqrt(T) along the expiry axis).
+
+Tables persist as one .npy file per array plus a JSON header, and load memory-mapped,
+so every worker on a box shares the same pages.
+"""
+import json
+import os
+from dataclasses import dataclass, fields
+from typing import Any, Final, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from derivatives_pricer.domain.interfaces import ValuationInstrument
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+from derivatives_pricer.domain.analytic_formulas import black_scholes_price_vectorized
+from derivatives_pricer.instruments.batch import InstrumentBatch
+from derivatives_pricer.engines.interface import PricingEngine, market_columns
+from derivatives_pricer.engines.binomial import (
+    BinomialPricingEngine, rollback_vanilla_batch, is_plain_vanilla, _tree_greeks
+)
+from derivatives_pricer.math import kernels
+from derivatives_pricer.common import instrumentation
+
+DEFAULT_MONEYNESS: Final[np.ndarray] = np.linspace(-0.8, 0.8, 81)
+DEFAULT_EXPIRIES: Final[np.ndarray] = np.linspace(np.sqrt(1.0 / 52.0), np.sqrt(3.0), 24) ** 2
+DEFAULT_VOLATILITIES: Final[np.ndarray] = np.linspace(0.05, 0.8, 16)
+
+# Value tables, indexed [option type (0 = call, 1 = put), x, T, sigma].
+_TABLES = ("price", "delta", "gamma", "theta")
+
+@dataclass(frozen=True, eq=False)
+class AmericanPriceTable:
+    """
+    Normalized American prices and Greeks for one (rate, dividend_yield).
+
+    Axes: `moneyness` = ln(S / K), `expiries` (years), `volatilities`.
+    Tables are [2, x, T, sigma] with index 0 for calls and 1 for puts:
+        price   V / K
+        delta   dV / dS
+        gamma   K * d2V / dS2
+        theta   (dV / dt) / K, per year of calendar time
+    `boundary` is [2, T, sigma]: the early-exercise spot S* / K (NaN where no
+    exercise boundary lies inside the moneyness range).
+
+    `error_bound` is the largest absolute error of an interpolated V / K measured at
+    the centres of every grid cell against a lattice with twice the build steps.
+    It covers interpolation and lattice discretization error inside the grid; a
+    price error is `error_bound * strike`.
+    """
+    rate: float
+    dividend_yield: float
+    steps: int
+    moneyness: np.ndarray
+    expiries: np.ndarray
+    volatilities: np.ndarray
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    boundary: np.ndarray
+    error_bound: float
+
+    @classmethod
+    def build(cls,
+              rate: float,
+              dividend_yield: float = 0.0,
+              moneyness: Sequence[float] = DEFAULT_MONEYNESS,
+              expiries: Sequence[float] = DEFAULT_EXPIRIES,
+              volatilities: Sequence[float] = DEFAULT_VOLATILITIES,
+              steps: int = 500,
+              backend: str = "auto") -> "AmericanPriceTable":
+        """Runs one batched lattice over every grid node (both option types)."""
+        grids = [np.asarray(g, dtype=float) for g in (moneyness, expiries, volatilities)]
+        for name, grid in zip(("moneyness", "expiries", "volatilities"), grids):
+            if grid.ndim != 1 or len(grid) < 2 or np.any(np.diff(grid) <= 0):
+                raise ValueError(f"Grid '{name}' must be strictly increasing with at least 2 points")
+        if grids[1][0] <= 0 or grids[2][0] <= 0:
+            raise ValueError("Expiries and volatilities must be positive")
+        if steps < 2:
+            raise ValueError(f"Parameter 'steps' must be at least 2, got {steps}")
+        backend = kernels.resolve_backend(backend)
+        x, T, sigma = grids
+
+        with instrumentation.span("american_table.build"):
+            nodes = np.stack(np.meshgrid([True, False], x, T, sigma, indexing="ij"), axis=0)
+            tables = _lattice_values(nodes[0].astype(bool), nodes[1], nodes[2], nodes[3],
+                                     rate, dividend_yield, steps, backend)
+            table = cls(
+                rate=float(rate),
+                dividend_yield=float(dividend_yield),
+                steps=int(steps),
+                moneyness=x,
+                expiries=T,
+                volatilities=sigma,
+                boundary=_exercise_boundary(tables["price"], x),
+                error_bound=0.0,
+                **tables,
+            )
+
+        with instrumentation.span("american_table.verify"):
+            # Cell centres in (x, sqrt(T), sigma): where multilinear error peaks.
+            mid_x = 0.5 * (x[1:] + x[:-1])
+            mid_t = (0.5 * (np.sqrt(T[1:]) + np.sqrt(T[:-1]))) ** 2
+            mid_s = 0.5 * (sigma[1:] + sigma[:-1])
+            check = np.stack(np.meshgrid([True, False], mid_x, mid_t, mid_s, indexing="ij"), axis=0)
+            check = [c.ravel() for c in check]
+            is_call = check[0].astype(bool)
+            reference = _lattice_values(is_call, check[1], check[2], check[3],
+                                        rate, dividend_yield, 2 * steps, backend)["price"]
+            interpolated = table.interpolate("price", check[1], check[2], check[3], is_call)
+            error = float(np.max(np.abs(interpolated - reference)))
+        object.__setattr__(table, "error_bound", error)
+        return table
+
+    def interpolate(self, name: str, moneyness, expiry, volatility, is_call) -> np.ndarray:
+        """Multilinear interpolation of one table; inputs broadcast against each other."""
+        values = getattr(self, name)
+        x, T, sigma, is_call = np.broadcast_arrays(
+            np.asarray(moneyness, dtype=float), np.asarray(expiry, dtype=float),
+            np.asarray(volatility, dtype=float), np.asarray(is_call, dtype=bool)
+        )
+        (ix, wx), (it, wt), (iv, wv) = (
+            _bracket(self.moneyness, x),
+            _bracket(np.sqrt(self.expiries), np.sqrt(T)),
+            _bracket(self.volatilities, sigma),
+        )
+        kind = np.where(is_call, 0, 1)
+        out = np.zeros(x.shape)
+        for dx in (0, 1):
+            for dt in (0, 1):
+                for dv in (0, 1):
+                    weight = (wx if dx else 1.0 - wx) * (wt if dt else 1.0 - wt) * (wv if dv else 1.0 - wv)
+                    out += weight * values[kind, ix + dx, it + dt, iv + dv]
+        return out
+
+    def contains(self, moneyness, expiry, volatility) -> np.ndarray:
+        """True where a query lies inside the grid (where `error_bound` applies)."""
+        return (
+            (moneyness >= self.moneyness[0]) & (moneyness <= self.moneyness[-1])
+            & (expiry >= self.expiries[0]) & (expiry <= self.expiries[-1])
+            & (volatility >= self.volatilities[0]) & (volatility <= self.volatilities[-1])
+        )
+
+    def exercise_boundary(self, expiry, volatility, is_call) -> np.ndarray:
+        """Early-exercise spot S* / K, bilinear in (sqrt(T), sigma)."""
+        T, sigma, is_call = np.broadcast_arrays(
+            np.asarray(expiry, dtype=float), np.asarray(volatility, dtype=float), np.asarray(is_call, dtype=bool)
+        )
+        (it, wt), (iv, wv) = _bracket(np.sqrt(self.expiries), np.sqrt(T)), _bracket(self.volatilities, sigma)
+        kind = np.where(is_call, 0, 1)
+        out = np.zeros(T.shape)
+        for dt in (0, 1):
+            for dv in (0, 1):
+                weight = (wt if dt else 1.0 - wt) * (wv if dv else 1.0 - wv)
+                out += weight * self.boundary[kind, it + dt, iv + dv]
+        return out
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        header = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, np.ndarray):
+                np.save(os.path.join(directory, f"{f.name}.npy"), value)
+            else:
+                header[f.name] = value
+        with open(os.path.join(directory, "table.json"), "w") as fh:
+            json.dump(header, fh, indent=2)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "AmericanPriceTable":
+        """Loads a saved table; with `mmap` the arrays are shared read-only pages."""
+        with open(os.path.join(directory, "table.json")) as fh:
+            values = json.load(fh)
+        for f in fields(cls):
+            if f.name not in values:
+                values[f.name] = np.load(os.path.join(directory, f"{f.name}.npy"), mmap_mode="r" if mmap else None)
+        return cls(**values)
+
+def _bracket(grid: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower grid index and weight of the upper neighbour; clamps outside the grid."""
+    index = np.clip(np.searchsorted(grid, values, side="right") - 1, 0, len(grid) - 2)
+    weight = np.clip((values - grid[index]) / (grid[index + 1] - grid[index]), 0.0, 1.0)
+    return index, weight
+
+def _lattice_values(is_call, x, T, sigma, rate, dividend_yield, steps, backend) -> dict:
+    """Normalized (K = 1) lattice price and Greeks for each node of the inputs' shape."""
+    shape = np.shape(x)
+    is_call, x, T, sigma = (np.ravel(a) for a in (is_call, x, T, sigma))
+    k = len(x)
+    spot = np.exp(x)
+    price, layer_1, layer_2 = rollback_vanilla_batch(
+        spot=spot, strike=np.ones(k), expiry=T, rate=np.full(k, rate), volatility=sigma,
+        dividend_yield=np.full(k, dividend_yield), is_call=is_call, is_american=np.ones(k, dtype=bool),
+        steps=steps, backend=backend,
+    )
+    dt = T / steps
+    price, delta, gamma, theta = _tree_greeks(price, layer_1, layer_2, spot, np.exp(sigma * np.sqrt(dt)), dt)
+    return {name: value.reshape(shape) for name, value in zip(_TABLES, (price, delta, gamma, theta))}
+
+def _exercise_boundary(price: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    S* / K per (type, T, sigma): where the price leaves intrinsic value.
+
+    Smooth pasting makes the time value grow like (x - x*)^2 past the boundary, so
+    its square root is extrapolated linearly from the first two continuation nodes.
+    """
+    spot = np.exp(x)[:, None, None]
+    boundary = np.full((2,) + price.shape[2:], np.nan)
+    for kind, sign in ((0, 1.0), (1, -1.0)):
+        premium = np.maximum(price[kind] - np.maximum(sign * (spot - 1.0), 0.0), 0.0)
+        exercised = premium <= 1e-8 * np.maximum(price[kind], 1.0)
+        # Walk from deep in the money towards the strike.
+        order = slice(None, None, -1) if kind == 0 else slice(None)
+        ex, root, xs = exercised[order], np.sqrt(premium[order]), x[order]
+        first = np.argmin(ex, axis=0)  # first continuation node
+        valid = ex[0] & ~np.all(ex, axis=0) & (first < len(x) - 1)
+        first = np.minimum(first, len(x) - 2)
+        t_idx, v_idx = np.indices(first.shape)
+        r1, r2 = root[first, t_idx, v_idx], root[first + 1, t_idx, v_idx]
+        x1, x2 = xs[first], xs[first + 1]
+        slope = np.where(r2 > r1, (r2 - r1) / np.where(r2 > r1, x2 - x1, 1.0), np.inf)
+        x_star = x1 - r1 / slope
+        # The boundary lies between the last exercised node and the first continuation node.
+        x_star = np.clip(x_star, np.minimum(xs[first - 1], x1), np.maximum(xs[first - 1], x1))
+        boundary[kind] = np.where(valid, np.exp(x_star), np.nan)
+    return boundary
+
+@dataclass(frozen=True)
+class AmericanTableGreeks:
+    """Vectorized price and sensitivities; theta per year, vega per unit volatility."""
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+
+class AmericanTableEngine(PricingEngine):
+    """
+    Prices plain calls and puts from an AmericanPriceTable.
+
+    The market's rate and dividend yield must match the table's. American contracts
+    inside the grid are interpolated; contracts outside it go to `fallback` (a lattice
+    with the table's step count by default), and European ones to Black-Scholes.
+    """
+
+    def __init__(self, table: AmericanPriceTable, fallback: Optional[PricingEngine] = None):
+        self._table: Final[AmericanPriceTable] = table
+        self._fallback: Final[PricingEngine] = fallback or BinomialPricingEngine(step_count=table.steps)
+
+    @property
+    def table(self) -> AmericanPriceTable:
+        return self._table
+
+    @property
+    def configuration(self) -> Tuple[Any, ...]:
+        t = self._table
+        return (type(self).__name__, id(t), t.rate, t.dividend_yield, t.steps, self._fallback.configuration)
+
+    def price(self, instrument: ValuationInstrument, market_state: MarketState) -> float:
+        if not is_plain_vanilla(instrument):
+            raise TypeError("AmericanTableEngine only supports call/put VanillaOption")
+        return float(self.price_batch(InstrumentBatch.from_instruments([instrument]), market_state)[0])
+
+    def price_batch(self,
+                    instruments: InstrumentBatch,
+                    market: Union[MarketState, MarketStateBatch]) -> np.ndarray:
+        return self._evaluate(instruments, market, greeks=False).price
+
+    def price_with_greeks_batch(self,
+                                instruments: InstrumentBatch,
+                                market: Union[MarketState, MarketStateBatch]) -> AmericanTableGreeks:
+        """
+        Interpolated price, delta, gamma, theta and vega (from the volatility axis).
+        Rows outside the grid or with European exercise get NaN Greeks.
+        """
+        return self._evaluate(instruments, market, greeks=True)
+
+    def _evaluate(self, instruments: InstrumentBatch, market, greeks: bool) -> AmericanTableGreeks:
+        if not np.all(instruments.is_vanilla):
+            raise TypeError("AmericanTableEngine only supports call/put VanillaOption")
+        table = self._table
+        m = market_columns(market, len(instruments))
+        if not (np.allclose(m.risk_free_rate, table.rate, rtol=0.0, atol=1e-12)
+                and np.allclose(m.dividend_yield, table.dividend_yield, rtol=0.0, atol=1e-12)):
+            raise ValueError(
+                f"Table was built for rate={table.rate}, dividend_yield={table.dividend_yield}; "
+                "build another table for this market"
+            )
+
+        K = instruments.strike
+        x = np.log(m.spot_price / K)
+        T = instruments.expiry
+        sigma = m.volatility
+        is_call = instruments.is_call
+        american = instruments.is_american
+        inside = american & table.contains(x, T, sigma)
+
+        n = len(instruments)
+        out = {name: np.full(n, np.nan) for name in ("price", "delta", "gamma", "theta", "vega")}
+        out["price"][:] = black_scholes_price_vectorized(m.spot_price, K, T, m.risk_free_rate, sigma,
+                                                         m.dividend_yield, is_call)
+        if np.any(inside):
+            args = (x[inside], T[inside], sigma[inside], is_call[inside])
+            k = K[inside]
+            out["price"][inside] = k * table.interpolate("price", *args)
+            if greeks:
+                out["delta"][inside] = table.interpolate("delta", *args)
+                out["gamma"][inside] = table.interpolate("gamma", *args) / k
+                out["theta"][inside] = k * table.interpolate("theta", *args)
+                # Central difference across the volatility axis, one cell wide.
+                h = 0.5 * np.min(np.diff(table.volatilities))
+                up = table.interpolate("price", args[0], args[1], np.minimum(args[2] + h, table.volatilities[-1]), args[3])
+                down = table.interpolate("price", args[0], args[1], np.maximum(args[2] - h, table.volatilities[0]), args[3])
+                width = np.minimum(args[2] + h, table.volatilities[-1]) - np.maximum(args[2] - h, table.volatilities[0])
+                out["vega"][inside] = k * (up - down) / width
+
+        outside = american & ~inside
+        if np.any(outside):
+            instrumentation.increment("american_table.fallback", int(np.count_nonzero(outside)))
+            rows = np.flatnonzero(outside)
+            out["price"][rows] = self._fallback.price_batch(instruments[rows], m[rows])
+        return AmericanTableGreeks(**out)
@@ -1,9 +1,14 @@
 from derivatives_pricer.domain.interfaces import ValuationInstrument
-from derivatives_pricer.domain.market import MarketState
+from typing import Union
+
+import numpy as np
+
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
 from derivatives_pricer.domain.enums import OptionType
 from derivatives_pricer.instruments.options import VanillaOption
-from derivatives_pricer.engines.interface import PricingEngine
-from derivatives_pricer.domain.analytic_formulas import black_scholes_price
+from derivatives_pricer.instruments.batch import InstrumentBatch
+from derivatives_pricer.engines.interface import PricingEngine, market_columns
+from derivatives_pricer.domain.analytic_formulas import black_scholes_price, black_scholes_price_vectorized
 
 class BlackScholesEngine(PricingEngine):
     """
@@ -30,3 +35,20 @@ class BlackScholesEngine(PricingEngine):
             dividend_yield=market_state.dividend_yield,
             is_call=(instrument.option_type == OptionType.CALL)
         )
+
+    def price_batch(self,
+                    instruments: InstrumentBatch,
+                    market: Union[MarketState, MarketStateBatch]) -> np.ndarray:
+        """Closed form evaluated over whole columns."""
+        if not np.all(instruments.is_vanilla):
+            raise TypeError("BlackScholesEngine only supports VanillaOption")
+        m = market_columns(market, len(instruments))
+        return black_scholes_price_vectorized(
+            spot=m.spot_price,
+            strike=instruments.strike,
+            time_to_expiry=instruments.expiry,
+            risk_free_rate=m.risk_free_rate,
+            volatility=m.volatility,
+            dividend_yield=m.dividend_yield,
+            is_call=instruments.is_call
+        )
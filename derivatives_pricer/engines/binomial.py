@@ -1,12 +1,21 @@
+import math
+import threading
+from functools import lru_cache
+
 import numpy as np
-from typing import Final
+from typing import Any, Final, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 
 from derivatives_pricer.domain.interfaces import ValuationInstrument
-from derivatives_pricer.domain.market import MarketState
-from derivatives_pricer.engines.interface import PricingEngine
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+from derivatives_pricer.engines.interface import PricingEngine, market_columns
 from derivatives_pricer.common.validation import validate_positive
+from derivatives_pricer.common import instrumentation
+from derivatives_pricer.math import kernels
 from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.batch import InstrumentBatch
+from derivatives_pricer.domain.payoff import CallPayoff, PutPayoff
+from derivatives_pricer.domain.exercise import EuropeanExercise, AmericanExercise
 
 @dataclass(frozen=True)
 class BinomialParams:
@@ -15,81 +24,410 @@ class BinomialParams:
     p: float
     df: float
 
+@dataclass(frozen=True)
+class BinomialGreeks:
+    """
+    Price and sensitivities read off the first two layers of the lattice.
+    Theta is per year of calendar time.
+    """
+    price: float
+    delta: float
+    gamma: float
+    theta: float
+
 class BinomialParameterizer:
     @staticmethod
     def calculate(market: MarketState, T: float, steps: int) -> BinomialParams:
-        dt = T / steps
-        r = market.risk_free_rate
-        q = market.dividend_yield
-        sigma = market.volatility
-        
-        u = np.exp(sigma * np.sqrt(dt))
-        d = 1.0 / u
-        p = (np.exp((r - q) * dt) - d) / (u - d)
-        df = np.exp(-r * dt)
-        
-        return BinomialParams(u, d, p, df)
+        """CRR parameters. Memoized per (market, T, steps); MarketState hashes by value."""
+        return _lattice_params(market, T, steps)
+
+    @staticmethod
+    def cache_clear() -> None:
+        _lattice_params.cache_clear()
+        _spot_grid.cache_clear()
+
+@lru_cache(maxsize=1024)
+def _lattice_params(market: MarketState, T: float, steps: int) -> BinomialParams:
+    dt = T / steps
+    r = market.risk_free_rate
+    q = market.dividend_yield
+    sigma = market.volatility
+
+    u = math.exp(sigma * math.sqrt(dt))
+    d = 1.0 / u
+    p = (math.exp((r - q) * dt) - d) / (u - d)
+    df = math.exp(-r * dt)
+
+    return BinomialParams(u, d, p, df)
+
+@lru_cache(maxsize=64)
+def _spot_grid(spot: float, u: float, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Every node spot of a `steps` lattice, S0 * u^(steps - k) for k = 0 .. 2 * steps,
+    split by the parity of k so that each layer is a contiguous slice of one half.
+    Shared between calls, hence read-only.
+    """
+    spots = spot * u ** (steps - np.arange(2 * steps + 1, dtype=float))
+    halves = (np.ascontiguousarray(spots[0::2]), np.ascontiguousarray(spots[1::2]))
+    for half in halves:
+        half.flags.writeable = False
+    return halves
 
 class BinomialLattice:
-    def __init__(self, market: MarketState, params: BinomialParams, steps: int):
+    """
+    Node buffers for rolling back one contract on a CRR lattice in place.
+
+    The lattice owns a value buffer and a scratch buffer of `steps + 1` nodes; each
+    backward step works on a shrinking prefix of them with `out=` ufuncs. Node i of
+    layer n sits at S0 * u^(n - 2i), so every layer's spots are a view into one
+    shared grid of 2 * steps + 1 spots and a rollback allocates nothing per step.
+    `reset` rebinds the lattice to a new market; `acquire` hands out one lattice per
+    step count and thread, so pricings with the same step count reuse the buffers.
+    """
+
+    def __init__(self, market: Optional[MarketState], params: Optional[BinomialParams], steps: int):
+        """`market` and `params` may be None for an unbound lattice; call `reset` before use."""
+        self._steps = steps
+        self._values = np.empty(steps + 1)
+        self._scratch = np.empty(steps + 1)
+        self._size = steps + 1
+        if market is not None and params is not None:
+            self.reset(market, params)
+
+    @classmethod
+    def acquire(cls, steps: int) -> "BinomialLattice":
+        """The calling thread's lattice for `steps` (buffers are never shared across threads)."""
+        lattices = getattr(_thread_lattices, "by_steps", None)
+        if lattices is None:
+            lattices = _thread_lattices.by_steps = {}
+        lattice = lattices.pop(steps, None)
+        if lattice is None:
+            lattice = cls(None, None, steps)
+            if len(lattices) >= _LATTICES_PER_THREAD:
+                del lattices[next(iter(lattices))]
+        # Re-insert so the dict stays in least-recently-used order.
+        lattices[steps] = lattice
+        return lattice
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @property
+    def _spot_prices(self) -> np.ndarray:
+        """Spots of the current layer, highest first (a read-only view of the spot grid)."""
+        n = self._size - 1
+        # Node i of layer n is grid entry k = steps - n + 2i.
+        offset = self._steps - n
+        start = offset // 2
+        return self._spot_grid[offset % 2][start:start + n + 1]
+
+    def reset(self, market: MarketState, params: BinomialParams) -> "BinomialLattice":
+        """Binds the lattice to a new market and rewinds it to the terminal layer."""
         self._market = market
         self._params = params
-        self._steps = steps
-        self._spot_prices: np.ndarray = self._initialize_spot_prices()
-
-    def _initialize_spot_prices(self) -> np.ndarray:
-        indices = np.arange(self._steps + 1)
-        u_pow = self._steps - indices
-        d_pow = indices
-        return self._market.spot_price * (self._params.u ** u_pow) * (self._params.d ** d_pow)
-
-    def backward_induction_step(self, 
-                                current_values: np.ndarray, 
-                                instrument: VanillaOption) -> np.ndarray:
-        # Continuation
-        continuation = self._params.df * (
-            self._params.p * current_values[:-1] + 
-            (1 - self._params.p) * current_values[1:]
-        )
-        
-        # Spot update
-        self._spot_prices = self._spot_prices[:-1] / self._params.u
-        
-        # Intrinsic
-        # NOTE: Payoff strategy expects paths. `spot_prices` is 1D array of terminal prices (nodes).
-        # We can pass it directly as 1D array. The Payoff strategy (Vanilla) handles this.
-        intrinsic = instrument.calculate_payoff(self._spot_prices)
-        
-        return instrument.apply_exercise_condition(intrinsic, continuation)
+        # Hoisted per-step constants.
+        self._p_df = params.df * params.p
+        self._q_df = params.df * (1 - params.p)
+        self._spot_grid = _spot_grid(market.spot_price, params.u, self._steps)
+        self._size = self._steps + 1
+        return self
+
+    def terminal_values(self, instrument: VanillaOption) -> np.ndarray:
+        """Payoff at expiry, written into the value buffer. Returns a view of it."""
+        return instrument.calculate_payoff_into(self._spot_prices, self._values[:self._size])
+
+    def backward_induction_step(self, current_values: np.ndarray, instrument: VanillaOption) -> np.ndarray:
+        """
+        Rolls `current_values` back one layer and returns the new, one node shorter,
+        layer. Passing the view returned by `terminal_values` or the previous step
+        works in place on the value buffer; any other array is copied into it first.
+        The returned view is overwritten by the next step.
+        """
+        n = len(current_values) - 1
+        values = self._values
+        if current_values.ctypes.data != values.ctypes.data:
+            values[:n + 1] = current_values
+        continuation = values[:n]
+        scratch = self._scratch[:n]
+
+        # Continuation: v[i] = df * (p * v[i] + (1 - p) * v[i + 1]). The down-branch
+        # term goes to scratch first, before v[1:] is overwritten.
+        np.multiply(values[1:n + 1], self._q_df, out=scratch)
+        np.multiply(continuation, self._p_df, out=continuation)
+        np.add(continuation, scratch, out=continuation)
+        self._size = n
+
+        if instrument.exercise_strategy.allows_early_exercise:
+            # Intrinsic. NOTE: Payoff strategies accept the 1D layer of node spots.
+            intrinsic = instrument.calculate_payoff_into(self._spot_prices, scratch)
+            instrument.apply_exercise_condition_inplace(intrinsic, continuation)
+        return continuation
+
+# Lattices cached per thread, keyed by step count. Engines are shared between the
+# threads of a service, and lattice buffers are mutable, so they cannot be shared.
+_thread_lattices = threading.local()
+_LATTICES_PER_THREAD: Final[int] = 8
 
 class BinomialPricingEngine(PricingEngine):
     
     @validate_positive("step_count")
-    def __init__(self, step_count: int = 1000):
+    def __init__(self, step_count: int = 1000, backend: str = "auto"):
+        """
+        Args:
+            step_count: Number of lattice time steps.
+            backend: "numpy", "numba" or "auto" (Numba when installed). The Numba
+                backend runs plain call/put contracts through a fused in-place kernel;
+                other payoffs always use the NumPy lattice.
+        """
         self._steps: Final[int] = step_count
+        self._backend: Final[str] = kernels.resolve_backend(backend)
+
+    @property
+    def configuration(self) -> Tuple[Any, ...]:
+        return (type(self).__name__, self._steps, self._backend)
+
+    @property
+    def step_count(self) -> int:
+        return self._steps
+
+    @property
+    def backend(self) -> str:
+        return self._backend
 
     def price(self, instrument: ValuationInstrument, market_state: MarketState) -> float:
-        if not isinstance(instrument, VanillaOption):
-             raise TypeError("BinomialEngine currently requires VanillaOption (composed)")
+        if self._backend == "numba" and is_plain_vanilla(instrument):
+            with instrumentation.span("binomial.rollback"):
+                price, _, _ = rollback_vanilla_batch(
+                    **_vanilla_columns([instrument], market_state), steps=self._steps, backend=self._backend
+                )
+            return float(price[0])
+
+        values, _, _, _ = self._rollback(instrument, market_state)
+        return float(values[0])
 
-        params = BinomialParameterizer.calculate(
-            market_state, 
-            instrument.expiration_time, 
-            self._steps
+    def price_batch(self,
+                    instruments: InstrumentBatch,
+                    market: Union[MarketState, MarketStateBatch]) -> np.ndarray:
+        """All rows are rolled back together as columns of one lattice."""
+        if not np.all(instruments.is_vanilla):
+            raise TypeError("BinomialEngine currently requires VanillaOption (composed)")
+        m = market_columns(market, len(instruments))
+        price, _, _ = rollback_vanilla_batch(
+            spot=m.spot_price,
+            strike=instruments.strike,
+            expiry=instruments.expiry,
+            rate=m.risk_free_rate,
+            volatility=m.volatility,
+            dividend_yield=m.dividend_yield,
+            is_call=instruments.is_call,
+            is_american=instruments.is_american,
+            steps=self._steps,
+            backend=self._backend,
         )
-        
-        lattice = BinomialLattice(
-            market_state, 
-            params, 
-            self._steps
+        return price
+
+    def price_with_greeks(self, instrument: ValuationInstrument, market_state: MarketState) -> BinomialGreeks:
+        """
+        Prices the instrument and reads delta, gamma and theta from the node values
+        at steps 1 and 2, so the Greeks cost no extra rollback.
+        """
+        if self._steps < 2:
+            raise ValueError("Tree Greeks require at least 2 lattice steps")
+        if self._backend == "numba" and is_plain_vanilla(instrument):
+            return self.price_with_greeks_batch([instrument], market_state)[0]
+
+        values, layer_1, layer_2, params = self._rollback(instrument, market_state)
+        dt = instrument.expiration_time / self._steps
+        price, delta, gamma, theta = _tree_greeks(
+            values[0], layer_1, layer_2, market_state.spot_price, params.u, dt
         )
+        return BinomialGreeks(float(price), float(delta), float(gamma), float(theta))
+
+    def price_with_greeks_batch(self,
+                                instruments: Sequence[ValuationInstrument],
+                                market_state: MarketState) -> List[BinomialGreeks]:
+        """
+        Tree Greeks for many contracts at once.
+
+        Plain call/put contracts with European or American exercise are rolled back
+        together as columns of one lattice (each column with its own strike and
+        expiry). Anything else falls back to `price_with_greeks`.
+        """
+        if self._steps < 2:
+            raise ValueError("Tree Greeks require at least 2 lattice steps")
+
+        results: List[Any] = [None] * len(instruments)
+        batch_index = [i for i, inst in enumerate(instruments) if is_plain_vanilla(inst)]
+
+        if batch_index:
+            columns = _vanilla_columns([instruments[i] for i in batch_index], market_state)
+            values, layer_1, layer_2 = rollback_vanilla_batch(
+                **columns, steps=self._steps, backend=self._backend
+            )
+            dt = columns["expiry"] / self._steps
+            u = np.exp(market_state.volatility * np.sqrt(dt))
+            price, delta, gamma, theta = _tree_greeks(
+                values, layer_1, layer_2, market_state.spot_price, u, dt
+            )
+            for j, i in enumerate(batch_index):
+                results[i] = BinomialGreeks(float(price[j]), float(delta[j]), float(gamma[j]), float(theta[j]))
+
+        for i, inst in enumerate(instruments):
+            if results[i] is None:
+                results[i] = self.price_with_greeks(inst, market_state)
+        return results
+
+    def _rollback(self, instrument: ValuationInstrument, market_state: MarketState):
+        """Full rollback. Returns root values plus the node values at steps 1 and 2."""
+        if not isinstance(instrument, VanillaOption):
+             raise TypeError("BinomialEngine currently requires VanillaOption (composed)")
+
+        instrumentation.increment("binomial.steps", self._steps)
+        instrumentation.increment("binomial.nodes", (self._steps + 1) * (self._steps + 2) // 2)
+
+        with instrumentation.span("binomial.setup"):
+            params = BinomialParameterizer.calculate(
+                market_state, 
+                instrument.expiration_time, 
+                self._steps
+            )
+            lattice = BinomialLattice.acquire(self._steps).reset(market_state, params)
+            
+            # Terminal Values
+            values = lattice.terminal_values(instrument)
+        layer_1 = layer_2 = None
         
-        # Terminal Values
-        # Pass 1D array of spots.
-        values = instrument.calculate_payoff(lattice._spot_prices)
-        
-        # Rollback
-        for _ in range(self._steps):
-            values = lattice.backward_induction_step(values, instrument)
+        # Rollback. `step` is the time layer the values belong to after the update.
+        # Each step overwrites the lattice buffer, so the layers kept for the Greeks
+        # are copied out.
+        with instrumentation.span("binomial.rollback"):
+            for step in range(self._steps - 1, -1, -1):
+                values = lattice.backward_induction_step(values, instrument)
+                if step == 2:
+                    layer_2 = values.copy()
+                elif step == 1:
+                    layer_1 = values.copy()
             
-        return float(values[0])
+        values = values.copy()
+        return values, layer_1, layer_2, params
+
+def is_plain_vanilla(instrument: ValuationInstrument) -> bool:
+    return (
+        isinstance(instrument, VanillaOption)
+        and type(instrument.payoff_strategy) in (CallPayoff, PutPayoff)
+        and type(instrument.exercise_strategy) in (EuropeanExercise, AmericanExercise)
+    )
+
+def _vanilla_columns(instruments: Sequence[VanillaOption], market_state: MarketState) -> dict:
+    """Keyword arguments of `rollback_vanilla_batch` for plain contracts in one market."""
+    n = len(instruments)
+    return dict(
+        spot=np.full(n, market_state.spot_price),
+        strike=np.array([inst.strike for inst in instruments], dtype=float),
+        expiry=np.array([inst.expiration_time for inst in instruments], dtype=float),
+        rate=np.full(n, market_state.risk_free_rate),
+        volatility=np.full(n, market_state.volatility),
+        dividend_yield=np.full(n, market_state.dividend_yield),
+        is_call=np.array([isinstance(inst.payoff_strategy, CallPayoff) for inst in instruments]),
+        is_american=np.array([isinstance(inst.exercise_strategy, AmericanExercise) for inst in instruments]),
+    )
+
+def _tree_greeks(price, layer_1, layer_2, spot, u, dt):
+    """
+    Finite differences on the lattice nodes around the root.
+    Works elementwise, so the inputs may carry a trailing batch axis.
+    """
+    d = 1.0 / u
+    s_u, s_d = spot * u, spot * d
+    s_uu, s_dd = spot * u * u, spot * d * d
+
+    delta = (layer_1[0] - layer_1[1]) / (s_u - s_d)
+    gamma = (
+        (layer_2[0] - layer_2[1]) / (s_uu - spot) - (layer_2[1] - layer_2[2]) / (spot - s_dd)
+    ) / (0.5 * (s_uu - s_dd))
+    # The middle node at step 2 has the same spot as the root, two steps later.
+    theta = (layer_2[1] - price) / (2.0 * dt)
+    return price, delta, gamma, theta
+
+def rollback_vanilla_batch(spot: np.ndarray,
+                           strike: np.ndarray,
+                           expiry: np.ndarray,
+                           rate: np.ndarray,
+                           volatility: np.ndarray,
+                           dividend_yield: np.ndarray,
+                           is_call: np.ndarray,
+                           is_american: np.ndarray,
+                           steps: int,
+                           chunk_size: int = 512,
+                           backend: str = "numpy"):
+    """
+    CRR rollback of many plain call/put contracts as columns of one lattice.
+
+    All inputs are 1D arrays of equal length k (one entry per contract); every column
+    has its own spot, strike, expiry and market parameters. Columns are processed in
+    chunks of `chunk_size` to bound the [steps + 1, chunk] working set. With
+    backend="numba" each column is rolled back by the fused kernel instead.
+
+    Returns:
+        (price[k], layer_1[2, k], layer_2[3, k]); the layers are the node values at
+        steps 1 and 2, ordered from the highest spot down. When steps < 2 the
+        missing layers are returned filled with NaN.
+    """
+    k = len(spot)
+    price = np.empty(k)
+    layer_1 = np.full((2, k), np.nan)
+    layer_2 = np.full((3, k), np.nan)
+
+    instrumentation.increment("binomial.steps", steps)
+    instrumentation.increment("binomial.nodes", k * (steps + 1) * (steps + 2) // 2)
+
+    kernel = kernels.get_kernel("binomial_rollback_batch") if backend == "numba" else None
+    if kernel is not None:
+        dt = expiry / steps
+        u = np.exp(volatility * np.sqrt(dt))
+        d = 1.0 / u
+        p = (np.exp((rate - dividend_yield) * dt) - d) / (u - d)
+        df = np.exp(-rate * dt)
+        kernel(
+            np.ascontiguousarray(spot, dtype=float), np.ascontiguousarray(strike, dtype=float),
+            np.where(is_call, 1.0, -1.0), np.ascontiguousarray(is_american, dtype=np.bool_),
+            u, p * df, (1.0 - p) * df, steps, price, layer_1, layer_2,
+        )
+        return price, layer_1, layer_2
+
+    for start in range(0, k, chunk_size):
+        cols = slice(start, min(start + chunk_size, k))
+        dt = expiry[cols] / steps
+        log_u = volatility[cols] * np.sqrt(dt)
+        u = np.exp(log_u)
+        d = 1.0 / u
+        p = (np.exp((rate[cols] - dividend_yield[cols]) * dt) - d) / (u - d)
+        df = np.exp(-rate[cols] * dt)
+        q_df = (1.0 - p) * df
+        p_df = p * df
+
+        sign = np.where(is_call[cols], 1.0, -1.0)
+        exercise_weight = is_american[cols].astype(float)
+        any_american = bool(exercise_weight.any())
+        K = strike[cols]
+
+        # Node i at the terminal layer sits at spot * u^(steps - 2i).
+        powers = (steps - 2.0 * np.arange(steps + 1))[:, None]
+        spots = spot[cols] * np.exp(powers * log_u)
+        values = np.maximum(sign * (spots - K), 0.0)
+
+        for step in range(steps - 1, -1, -1):
+            values = p_df * values[:-1] + q_df * values[1:]
+            if any_american:
+                spots = spots[:-1] / u
+                intrinsic = np.maximum(sign * (spots - K), 0.0)
+                values = np.maximum(values, exercise_weight * intrinsic)
+            if step == 2:
+                layer_2[:, cols] = values
+            elif step == 1:
+                layer_1[:, cols] = values
+
+        price[cols] = values[0]
+
+    return price, layer_1, layer_2
@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, Final, Hashable, Mapping, Optional, Tuple
+
+from derivatives_pricer.domain.interfaces import ValuationInstrument
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.engines.interface import PricingEngine
+from derivatives_pricer.common import instrumentation
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time snapshot of cache counters."""
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class CachedPricingEngine(PricingEngine):
+    """
+    Memoizing decorator around any PricingEngine.
+
+    Prices are keyed on (instrument, market state, engine configuration). Instruments
+    and market states are frozen dataclasses, so they hash by value; the engine
+    contributes its `configuration` tuple, which includes the seed for Monte Carlo.
+
+    Entries are evicted least-recently-used once `max_size` is reached, and expire
+    `ttl` seconds after insertion when a TTL is set. All bookkeeping is guarded by a
+    lock; the wrapped engine runs outside the lock, so two threads missing on the same
+    key may both price it once.
+    """
+
+    def __init__(self,
+                 engine: PricingEngine,
+                 max_size: int = 4096,
+                 ttl: Optional[float] = None,
+                 market_quantum: Optional[Mapping[str, float]] = None):
+        """
+        Args:
+            engine: The engine whose prices are cached.
+            max_size: Maximum number of cached prices.
+            ttl: Lifetime of an entry in seconds. None keeps entries until evicted.
+            market_quantum: Optional tick size per MarketState field, e.g.
+                {"spot_price": 0.01, "volatility": 1e-4}. Inputs are rounded to the
+                nearest tick before lookup, and the rounded state is what gets priced,
+                so every state in a bucket shares one consistent price.
+        """
+        if max_size <= 0:
+            raise ValueError(f"Parameter 'max_size' must be positive, got {max_size}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Parameter 'ttl' must be positive, got {ttl}")
+
+        quantum = dict(market_quantum or {})
+        valid_fields = {f.name for f in fields(MarketState)}
+        unknown = set(quantum) - valid_fields
+        if unknown:
+            raise ValueError(f"Unknown MarketState fields in market_quantum: {sorted(unknown)}")
+        for name, tick in quantum.items():
+            if tick <= 0:
+                raise ValueError(f"Quantum for '{name}' must be positive, got {tick}")
+
+        self._engine: Final[PricingEngine] = engine
+        self._max_size: Final[int] = max_size
+        self._ttl: Final[Optional[float]] = ttl
+        self._quantum: Final[Dict[str, float]] = quantum
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def engine(self) -> PricingEngine:
+        return self._engine
+
+    @property
+    def configuration(self) -> Tuple[Any, ...]:
+        return self._engine.configuration
+
+    def price(self, instrument: ValuationInstrument, market_state: MarketState) -> float:
+        market_state = self._quantize(market_state)
+        key = (instrument, market_state, self._engine.configuration)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if self._ttl is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    instrumentation.increment("cache.hits")
+                    return value
+                del self._entries[key]
+                self._evictions += 1
+                instrumentation.increment("cache.evictions")
+            self._misses += 1
+        instrumentation.increment("cache.misses")
+
+        value = self._engine.price(instrument, market_state)
+
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else 0.0
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+                instrumentation.increment("cache.evictions")
+        return value
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def clear(self) -> None:
+        """Drops all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def _quantize(self, market_state: MarketState) -> MarketState:
+        if not self._quantum:
+            return market_state
+        rounded = {
+            name: round(getattr(market_state, name) / tick) * tick
+            for name, tick in self._quantum.items()
+        }
+        return replace(market_state, **rounded)
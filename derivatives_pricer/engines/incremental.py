@@ -0,0 +1,306 @@
+"""
+Incremental revaluation of a book on market updates.
+
+Every position depends on four named market inputs, by default
+"<underlying>.spot", "<underlying>.rate", "<underlying>.vol" and
+"<underlying>.dividend" (any of them can be renamed, e.g. to share one "USD.rate"
+across underlyings). IncrementalValuator keeps the graph from input names to
+positions, so an update only touches the positions that read a changed input and
+tick-to-risk latency grows with the number of affected trades, not the book size.
+
+Affected positions are fully repriced in one `engine.price_batch` call. With
+approximation thresholds, each full reprice also takes central-difference Greeks
+(the bumped markets ride in the same batch), and later moves that stay within the
+thresholds of that anchor are valued with the Taylor expansion
+
+    price ~ anchor + delta dS + gamma dS^2 / 2 + vega dvol + rho drate
+
+instead of the engine. Moves are measured from the anchor, not from the previous
+tick, so a drift of many small ticks still triggers a full reprice.
+"""
+import math
+import time
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from typing import Dict, Final, FrozenSet, Hashable, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+from derivatives_pricer.domain.interfaces import ValuationInstrument
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+from derivatives_pricer.instruments.batch import InstrumentBatch
+from derivatives_pricer.engines.interface import PricingEngine
+from derivatives_pricer.common import instrumentation
+
+MARKET_INPUTS: Final[Tuple[str, ...]] = ("spot", "rate", "vol", "dividend")
+
+_STATE_FIELDS: Final[Dict[str, str]] = {
+    "spot": "spot_price", "rate": "risk_free_rate", "vol": "volatility", "dividend": "dividend_yield",
+}
+# Central-difference bumps for the Greeks: relative for spot, absolute otherwise. Large
+# enough that lattice engines give smooth differences.
+_BUMPS: Final[Dict[str, float]] = {"spot": 0.01, "vol": 0.01, "rate": 0.001}
+
+@dataclass(frozen=True)
+class PositionValue:
+    """
+    Latest valuation of one position, per unit of quantity.
+
+    Attributes:
+        price: Unit price at `market`, from the engine or the Taylor approximation.
+        market: Market the price refers to.
+        anchor: Market of the last full reprice; the Greeks were taken there.
+        anchor_price: Engine price at `anchor`.
+        delta, gamma, vega, rho: Greeks at the anchor for the approximated inputs
+            (NaN for inputs that are always repriced).
+        exact: Whether `price` came from a full reprice.
+    """
+    price: float
+    market: MarketState
+    anchor: MarketState
+    anchor_price: float
+    delta: float
+    gamma: float
+    vega: float
+    rho: float
+    exact: bool
+
+@dataclass(frozen=True)
+class ValuationUpdate:
+    """Positions touched by one `IncrementalValuator.update` call."""
+    repriced: Tuple[Hashable, ...]
+    approximated: Tuple[Hashable, ...]
+    elapsed: float
+
+    @property
+    def affected(self) -> int:
+        return len(self.repriced) + len(self.approximated)
+
+@dataclass(frozen=True)
+class _Position:
+    instrument: ValuationInstrument
+    quantity: float
+    inputs: Tuple[str, ...]  # input name per MARKET_INPUTS entry
+    batchable: bool
+
+class IncrementalValuator:
+    """
+    Keeps prices and Greeks of a book current under named market input updates.
+
+    Register positions with `add_position`, then call `update` with the inputs that
+    moved (every input a position reads must have been given at least once before
+    it is first valued). New positions are valued on the next `update`.
+    """
+
+    def __init__(self, engine: PricingEngine, approximation_thresholds: Optional[Mapping[str, float]] = None):
+        """
+        Args:
+            engine: Engine used for full reprices (through `price_batch`).
+            approximation_thresholds: Largest move per input that is valued with the
+                Greeks instead of a reprice: relative for "spot", absolute for "vol"
+                and "rate". Inputs not listed (and "dividend") always reprice. None
+                reprices every affected position and computes no Greeks.
+        """
+        thresholds = dict(approximation_thresholds or {})
+        for name, threshold in thresholds.items():
+            if name not in _BUMPS:
+                raise ValueError(f"Cannot approximate input '{name}'; expected one of {sorted(_BUMPS)}")
+            if threshold <= 0:
+                raise ValueError(f"Threshold for '{name}' must be positive, got {threshold}")
+        self._engine: Final[PricingEngine] = engine
+        self._thresholds: Final[Dict[str, float]] = thresholds
+        self._inputs: Dict[str, float] = {}
+        self._positions: Dict[Hashable, _Position] = {}
+        self._dependents: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._values: Dict[Hashable, PositionValue] = {}
+        self._pending: Set[Hashable] = set()
+
+    @property
+    def engine(self) -> PricingEngine:
+        return self._engine
+
+    def add_position(self, key: Hashable, instrument: ValuationInstrument, underlying: str,
+                     quantity: float = 1.0, inputs: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Registers (or replaces) a position; it is valued on the next `update`.
+
+        Args:
+            underlying: Prefix of the default input names, "<underlying>.<input>".
+            inputs: Overrides of individual input names, e.g. {"rate": "USD.rate"}.
+        """
+        names = {name: f"{underlying}.{name}" for name in MARKET_INPUTS}
+        for name, input_name in (inputs or {}).items():
+            if name not in names:
+                raise ValueError(f"Unknown market input '{name}'; expected one of {MARKET_INPUTS}")
+            names[name] = input_name
+        if key in self._positions:
+            self.remove_position(key)
+        try:
+            InstrumentBatch.from_instruments([instrument])
+            batchable = True
+        except TypeError:
+            batchable = False
+        position = _Position(instrument, float(quantity), tuple(names[name] for name in MARKET_INPUTS), batchable)
+        self._positions[key] = position
+        for input_name in position.inputs:
+            self._dependents[input_name].add(key)
+        self._pending.add(key)
+
+    def remove_position(self, key: Hashable) -> None:
+        position = self._positions.pop(key)
+        for input_name in position.inputs:
+            self._dependents[input_name].discard(key)
+        self._values.pop(key, None)
+        self._pending.discard(key)
+
+    def dependents(self, input_name: str) -> FrozenSet[Hashable]:
+        """Keys of the positions that read `input_name`."""
+        return frozenset(self._dependents.get(input_name, ()))
+
+    def value(self, key: Hashable) -> PositionValue:
+        """Latest valuation of a position (KeyError until it has been valued)."""
+        return self._values[key]
+
+    def book_value(self) -> float:
+        """Sum of quantity * price over every valued position."""
+        return math.fsum(self._positions[key].quantity * value.price for key, value in self._values.items())
+
+    def update(self, changes: Optional[Mapping[str, float]] = None) -> ValuationUpdate:
+        """
+        Applies input changes and revalues the positions that depend on them, plus
+        any positions added since the last update.
+        """
+        start = time.perf_counter()
+        # Changes are staged and committed together with the new valuations, so a
+        # missing input or a pricing error leaves inputs and valuations as they were.
+        staged: Dict[str, float] = {}
+        for name, value in (changes or {}).items():
+            value = float(value)
+            if self._inputs.get(name) != value:
+                staged[name] = value
+
+        affected = set(self._pending)
+        for name in staged:
+            affected |= self._dependents.get(name, set())
+
+        full: List[Tuple[Hashable, MarketState]] = []
+        approximated: Dict[Hashable, PositionValue] = {}
+        with instrumentation.span("incremental.update"):
+            markets = {key: self._market(key, staged) for key in affected}
+            for key, market in markets.items():
+                previous = self._values.get(key)
+                if previous is not None and self._within_thresholds(previous.anchor, market):
+                    approximated[key] = _approximate(previous, market)
+                else:
+                    full.append((key, market))
+            repriced = self._reprice(full)
+        self._inputs.update(staged)
+        self._values.update(approximated)
+        self._values.update(repriced)
+        self._pending.clear()
+
+        instrumentation.increment("incremental.repriced", len(full))
+        instrumentation.increment("incremental.approximated", len(approximated))
+        return ValuationUpdate(
+            repriced=tuple(key for key, _ in full),
+            approximated=tuple(approximated),
+            elapsed=time.perf_counter() - start,
+        )
+
+    def _market(self, key: Hashable, staged: Mapping[str, float]) -> MarketState:
+        """Market of a position from the staged changes, falling back to the current inputs."""
+        values = []
+        for input_name in self._positions[key].inputs:
+            value = staged.get(input_name, self._inputs.get(input_name))
+            if value is None:
+                raise KeyError(f"Market input '{input_name}' needed by position {key!r} has not been set")
+            values.append(value)
+        spot, rate, vol, dividend = values
+        return MarketState(spot_price=spot, risk_free_rate=rate, volatility=vol, dividend_yield=dividend)
+
+    def _within_thresholds(self, anchor: MarketState, market: MarketState) -> bool:
+        for name, field in _STATE_FIELDS.items():
+            move = getattr(market, field) - getattr(anchor, field)
+            if move == 0.0:
+                continue
+            threshold = self._thresholds.get(name)
+            if threshold is None:
+                return False
+            if name == "spot":
+                move /= anchor.spot_price
+            if abs(move) > threshold:
+                return False
+        return True
+
+    def _reprice(self, items: List[Tuple[Hashable, MarketState]]) -> Dict[Hashable, PositionValue]:
+        """Prices each position at its market and, with thresholds, at the bumped markets."""
+        if not items:
+            return {}
+        bumps = [(name, step) for name, step in _BUMPS.items() if name in self._thresholds]
+        instruments: List[ValuationInstrument] = []
+        markets: List[MarketState] = []
+        batchable: List[bool] = []
+        for key, market in items:
+            position = self._positions[key]
+            scenarios = [market]
+            for name, step in bumps:
+                scenarios.extend(_bumped(market, name, step, sign) for sign in (1.0, -1.0))
+            instruments.extend([position.instrument] * len(scenarios))
+            markets.extend(scenarios)
+            batchable.extend([position.batchable] * len(scenarios))
+
+        prices = self._price(instruments, markets, np.array(batchable, dtype=bool)).reshape(len(items), 1 + 2 * len(bumps))
+        values: Dict[Hashable, PositionValue] = {}
+        for (key, market), row in zip(items, prices):
+            greeks = {"delta": math.nan, "gamma": math.nan, "vega": math.nan, "rho": math.nan}
+            for n, (name, step) in enumerate(bumps):
+                up, down = row[1 + 2 * n], row[2 + 2 * n]
+                h = _bump_size(market, name, step)
+                if name == "spot":
+                    greeks["delta"] = (up - down) / (2 * h)
+                    greeks["gamma"] = (up - 2 * row[0] + down) / (h * h)
+                else:
+                    greeks["vega" if name == "vol" else "rho"] = (up - down) / (2 * h)
+            values[key] = PositionValue(
+                price=float(row[0]), market=market, anchor=market, anchor_price=float(row[0]),
+                exact=True, **{name: float(value) for name, value in greeks.items()}
+            )
+        return values
+
+    def _price(self, instruments: List[ValuationInstrument], markets: List[MarketState],
+               batchable: np.ndarray) -> np.ndarray:
+        """One price_batch call for the columnar contracts, `price` for the rest."""
+        out = np.empty(len(instruments))
+        rows = np.flatnonzero(batchable)
+        if len(rows):
+            out[rows] = self._engine.price_batch(
+                InstrumentBatch.from_instruments([instruments[i] for i in rows]),
+                MarketStateBatch.from_states([markets[i] for i in rows]),
+            )
+        for i in np.flatnonzero(~batchable):
+            out[i] = self._engine.price(instruments[i], markets[i])
+        return out
+
+def _bump_size(market: MarketState, name: str, step: float) -> float:
+    if name == "spot":
+        return market.spot_price * step
+    if name == "vol":
+        # Keep the down-bumped volatility positive.
+        return min(step, 0.5 * market.volatility)
+    return step
+
+def _bumped(market: MarketState, name: str, step: float, sign: float) -> MarketState:
+    field = _STATE_FIELDS[name]
+    return replace(market, **{field: getattr(market, field) + sign * _bump_size(market, name, step)})
+
+def _approximate(previous: PositionValue, market: MarketState) -> PositionValue:
+    anchor = previous.anchor
+    d_spot = market.spot_price - anchor.spot_price
+    price = previous.anchor_price
+    if d_spot:
+        price += previous.delta * d_spot + 0.5 * previous.gamma * d_spot * d_spot
+    if market.volatility != anchor.volatility:
+        price += previous.vega * (market.volatility - anchor.volatility)
+    if market.risk_free_rate != anchor.risk_free_rate:
+        price += previous.rho * (market.risk_free_rate - anchor.risk_free_rate)
+    return replace(previous, price=float(price), market=market, exact=False)
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Final
+from typing import Any, Final, Tuple, Union, TYPE_CHECKING
+
+import numpy as np
 
 from derivatives_pricer.domain.interfaces import ValuationInstrument
-from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+
+if TYPE_CHECKING:
+    from derivatives_pricer.instruments.batch import InstrumentBatch
 
 class PricingEngine(ABC):
     """
@@ -16,3 +21,44 @@ class PricingEngine(ABC):
         Calculates the fair value of the instrument given the market state.
         """
         pass
+
+    @property
+    def configuration(self) -> Tuple[Any, ...]:
+        """
+        Hashable description of every setting that affects the engine's prices.
+        Two engines with equal configurations must return equal prices for the
+        same inputs; caches rely on this.
+        """
+        return (type(self).__name__,)
+
+    def price_batch(self,
+                    instruments: "InstrumentBatch",
+                    market: Union[MarketState, MarketStateBatch]) -> np.ndarray:
+        """
+        Prices every row of a columnar batch.
+
+        `market` is either one MarketState shared by all rows or a MarketStateBatch
+        with one market per row. This default materializes each contract and calls
+        `price`; engines with a vectorized path override it.
+        """
+        markets = _row_markets(market, len(instruments))
+        return np.array(
+            [self.price(instruments.instrument(i), markets(i)) for i in range(len(instruments))],
+            dtype=np.float64,
+        )
+
+def _row_markets(market: Union[MarketState, MarketStateBatch], rows: int):
+    """Function returning the MarketState of row i."""
+    if isinstance(market, MarketState):
+        return lambda i: market
+    if len(market) != rows:
+        raise ValueError(f"MarketStateBatch has {len(market)} rows, instruments have {rows}")
+    return market.state
+
+def market_columns(market: Union[MarketState, MarketStateBatch], rows: int) -> MarketStateBatch:
+    """Per-row market columns; a single MarketState is broadcast without copying."""
+    if isinstance(market, MarketState):
+        return MarketStateBatch.broadcast(market, rows)
+    if len(market) != rows:
+        raise ValueError(f"MarketStateBatch has {len(market)} rows, instruments have {rows}")
+    return market
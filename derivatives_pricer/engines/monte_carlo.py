@@ -1,68 +1,453 @@
+import time
 import numpy as np
-from typing import Final
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Final, List, Optional, Sequence, Tuple
 from abc import ABC, abstractmethod
 
 from derivatives_pricer.domain.interfaces import ValuationInstrument
 from derivatives_pricer.domain.market import MarketState
 from derivatives_pricer.engines.interface import PricingEngine
 from derivatives_pricer.common.validation import validate_positive
+from derivatives_pricer.common import instrumentation
+from derivatives_pricer.domain.enums import BarrierType
+from derivatives_pricer.domain.exercise import AmericanExercise
+from derivatives_pricer.domain.payoff import CallPayoff, PutPayoff, BarrierPayoff, AsianPayoff
+from derivatives_pricer.domain.payoff_set import PayoffSet, PathStatistics
+from derivatives_pricer.math import kernels
+from derivatives_pricer.math.statistics import RunningMoments
 
 class StochasticProcess(ABC):
     @abstractmethod
-    def simulate_paths(self, T: float, steps: int, paths: int) -> np.ndarray:
+    def simulate_paths(self, T: float, steps: int, paths: int,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
         pass
 
 class GeometricBrownianMotion(StochasticProcess):
-    def __init__(self, market: MarketState):
+    def __init__(self, market: MarketState, dtype: np.dtype = np.float64):
+        """
+        Args:
+            market: Market parameters of the underlying.
+            dtype: Floating type of the simulated paths (float64 or float32).
+        """
         self._S0 = market.spot_price
         self._r = market.risk_free_rate
         self._q = market.dividend_yield
         self._sigma = market.volatility
+        self._dtype = _simulation_dtype(dtype)
 
-    def simulate_paths(self, T: float, steps: int, paths: int) -> np.ndarray:
-        """Returns full path matrix [steps, paths]"""
-        dt = T / steps
-        drift = (self._r - self._q - 0.5 * self._sigma**2) * dt
-        diffusion = self._sigma * np.sqrt(dt)
-        
+    def simulate_paths(self, T: float, steps: int, paths: int,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Returns full path matrix [steps, paths] in the process dtype.
+        Draws from `rng` when given, otherwise from the global NumPy state.
+        """
         # Paths including S0?
         # Standard MC often just needs steps.
         # [0] = S0
         # [1] = S0 * exp(...)
         
-        Z = np.random.standard_normal((steps, paths))
-        log_returns = drift + diffusion * Z
+        Z = self.draw_shocks(steps, paths, rng)
+        return self.paths_from_shocks(Z, T, out=Z)
+
+    def draw_shocks(self, steps: int, paths: int,
+                    rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Standard normal shocks [steps, paths] in the process dtype."""
+        return _normal_source(self._dtype, rng)((steps, paths))
+
+    def paths_from_shocks(self, shocks: np.ndarray, T: float,
+                          out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Maps standard normal shocks [steps, paths] to prices [steps, paths].
+        Feeding the same shocks to several processes gives common random numbers.
+        Pass `out=shocks` to transform in place.
+        """
+        steps = shocks.shape[0]
+        dt = T / steps
+        drift = (self._r - self._q - 0.5 * self._sigma**2) * dt
+        diffusion = self._sigma * np.sqrt(dt)
+
+        if out is None:
+            out = np.array(shocks, dtype=self._dtype)
+        elif out is not shocks:
+            np.copyto(out, shocks)
+
+        # Transform in place so no float64 temporaries appear in float32 mode.
+        # log_returns = drift + diffusion * Z
+        out *= diffusion
+        out += drift
         
         # Cumulative Sum for paths
-        cumulative_log_returns = np.cumsum(log_returns, axis=0)
+        np.cumsum(out, axis=0, out=out)
         
         # Broadcast S0
         # prices[i] = S0 * exp(cum_ret[i])
-        prices = self._S0 * np.exp(cumulative_log_returns)
+        np.exp(out, out=out)
+        out *= self._S0
         
-        return prices
+        return out
+
+def _simulation_dtype(dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"Simulation dtype must be float32 or float64, got {dtype}")
+    return dtype
+
+def _normal_source(dtype: np.dtype, rng: Optional[np.random.Generator]) -> Callable[[Any], np.ndarray]:
+    """
+    Returns a function drawing standard normals of the given shape and dtype.
+    Consecutive draws continue one stream, so drawing row by row reproduces a single
+    [steps, paths] draw exactly.
+    """
+    if rng is None:
+        if dtype == np.float64:
+            return np.random.standard_normal
+        # The legacy global generator only produces float64. Derive a Generator from it
+        # so np.random.seed still controls reproducibility.
+        rng = np.random.default_rng(np.random.randint(np.iinfo(np.int64).max, dtype=np.int64))
+    return lambda shape: rng.standard_normal(shape, dtype=dtype)
+
+def _require_european(instrument: ValuationInstrument, engine: str) -> None:
+    """Path simulation values European exercise only; early exercise needs a lattice engine."""
+    if isinstance(getattr(instrument, "exercise_strategy", None), AmericanExercise):
+        raise TypeError(f"{engine} does not support American exercise")
+
+@dataclass(frozen=True)
+class MonteCarloEstimate:
+    """
+    Discounted Monte Carlo price with its statistical error.
+
+    Attributes:
+        price: Discounted mean payoff.
+        standard_error: Standard error of `price`.
+        paths: Number of simulated paths.
+        batches: Number of simulation batches.
+        elapsed: Wall-clock seconds spent simulating.
+        converged: Whether the engine's error target was met (always True without one).
+    """
+    price: float
+    standard_error: float
+    paths: int
+    batches: int
+    elapsed: float
+    converged: bool
 
 class MonteCarloEngine(PricingEngine):
     
     @validate_positive("num_paths")
     @validate_positive("num_steps")
-    def __init__(self, num_paths: int = 10000, num_steps: int = 100):
+    @validate_positive("abs_tol")
+    @validate_positive("rel_tol")
+    @validate_positive("time_budget")
+    @validate_positive("max_paths")
+    def __init__(self, num_paths: int = 10000, num_steps: int = 100, seed: Optional[int] = None,
+                 dtype: np.dtype = np.float64, backend: str = "auto",
+                 abs_tol: Optional[float] = None, rel_tol: Optional[float] = None,
+                 time_budget: Optional[float] = None, max_paths: Optional[int] = None):
+        """
+        Args:
+            num_paths: Number of simulated paths; the batch size in adaptive mode.
+            num_steps: Number of time steps per path.
+            seed: If given, every `price` call restarts from this seed, making the
+                engine deterministic. If None, the global NumPy state is used.
+            dtype: Precision of path generation and payoff evaluation, on either
+                backend. float32 halves memory traffic; the payoff mean and discounting
+                are always float64.
+            backend: "numpy", "numba" or "auto" (Numba when installed). The Numba
+                backend fuses path generation with payoff accumulation for vanilla,
+                barrier and Asian payoffs and never stores the path matrix; it draws
+                the same shocks as the NumPy backend. Other payoffs use the NumPy
+                simulation.
+            abs_tol, rel_tol: Adaptive mode. Batches of `num_paths` are simulated
+                until the standard error is at most `abs_tol + rel_tol * |price|`
+                (at least two batches, so the error estimate itself is stable).
+            time_budget: Adaptive mode. Stop after the batch that exceeds this many
+                seconds of wall-clock time, converged or not.
+            max_paths: Cap on paths per price in adaptive mode; defaults to
+                1000 * num_paths when no time budget is given.
+        """
         self._num_paths: Final[int] = num_paths
         self._num_steps: Final[int] = num_steps
+        self._seed: Final[Optional[int]] = seed
+        self._dtype: Final[np.dtype] = _simulation_dtype(dtype)
+        self._backend: Final[str] = kernels.resolve_backend(backend)
+        self._abs_tol: Final[Optional[float]] = abs_tol
+        self._rel_tol: Final[Optional[float]] = rel_tol
+        self._time_budget: Final[Optional[float]] = time_budget
+        if max_paths is None and time_budget is None:
+            max_paths = 1000 * num_paths
+        self._max_paths: Final[Optional[int]] = max_paths
+
+    @property
+    def configuration(self) -> Tuple[Any, ...]:
+        return (type(self).__name__, self._num_paths, self._num_steps, self._seed, self._dtype.name,
+                self._backend, self._abs_tol, self._rel_tol, self._time_budget, self._max_paths)
+
+    @property
+    def num_paths(self) -> int:
+        return self._num_paths
+
+    @property
+    def num_steps(self) -> int:
+        return self._num_steps
+
+    @property
+    def seed(self) -> Optional[int]:
+        return self._seed
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def adaptive(self) -> bool:
+        """True when prices are simulated in batches until an error or time target is met."""
+        return self._abs_tol is not None or self._rel_tol is not None or self._time_budget is not None
+
+    def make_rng(self) -> Optional[np.random.Generator]:
+        """Fresh generator for one pricing call, or None to use the global state."""
+        return None if self._seed is None else np.random.default_rng(self._seed)
 
     def price(self, instrument: ValuationInstrument, market_state: MarketState) -> float:
-        process = GeometricBrownianMotion(market_state)
+        return self.estimate(instrument, market_state).price
+
+    def estimate(self, instrument: ValuationInstrument, market_state: MarketState) -> MonteCarloEstimate:
+        """
+        Price plus standard error, paths used and time spent.
+
+        Without an error or time target this is one batch of `num_paths`. In adaptive
+        mode batches share one random stream and their moments are merged as they
+        arrive, so a seeded engine is still deterministic.
+        """
+        _require_european(instrument, type(self).__name__)
+        return self._run_batches(
+            instrument.expiration_time, market_state,
+            lambda rng: [self._simulate_batch(instrument, market_state, rng)]
+        )[0]
+
+    def price_many(self, instruments: Sequence[ValuationInstrument], market_state: MarketState) -> List[float]:
+        """Prices of several instruments on one underlying; see `estimate_many`."""
+        return [estimate.price for estimate in self.estimate_many(instruments, market_state)]
+
+    def estimate_many(self, instruments: Sequence[ValuationInstrument],
+                      market_state: MarketState) -> List[MonteCarloEstimate]:
+        """
+        Estimates for several instruments from one simulation per distinct expiry.
+
+        Each expiry's payoffs are evaluated together by a PayoffSet, so a book of
+        strikes and barrier levels costs about one payoff pass. Every expiry group
+        starts from the engine's seed, so a seeded engine gives each instrument the
+        paths `estimate` would. In adaptive mode batches continue until every
+        instrument in the group meets the error target.
+        """
+        instruments = list(instruments)
+        groups: Dict[float, List[int]] = {}
+        for row, instrument in enumerate(instruments):
+            _require_european(instrument, type(self).__name__)
+            groups.setdefault(instrument.expiration_time, []).append(row)
+
+        results: List[Optional[MonteCarloEstimate]] = [None] * len(instruments)
+        for T, rows in groups.items():
+            payoff_set = PayoffSet([
+                getattr(instruments[row], "payoff_strategy", None) or instruments[row].calculate_payoff
+                for row in rows
+            ])
+            estimates = self._run_batches(
+                T, market_state, lambda rng: self._simulate_set_batch(payoff_set, T, market_state, rng)
+            )
+            for row, estimate in zip(rows, estimates):
+                results[row] = estimate
+        return results
+
+    def _run_batches(self, T: float, market_state: MarketState,
+                     simulate: Callable[[Optional[np.random.Generator]], List[RunningMoments]]
+                     ) -> List[MonteCarloEstimate]:
+        """Runs batches of `simulate` (payoff moments per instrument) until the stopping rule holds."""
+        rng = self.make_rng()
+        discount_factor = np.exp(-market_state.risk_free_rate * T)
+        moments: Optional[List[RunningMoments]] = None
+        batches = 0
+        start = time.perf_counter()
+
+        while True:
+            batch = simulate(rng)
+            moments = batch if moments is None else [total.merge(part) for total, part in zip(moments, batch)]
+            batches += 1
+            elapsed = time.perf_counter() - start
+            errors = [discount_factor * m.standard_error for m in moments]
+            converged = all(self._error_target_met(discount_factor * m.mean, error, batches)
+                            for m, error in zip(moments, errors))
+            paths = moments[0].count
+            if (converged
+                    or (self._time_budget is not None and elapsed >= self._time_budget)
+                    or (self._max_paths is not None and paths + self._num_paths > self._max_paths)):
+                break
+
+        instrumentation.increment("monte_carlo.batches", batches)
+        return [
+            MonteCarloEstimate(
+                price=float(m.mean * discount_factor),
+                standard_error=float(error),
+                paths=m.count,
+                batches=batches,
+                elapsed=elapsed,
+                converged=converged,
+            )
+            for m, error in zip(moments, errors)
+        ]
+
+    def _error_target_met(self, price: float, standard_error: float, batches: int) -> bool:
+        if not self.adaptive:
+            return True
+        if self._abs_tol is None and self._rel_tol is None:
+            return False
+        if batches < 2:
+            return False
+        target = (self._abs_tol or 0.0) + (self._rel_tol or 0.0) * abs(price)
+        return standard_error <= target
+
+    def _simulate_batch(self, instrument: ValuationInstrument, market_state: MarketState,
+                        rng: Optional[np.random.Generator]) -> RunningMoments:
+        """Undiscounted payoff moments of one batch of `num_paths` paths."""
+        if self._backend == "numba":
+            moments = self._simulate_fused(instrument, market_state, rng)
+            if moments is not None:
+                return moments
+
+        process = GeometricBrownianMotion(market_state, self._dtype)
+        instrumentation.increment("monte_carlo.paths", self._num_paths)
         
         # Get full paths [steps x paths]
-        paths = process.simulate_paths(
-            T=instrument.expiration_time,
-            steps=self._num_steps,
-            paths=self._num_paths
-        )
+        with instrumentation.span("monte_carlo.simulate"):
+            paths = process.simulate_paths(
+                T=instrument.expiration_time,
+                steps=self._num_steps,
+                paths=self._num_paths,
+                rng=rng
+            )
         
         # Pass paths to instrument.
         # Instrument strategy handles 1D vs 2D.
-        payoffs = instrument.calculate_payoff(paths)
+        with instrumentation.span("monte_carlo.payoff"):
+            payoffs = instrument.calculate_payoff(paths)
         
-        discount_factor = np.exp(-market_state.risk_free_rate * instrument.expiration_time)
-        return float(np.mean(payoffs) * discount_factor)
+        with instrumentation.span("monte_carlo.discount"):
+            return RunningMoments.from_samples(payoffs)
+
+    def _simulate_fused(self, instrument: ValuationInstrument, market_state: MarketState,
+                        rng: Optional[np.random.Generator]) -> Optional[RunningMoments]:
+        """
+        Simulates through the fused Numba kernels, or returns None if the payoff is not supported.
+
+        Shocks are drawn one time step at a time from the same stream the NumPy path
+        uses, and each row is folded straight into per-path running statistics, so both
+        backends see identical paths while only O(paths) memory is live.
+        """
+        spec = _fused_payoff_spec(instrument)
+        if spec is None:
+            return None
+        payoff_kernel = kernels.get_kernel("path_payoff_moments")
+        if payoff_kernel is None:
+            return None
+
+        accumulated = self._accumulate_fused(instrument.expiration_time, market_state, rng)
+        if accumulated is None:
+            return None
+        with instrumentation.span("monte_carlo.fused"):
+            total, total_sq = payoff_kernel(market_state.spot_price, self._num_steps, *accumulated, *spec)
+        return RunningMoments.from_sums(self._num_paths, total, total_sq)
+
+    def _accumulate_fused(self, T: float, market_state: MarketState, rng: Optional[np.random.Generator]
+                          ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Per-path (log return, max, min, sum) relative to S0 from the fused step kernel,
+        in the engine dtype, or None without Numba.
+        """
+        step_kernel = kernels.get_kernel("gbm_accumulate_step")
+        if step_kernel is None:
+            return None
+        # The per-path state and step constants carry the engine dtype, so the kernel
+        # is specialised for float32 just like the NumPy simulation.
+        dtype = self._dtype
+        dt = T / self._num_steps
+        sigma = market_state.volatility
+        drift = dtype.type((market_state.risk_free_rate - market_state.dividend_yield - 0.5 * sigma**2) * dt)
+        diffusion = dtype.type(sigma * np.sqrt(dt))
+        draw = _normal_source(dtype, rng)
+
+        n = self._num_paths
+        log_s = np.zeros(n, dtype=dtype)
+        running_max = np.full(n, -np.inf, dtype=dtype)
+        running_min = np.full(n, np.inf, dtype=dtype)
+        running_sum = np.zeros(n, dtype=dtype)
+
+        instrumentation.increment("monte_carlo.paths", n)
+        with instrumentation.span("monte_carlo.fused"):
+            for _ in range(self._num_steps):
+                step_kernel(draw(n), drift, diffusion, log_s, running_max, running_min, running_sum)
+        return log_s, running_max, running_min, running_sum
+
+    def _simulate_set_batch(self, payoff_set: PayoffSet, T: float, market_state: MarketState,
+                            rng: Optional[np.random.Generator]) -> List[RunningMoments]:
+        """Undiscounted payoff moments of every member of `payoff_set` on one batch of paths."""
+        stats = None
+        paths = None
+        if self._backend == "numba" and not payoff_set.needs_paths:
+            accumulated = self._accumulate_fused(T, market_state, rng)
+            if accumulated is not None:
+                log_s, running_max, running_min, running_sum = accumulated
+                s0 = market_state.spot_price
+                stats = PathStatistics(
+                    terminal=s0 * np.exp(log_s),
+                    maximum=s0 * running_max,
+                    minimum=s0 * running_min,
+                    average=s0 * running_sum / self._num_steps,
+                )
+        if stats is None:
+            instrumentation.increment("monte_carlo.paths", self._num_paths)
+            with instrumentation.span("monte_carlo.simulate"):
+                paths = GeometricBrownianMotion(market_state, self._dtype).simulate_paths(
+                    T=T, steps=self._num_steps, paths=self._num_paths, rng=rng
+                )
+            stats = payoff_set.statistics(paths)
+
+        with instrumentation.span("monte_carlo.payoff"):
+            payoffs = payoff_set.evaluate_statistics(stats, paths)
+        return [RunningMoments.from_samples(row) for row in payoffs]
+
+_BARRIER_CODES = {
+    BarrierType.UP_AND_OUT: kernels.BARRIER_UP_AND_OUT,
+    BarrierType.UP_AND_IN: kernels.BARRIER_UP_AND_IN,
+    BarrierType.DOWN_AND_OUT: kernels.BARRIER_DOWN_AND_OUT,
+    BarrierType.DOWN_AND_IN: kernels.BARRIER_DOWN_AND_IN,
+}
+
+def _vanilla_sign(payoff) -> Optional[float]:
+    if type(payoff) is CallPayoff:
+        return 1.0
+    if type(payoff) is PutPayoff:
+        return -1.0
+    return None
+
+def _fused_payoff_spec(instrument: ValuationInstrument) -> Optional[Tuple[int, float, float, float, int]]:
+    """
+    Translates the instrument's payoff strategy into the kernel's
+    (payoff_kind, sign, strike, barrier, barrier_kind) arguments.
+    """
+    payoff = getattr(instrument, "payoff_strategy", None)
+
+    sign = _vanilla_sign(payoff)
+    if sign is not None:
+        return (kernels.PAYOFF_VANILLA, sign, float(payoff.strike), 0.0, 0)
+
+    if type(payoff) is BarrierPayoff:
+        sign = _vanilla_sign(payoff.underlying_payoff)
+        if sign is None:
+            return None
+        return (kernels.PAYOFF_BARRIER, sign, float(payoff.underlying_payoff.strike),
+                float(payoff.barrier), _BARRIER_CODES[payoff.barrier_type])
+
+    if type(payoff) is AsianPayoff:
+        sign = 1.0 if payoff.underlying_payoff_type == "Call" else -1.0
+        return (kernels.PAYOFF_ASIAN, sign, float(payoff.strike), 0.0, 0)
+
+    return None
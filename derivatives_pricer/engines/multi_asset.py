@@ -0,0 +1,158 @@
+"""
+Monte Carlo pricing of contracts on several correlated underlyings.
+
+Each asset follows its own GBM, and the Brownian drivers are correlated through a
+factor L with L @ L.T equal to the correlation matrix. L is computed once per
+correlation matrix (Cholesky, or a clipped eigendecomposition when the matrix is
+singular or slightly indefinite) and applied to all time steps of a chunk with one
+batched matmul. Paths are laid out [steps, assets, paths], so each asset's path
+values are contiguous and payoffs reduce over axis 1. Paths are simulated in chunks
+and payoff moments are merged as they arrive, so memory does not grow with the
+path count.
+"""
+import time
+from functools import lru_cache
+from typing import Any, Final, Optional, Tuple
+
+import numpy as np
+
+from derivatives_pricer.domain.interfaces import ValuationInstrument
+from derivatives_pricer.domain.market import MultiAssetMarketState
+from derivatives_pricer.engines.interface import PricingEngine
+from derivatives_pricer.engines.monte_carlo import (
+    StochasticProcess, MonteCarloEstimate, _normal_source, _require_european, _simulation_dtype
+)
+from derivatives_pricer.common.validation import validate_positive
+from derivatives_pricer.common import instrumentation
+from derivatives_pricer.math.statistics import RunningMoments
+
+@lru_cache(maxsize=64)
+def correlation_factor(correlation: Tuple[Tuple[float, ...], ...]) -> np.ndarray:
+    """
+    Read-only matrix L with L @ L.T equal to `correlation` (a tuple of rows).
+
+    Uses the Cholesky factor when the matrix is positive definite. Otherwise (perfect
+    correlations, or an estimated matrix that is slightly indefinite) negative
+    eigenvalues are clipped to zero, L = V sqrt(Lambda), and its rows are rescaled so
+    every asset keeps unit variance.
+    """
+    matrix = np.array(correlation, dtype=float)
+    try:
+        factor = np.linalg.cholesky(matrix)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        factor = eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+        factor /= np.linalg.norm(factor, axis=1, keepdims=True)
+    factor.flags.writeable = False
+    return factor
+
+class CorrelatedGBM(StochasticProcess):
+    def __init__(self, market: MultiAssetMarketState, dtype: np.dtype = np.float64):
+        """
+        Args:
+            market: Spots, volatilities, dividend yields and correlation of the assets.
+            dtype: Floating type of the simulated paths (float32 or float64).
+        """
+        self._market = market
+        self._dtype = _simulation_dtype(dtype)
+        self._factor = correlation_factor(market.correlation).astype(self._dtype)
+
+    @property
+    def num_assets(self) -> int:
+        return self._market.num_assets
+
+    def simulate_paths(self, T: float, steps: int, paths: int,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Returns prices [steps, assets, paths] in the process dtype.
+        Draws from `rng` when given, otherwise from the global NumPy state.
+        """
+        shocks = _normal_source(self._dtype, rng)((steps, self.num_assets, paths))
+        return self.paths_from_shocks(shocks, T)
+
+    def paths_from_shocks(self, shocks: np.ndarray, T: float) -> np.ndarray:
+        """Maps independent standard normal shocks [steps, assets, paths] to correlated prices."""
+        steps = shocks.shape[0]
+        dt = T / steps
+        market = self._market
+        sigma = market.volatility_array
+        drift = ((market.risk_free_rate - market.dividend_array - 0.5 * sigma**2) * dt).astype(self._dtype)
+        diffusion = (sigma * np.sqrt(dt)).astype(self._dtype)
+
+        # One batched matmul correlates every step: [a, a] @ [steps, a, paths].
+        out = np.matmul(self._factor, shocks)
+        out *= diffusion[:, None]
+        out += drift[:, None]
+        if steps > 1:
+            np.cumsum(out, axis=0, out=out)
+        np.exp(out, out=out)
+        out *= market.spot_array.astype(self._dtype)[:, None]
+        return out
+
+class MultiAssetMonteCarloEngine(PricingEngine):
+
+    @validate_positive("num_paths")
+    @validate_positive("num_steps")
+    @validate_positive("chunk_size")
+    def __init__(self, num_paths: int = 100000, num_steps: int = 1, seed: Optional[int] = None,
+                 dtype: np.dtype = np.float64, chunk_size: int = 8192):
+        """
+        Args:
+            num_paths: Number of simulated paths.
+            num_steps: Time steps per path. Basket, spread and worst-of payoffs only
+                read terminal prices, so one step is exact for them.
+            seed: If given, every `price` call restarts from this seed.
+            dtype: Precision of path generation (float32 or float64).
+            chunk_size: Paths simulated at once. A chunk holds
+                num_steps * assets * chunk_size values, so lower it for long paths.
+        """
+        self._num_paths: Final[int] = num_paths
+        self._num_steps: Final[int] = num_steps
+        self._seed: Final[Optional[int]] = seed
+        self._dtype: Final[np.dtype] = _simulation_dtype(dtype)
+        self._chunk_size: Final[int] = chunk_size
+
+    @property
+    def configuration(self) -> Tuple[Any, ...]:
+        return (type(self).__name__, self._num_paths, self._num_steps, self._seed, self._dtype.name,
+                self._chunk_size)
+
+    def make_rng(self) -> Optional[np.random.Generator]:
+        """Fresh generator for one pricing call, or None to use the global state."""
+        return None if self._seed is None else np.random.default_rng(self._seed)
+
+    def price(self, instrument: ValuationInstrument, market_state: MultiAssetMarketState) -> float:
+        return self.estimate(instrument, market_state).price
+
+    def estimate(self, instrument: ValuationInstrument, market_state: MultiAssetMarketState) -> MonteCarloEstimate:
+        """Price plus standard error; each chunk is one batch."""
+        if not isinstance(market_state, MultiAssetMarketState):
+            raise TypeError(f"{type(self).__name__} requires a MultiAssetMarketState, "
+                            f"got {type(market_state).__name__}")
+        _require_european(instrument, type(self).__name__)
+        T = instrument.expiration_time
+        process = CorrelatedGBM(market_state, self._dtype)
+        rng = self.make_rng()
+        moments = RunningMoments()
+        batches = 0
+        start = time.perf_counter()
+
+        instrumentation.increment("monte_carlo.paths", self._num_paths)
+        with instrumentation.span("multi_asset.simulate"):
+            remaining = self._num_paths
+            while remaining > 0:
+                n = min(self._chunk_size, remaining)
+                paths = process.simulate_paths(T, self._num_steps, n, rng)
+                moments.merge(RunningMoments.from_samples(instrument.calculate_payoff(paths)))
+                remaining -= n
+                batches += 1
+
+        discount_factor = np.exp(-market_state.risk_free_rate * T)
+        return MonteCarloEstimate(
+            price=float(moments.mean * discount_factor),
+            standard_error=float(moments.standard_error * discount_factor),
+            paths=moments.count,
+            batches=batches,
+            elapsed=time.perf_counter() - start,
+            converged=True,
+        )
@@ -1 +1,2 @@
 from .options import VanillaOption
+from .batch import InstrumentBatch
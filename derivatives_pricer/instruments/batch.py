@@ -0,0 +1,200 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from derivatives_pricer.domain.interfaces import ValuationInstrument
+from derivatives_pricer.domain.enums import OptionType, ExerciseStyle, BarrierType, PayoffKind
+from derivatives_pricer.domain.payoff import CallPayoff, PutPayoff, BarrierPayoff, AsianPayoff
+from derivatives_pricer.domain.exercise import EuropeanExercise, AmericanExercise
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+
+# Integer codes stored in the categorical columns are the enum values.
+CALL = OptionType.CALL.value
+PUT = OptionType.PUT.value
+AMERICAN = ExerciseStyle.AMERICAN.value
+EUROPEAN = ExerciseStyle.EUROPEAN.value
+VANILLA = PayoffKind.VANILLA.value
+BARRIER = PayoffKind.BARRIER.value
+ASIAN = PayoffKind.ASIAN.value
+NO_BARRIER = 0
+
+# Column name -> dtype of every InstrumentBatch column, in field order.
+INSTRUMENT_COLUMNS = {
+    "strike": np.float64,
+    "expiry": np.float64,
+    "option_type": np.int8,
+    "exercise": np.int8,
+    "payoff_kind": np.int8,
+    "barrier": np.float64,
+    "barrier_type": np.int8,
+}
+
+@dataclass(frozen=True, eq=False)
+class InstrumentBatch:
+    """
+    Structure-of-arrays book of vanilla, barrier and Asian options.
+
+    Every column is a 1D NumPy array with one row per contract:
+        strike, expiry         float64
+        option_type            int8, OptionType values (CALL / PUT)
+        exercise               int8, ExerciseStyle values (AMERICAN / EUROPEAN)
+        payoff_kind            int8, PayoffKind values (VANILLA / BARRIER / ASIAN)
+        barrier                float64, NaN for non-barrier rows
+        barrier_type           int8, BarrierType values, 0 for non-barrier rows
+
+    Columns that already have the right dtype are stored without copying, so a batch
+    can be a view over memory-mapped or shared arrays. Engines with a `price_batch`
+    fast path consume the columns directly; `to_instruments` materializes the
+    per-contract objects for everything else.
+    """
+    strike: np.ndarray
+    expiry: np.ndarray
+    option_type: np.ndarray
+    exercise: np.ndarray
+    payoff_kind: np.ndarray
+    barrier: np.ndarray
+    barrier_type: np.ndarray
+
+    def __post_init__(self):
+        n = len(np.asarray(self.strike))
+        for name, dtype in INSTRUMENT_COLUMNS.items():
+            column = np.asarray(getattr(self, name), dtype=dtype)
+            if column.ndim != 1 or len(column) != n:
+                raise ValueError(f"Column '{name}' must be 1D with {n} rows, got shape {column.shape}")
+            object.__setattr__(self, name, column)
+
+    @classmethod
+    def from_arrays(cls,
+                    strike: np.ndarray,
+                    expiry: np.ndarray,
+                    option_type: np.ndarray,
+                    exercise: Optional[np.ndarray] = None,
+                    payoff_kind: Optional[np.ndarray] = None,
+                    barrier: Optional[np.ndarray] = None,
+                    barrier_type: Optional[np.ndarray] = None) -> "InstrumentBatch":
+        """
+        Wraps existing columns. Omitted columns default to European vanilla contracts.
+        Scalars are broadcast (without allocation) to the number of strikes.
+        """
+        n = len(strike)
+
+        def column(value, default, dtype):
+            value = default if value is None else value
+            value = np.asarray(value, dtype=dtype)
+            return np.broadcast_to(value, (n,)) if value.ndim == 0 else value
+
+        return cls(
+            strike=strike,
+            expiry=column(expiry, None, np.float64),
+            option_type=column(option_type, None, np.int8),
+            exercise=column(exercise, EUROPEAN, np.int8),
+            payoff_kind=column(payoff_kind, VANILLA, np.int8),
+            barrier=column(barrier, np.nan, np.float64),
+            barrier_type=column(barrier_type, NO_BARRIER, np.int8),
+        )
+
+    @classmethod
+    def from_instruments(cls, instruments: Sequence[ValuationInstrument]) -> "InstrumentBatch":
+        n = len(instruments)
+        columns = {name: np.empty(n, dtype=dtype) for name, dtype in INSTRUMENT_COLUMNS.items()}
+        for i, inst in enumerate(instruments):
+            row = _encode(inst)
+            for name in INSTRUMENT_COLUMNS:
+                columns[name][i] = row[name]
+        return cls(**columns)
+
+    def to_instruments(self) -> List[ValuationInstrument]:
+        return [self.instrument(i) for i in range(len(self))]
+
+    def instrument(self, row: int) -> ValuationInstrument:
+        """Materializes one contract as the equivalent dataclass."""
+        strike = float(self.strike[row])
+        expiry = float(self.expiry[row])
+        is_call = self.option_type[row] == CALL
+        kind = self.payoff_kind[row]
+        exercise = AmericanExercise() if self.exercise[row] == AMERICAN else EuropeanExercise()
+
+        if kind == VANILLA:
+            return VanillaOption(
+                payoff_strategy=CallPayoff(strike) if is_call else PutPayoff(strike),
+                exercise_strategy=exercise,
+                expiry=expiry,
+                strike=strike,
+            )
+        if kind == BARRIER:
+            return ExoticOption(
+                payoff_strategy=BarrierPayoff(
+                    strike=strike,
+                    barrier=float(self.barrier[row]),
+                    barrier_type=BarrierType(int(self.barrier_type[row])),
+                    underlying_payoff=CallPayoff(strike) if is_call else PutPayoff(strike),
+                ),
+                expiry=expiry,
+                exercise_strategy=exercise,
+            )
+        if kind == ASIAN:
+            return ExoticOption(
+                payoff_strategy=AsianPayoff(strike=strike, underlying_payoff_type="Call" if is_call else "Put"),
+                expiry=expiry,
+                exercise_strategy=exercise,
+            )
+        raise ValueError(f"Unknown payoff kind code {kind} in row {row}")
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    def __getitem__(self, index) -> "InstrumentBatch":
+        """Row selection. Slices return views; integer arrays and masks copy."""
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 or None)
+        return InstrumentBatch(**{name: getattr(self, name)[index] for name in INSTRUMENT_COLUMNS})
+
+    @property
+    def is_call(self) -> np.ndarray:
+        return self.option_type == CALL
+
+    @property
+    def is_american(self) -> np.ndarray:
+        return self.exercise == AMERICAN
+
+    @property
+    def is_vanilla(self) -> np.ndarray:
+        return self.payoff_kind == VANILLA
+
+def _encode(inst: ValuationInstrument) -> dict:
+    """Column values for one contract."""
+    if isinstance(inst, VanillaOption) and type(inst.payoff_strategy) in (CallPayoff, PutPayoff):
+        return dict(
+            strike=inst.strike,
+            expiry=inst.expiration_time,
+            option_type=inst.option_type.value,
+            exercise=inst.exercise_style.value,
+            payoff_kind=VANILLA,
+            barrier=np.nan,
+            barrier_type=NO_BARRIER,
+        )
+
+    payoff = getattr(inst, "payoff_strategy", None)
+    if type(payoff) is BarrierPayoff and type(payoff.underlying_payoff) in (CallPayoff, PutPayoff):
+        return dict(
+            strike=payoff.underlying_payoff.strike,
+            expiry=inst.expiration_time,
+            option_type=CALL if type(payoff.underlying_payoff) is CallPayoff else PUT,
+            exercise=inst.exercise_style.value,
+            payoff_kind=BARRIER,
+            barrier=payoff.barrier,
+            barrier_type=payoff.barrier_type.value,
+        )
+    if type(payoff) is AsianPayoff:
+        return dict(
+            strike=payoff.strike,
+            expiry=inst.expiration_time,
+            option_type=CALL if payoff.underlying_payoff_type == "Call" else PUT,
+            exercise=inst.exercise_style.value,
+            payoff_kind=ASIAN,
+            barrier=np.nan,
+            barrier_type=NO_BARRIER,
+        )
+    raise TypeError(f"InstrumentBatch cannot represent {type(inst).__name__} with payoff {type(payoff).__name__}")
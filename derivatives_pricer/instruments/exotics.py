@@ -1,19 +1,25 @@
 from dataclasses import dataclass
+from typing import Sequence
 import numpy as np
 
 from derivatives_pricer.domain.interfaces import ValuationInstrument
 from derivatives_pricer.domain.enums import ExerciseStyle, BarrierType
-from derivatives_pricer.domain.payoff import BarrierPayoff, AsianPayoff, CallPayoff, PutPayoff
-from derivatives_pricer.domain.exercise import EuropeanExercise
+from derivatives_pricer.domain.payoff import (
+    BarrierPayoff, AsianPayoff, CallPayoff, PutPayoff, BasketPayoff, SpreadPayoff, WorstOfPayoff
+)
+from derivatives_pricer.domain.exercise import ExerciseStrategy, EuropeanExercise, AmericanExercise
 
 @dataclass(frozen=True)
 class ExoticOption(ValuationInstrument):
     """
     Generic container for exotic options.
-    Behavior is defined entirely by the Payoff Strategy.
+    Behavior is defined entirely by the Payoff Strategy. Exercise is European unless
+    an AmericanExercise is given (supported by the barrier lattice engine for
+    barrier payoffs).
     """
     payoff_strategy: any # Payoff Protocol
     expiry: float
+    exercise_strategy: ExerciseStrategy = EuropeanExercise()
     
     @property
     def expiration_time(self) -> float:
@@ -21,7 +27,9 @@ class ExoticOption(ValuationInstrument):
 
     @property
     def exercise_style(self) -> ExerciseStyle:
-        return ExerciseStyle.EUROPEAN # Exotics usually European
+        if isinstance(self.exercise_strategy, AmericanExercise):
+            return ExerciseStyle.AMERICAN
+        return ExerciseStyle.EUROPEAN
 
     def calculate_payoff(self, spot_prices: np.ndarray) -> np.ndarray:
         return self.payoff_strategy(spot_prices)
@@ -40,9 +48,60 @@ class ExoticOption(ValuationInstrument):
             expiry=expiry
         )
 
+    @classmethod
+    def barrier_option(cls, strike: float, barrier: float, barrier_type: BarrierType, expiry: float,
+                       is_call: bool = True, american: bool = False) -> 'ExoticOption':
+        return cls(
+            payoff_strategy=BarrierPayoff(
+                strike=strike,
+                barrier=barrier,
+                barrier_type=barrier_type,
+                underlying_payoff=CallPayoff(strike) if is_call else PutPayoff(strike)
+            ),
+            expiry=expiry,
+            exercise_strategy=AmericanExercise() if american else EuropeanExercise()
+        )
+
     @classmethod
     def asian_call(cls, strike: float, expiry: float) -> 'ExoticOption':
         return cls(
             payoff_strategy=AsianPayoff(strike=strike, underlying_payoff_type="Call"),
             expiry=expiry
         )
+
+    # Multi-asset contracts (priced with a MultiAssetMarketState).
+
+    @classmethod
+    def basket_option(cls, weights: Sequence[float], strike: float, expiry: float,
+                      is_call: bool = True) -> 'ExoticOption':
+        return cls(
+            payoff_strategy=BasketPayoff(
+                weights=tuple(float(w) for w in weights),
+                underlying_payoff=CallPayoff(strike) if is_call else PutPayoff(strike)
+            ),
+            expiry=expiry
+        )
+
+    @classmethod
+    def spread_option(cls, strike: float, expiry: float, is_call: bool = True,
+                      long_asset: int = 0, short_asset: int = 1) -> 'ExoticOption':
+        return cls(
+            payoff_strategy=SpreadPayoff(
+                underlying_payoff=CallPayoff(strike) if is_call else PutPayoff(strike),
+                long_asset=long_asset,
+                short_asset=short_asset
+            ),
+            expiry=expiry
+        )
+
+    @classmethod
+    def worst_of_option(cls, reference_levels: Sequence[float], strike: float, expiry: float,
+                        is_call: bool = True) -> 'ExoticOption':
+        """`strike` is a performance level relative to `reference_levels` (1.0 = at the money)."""
+        return cls(
+            payoff_strategy=WorstOfPayoff(
+                reference_levels=tuple(float(x) for x in reference_levels),
+                underlying_payoff=CallPayoff(strike) if is_call else PutPayoff(strike)
+            ),
+            expiry=expiry
+        )
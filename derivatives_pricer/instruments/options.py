@@ -47,6 +47,14 @@ class VanillaOption(ValuationInstrument):
     def apply_exercise_condition(self, intrinsic: np.ndarray, continuation: np.ndarray) -> np.ndarray:
         return self.exercise_strategy.apply(intrinsic, continuation)
 
+    def calculate_payoff_into(self, spot_prices: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Writes the payoff into `out` without allocating (see Payoff.evaluate_into)."""
+        return self.payoff_strategy.evaluate_into(spot_prices, out)
+
+    def apply_exercise_condition_inplace(self, intrinsic: np.ndarray, continuation: np.ndarray) -> np.ndarray:
+        """Overwrites `continuation` with the exercised value (see ExerciseStrategy.apply_inplace)."""
+        return self.exercise_strategy.apply_inplace(intrinsic, continuation)
+
     # --- Factory Methods ---
     
     @classmethod
@@ -1,5 +1,59 @@
+import math
+
 import numpy as np
-from scipy.stats import norm
+
+def norm_cdf(x: float) -> float:
+    """Standard normal CDF of a scalar, via the C library's erfc (accurate in both tails)."""
+    return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+def norm_cdf_array(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF of an array. SciPy is imported on first use, not with the module."""
+    from scipy.special import ndtr
+    return ndtr(x)
+
+def norm_pdf_array(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * np.square(x)) / math.sqrt(2.0 * math.pi)
+
+# Gauss-Legendre half-nodes and weights (6, 12 and 20 points) from Genz (2004).
+_GL_NODES = (
+    np.array([0.9324695142031522, 0.6612093864662647, 0.2386191860831970]),
+    np.array([0.9815606342467191, 0.9041172563704750, 0.7699026741943050,
+              0.5873179542866171, 0.3678314989981802, 0.1252334085114692]),
+    np.array([0.9931285991850949, 0.9639719272779138, 0.9122344282513259, 0.8391169718222188,
+              0.7463319064601508, 0.6360536807265150, 0.5108670019508271, 0.3737060887154196,
+              0.2277858511416451, 0.07652652113349733]),
+)
+_GL_WEIGHTS = (
+    np.array([0.1713244923791705, 0.3607615730481384, 0.4679139345726904]),
+    np.array([0.04717533638651177, 0.1069393259953183, 0.1600783285433464,
+              0.2031674267230659, 0.2334925365383547, 0.2491470458134029]),
+    np.array([0.01761400713915212, 0.04060142980038694, 0.06267204833410906, 0.08327674157670475,
+              0.1019301198172404, 0.1181945319615184, 0.1316886384491766, 0.1420961093183821,
+              0.1491729864726037, 0.1527533871307259]),
+)
+
+def bivariate_norm_cdf_array(a: np.ndarray, b: np.ndarray, rho: float) -> np.ndarray:
+    """
+    P(X < a, Y < b) for standard normals with correlation `rho`, elementwise over a and b.
+
+    Genz's Gauss-Legendre integration of Plackett's identity, accurate to about 1e-15.
+    Only the |rho| < 0.925 branch is implemented; closer to +-1 the integrand needs
+    Genz's separate asymptotic expansion.
+    """
+    if not abs(rho) < 0.925:
+        raise ValueError(f"bivariate_norm_cdf_array requires |rho| < 0.925, got {rho}")
+    level = 0 if abs(rho) < 0.3 else 1 if abs(rho) < 0.75 else 2
+    nodes, weights = _GL_NODES[level], _GL_WEIGHTS[level]
+
+    h = -np.asarray(a, dtype=float)[..., None]
+    k = -np.asarray(b, dtype=float)[..., None]
+    hk = h * k
+    hs = 0.5 * (h * h + k * k)
+    asr = math.asin(rho)
+    total = 0.0
+    for sn in (np.sin(asr * (1.0 - nodes) / 2.0), np.sin(asr * (1.0 + nodes) / 2.0)):
+        total = total + np.sum(weights * np.exp((sn * hk - hs) / (1.0 - sn * sn)), axis=-1)
+    return np.clip(total * asr / (4.0 * math.pi) + norm_cdf_array(-h[..., 0]) * norm_cdf_array(-k[..., 0]), 0.0, 1.0)
 
 def black_scholes_price(
     spot: float,
@@ -28,12 +82,20 @@ def black_scholes_price(
     if time_to_expiry <= 0:
         return max(spot - strike, 0.0) if is_call else max(strike - spot, 0.0)
 
-    d1 = (np.log(spot / strike) + (risk_free_rate - dividend_yield + 0.5 * volatility**2) * time_to_expiry) / (volatility * np.sqrt(time_to_expiry))
-    d2 = d1 - volatility * np.sqrt(time_to_expiry)
+    # Plain `math` on Python floats: no array allocation or ufunc dispatch.
+    vol_sqrt_t = volatility * math.sqrt(time_to_expiry)
+    forward_leg = spot * math.exp(-dividend_yield * time_to_expiry)
+    strike_leg = strike * math.exp(-risk_free_rate * time_to_expiry)
+    if vol_sqrt_t <= 0:
+        # No volatility: the payoff on the forward is certain, discounted intrinsic value.
+        return max(forward_leg - strike_leg, 0.0) if is_call else max(strike_leg - forward_leg, 0.0)
+
+    d1 = (math.log(spot / strike) + (risk_free_rate - dividend_yield + 0.5 * volatility * volatility) * time_to_expiry) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
 
     if is_call:
-        price = spot * np.exp(-dividend_yield * time_to_expiry) * norm.cdf(d1) - strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2)
+        price = forward_leg * norm_cdf(d1) - strike_leg * norm_cdf(d2)
     else:
-        price = strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2) - spot * np.exp(-dividend_yield * time_to_expiry) * norm.cdf(-d1)
-        
+        price = strike_leg * norm_cdf(-d2) - forward_leg * norm_cdf(-d1)
+
     return float(price)
@@ -0,0 +1,107 @@
+"""
+Forward-mode automatic differentiation with vector dual numbers.
+
+A Dual carries a value array and the gradient of that value with respect to p
+seed parameters, stored as an array whose shape broadcasts to (p,) + value.shape
+(`gradient` materializes it). Arithmetic and the
+elementary functions below propagate both through the chain rule, so evaluating a
+closed-form model on Dual parameters returns its exact gradient in one pass. Values
+may be complex (e.g. characteristic functions); gradients are then complex too.
+"""
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+class Dual:
+    __slots__ = ("value", "grad")
+    # Make NumPy defer to Dual's reflected operators (ndarray + Dual -> Dual.__radd__).
+    __array_ufunc__ = None
+
+    def __init__(self, value, grad):
+        self.value = np.asarray(value)
+        self.grad = np.asarray(grad)
+
+    @classmethod
+    def variables(cls, values: Sequence[float]) -> Tuple["Dual", ...]:
+        """One Dual per parameter, seeded with the unit gradient of its own index."""
+        p = len(values)
+        return tuple(cls(np.float64(v), np.eye(p)[i]) for i, v in enumerate(values))
+
+    @property
+    def real(self) -> "Dual":
+        return Dual(self.value.real, self.grad.real)
+
+    @property
+    def gradient(self) -> np.ndarray:
+        """Gradient broadcast to its full shape (p,) + value.shape."""
+        return np.broadcast_to(_expand(self.grad, self.value.ndim), self.grad.shape[:1] + self.value.shape)
+
+    def __add__(self, other):
+        if not isinstance(other, Dual):
+            value = self.value + np.asarray(other)
+            return Dual(value, _expand(self.grad, value.ndim))
+        value = self.value + other.value
+        return Dual(value, _expand(self.grad, value.ndim) + _expand(other.grad, value.ndim))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Dual(-self.value, -self.grad)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if not isinstance(other, Dual):
+            other = np.asarray(other)
+            value = self.value * other
+            return Dual(value, _expand(self.grad, value.ndim) * other)
+        value = self.value * other.value
+        return Dual(value, _expand(self.grad, value.ndim) * other.value
+                    + self.value * _expand(other.grad, value.ndim))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Dual):
+            return self * (1.0 / np.asarray(other))
+        return self * reciprocal(other)
+
+    def __rtruediv__(self, other):
+        return reciprocal(self) * other
+
+    def __pow__(self, exponent: float):
+        return _apply(self, self.value ** exponent, exponent * self.value ** (exponent - 1))
+
+def _expand(grad: np.ndarray, ndim: int) -> np.ndarray:
+    """Gradient [p, ...] with axes inserted after p so it broadcasts against an ndim-dimensional value."""
+    extra = ndim - (grad.ndim - 1)
+    return grad.reshape(grad.shape[:1] + (1,) * extra + grad.shape[1:]) if extra > 0 else grad
+
+def _apply(x: Dual, value: np.ndarray, derivative: np.ndarray) -> Dual:
+    """Result of an elementwise function with the given value and derivative at x."""
+    return Dual(value, derivative * _expand(x.grad, np.ndim(value)))
+
+def reciprocal(x: Dual) -> Dual:
+    value = 1.0 / x.value
+    return _apply(x, value, -value * value)
+
+def exp(x: Union[Dual, np.ndarray]):
+    if not isinstance(x, Dual):
+        return np.exp(x)
+    value = np.exp(x.value)
+    return _apply(x, value, value)
+
+def log(x: Union[Dual, np.ndarray]):
+    if not isinstance(x, Dual):
+        return np.log(x)
+    return _apply(x, np.log(x.value), 1.0 / x.value)
+
+def sqrt(x: Union[Dual, np.ndarray]):
+    if not isinstance(x, Dual):
+        return np.sqrt(x)
+    value = np.sqrt(x.value)
+    return _apply(x, value, 0.5 / value)
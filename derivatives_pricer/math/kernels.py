@@ -0,0 +1,167 @@
+"""
+Fused loop kernels for the lattice and Monte Carlo engines.
+
+The kernels are plain Python/NumPy functions written in the explicit-loop style
+Numba compiles well. When Numba is installed they are compiled on first use
+(`cache=True`, so later processes load them from disk); otherwise engines keep
+their vectorized NumPy implementations and never call these functions.
+"""
+import importlib.util
+import math
+import threading
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+BACKENDS = ("auto", "numpy", "numba")
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Payoff codes understood by `path_payoff_moments`.
+PAYOFF_VANILLA = 0
+PAYOFF_BARRIER = 1
+PAYOFF_ASIAN = 2
+
+# Barrier codes understood by `path_payoff_moments`.
+BARRIER_UP_AND_OUT = 0
+BARRIER_UP_AND_IN = 1
+BARRIER_DOWN_AND_OUT = 2
+BARRIER_DOWN_AND_IN = 3
+
+def resolve_backend(backend: str) -> str:
+    """Maps "auto" to the best available backend and validates explicit requests."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    if backend == "auto":
+        return "numba" if NUMBA_AVAILABLE else "numpy"
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        raise ImportError("backend='numba' requested but numba is not installed")
+    return backend
+
+# --- Kernel source ---
+
+def binomial_rollback_batch(spot, strike, sign, american, u, p_df, q_df, steps, price, layer_1, layer_2):
+    """
+    CRR rollback of k plain call/put contracts, one column at a time, in place.
+
+    All array arguments have length k except layer_1 [2, k] and layer_2 [3, k], which
+    receive the node values at steps 1 and 2 (when steps >= 2). `sign` is +1 for
+    calls and -1 for puts. Continuation, intrinsic and exercise are fused into one
+    pass over a single reused value buffer.
+    """
+    k = spot.shape[0]
+    values = np.empty(steps + 1)
+    for j in range(k):
+        s0 = spot[j]
+        K = strike[j]
+        sg = sign[j]
+        up = u[j]
+        down_sq = 1.0 / (up * up)
+        pd = p_df[j]
+        qd = q_df[j]
+        is_american = american[j]
+
+        # Terminal layer, from the highest node down.
+        s = s0 * up ** steps
+        for i in range(steps + 1):
+            values[i] = max(sg * (s - K), 0.0)
+            s *= down_sq
+
+        for step in range(steps - 1, -1, -1):
+            s = s0 * up ** step
+            for i in range(step + 1):
+                v = pd * values[i] + qd * values[i + 1]
+                if is_american:
+                    intrinsic = sg * (s - K)
+                    if intrinsic > v:
+                        v = intrinsic
+                    s *= down_sq
+                values[i] = v
+            if step == 2:
+                for i in range(3):
+                    layer_2[i, j] = values[i]
+            elif step == 1:
+                for i in range(2):
+                    layer_1[i, j] = values[i]
+
+        price[j] = values[0]
+
+def gbm_accumulate_step(z, drift, diffusion, log_s, running_max, running_min, running_sum):
+    """
+    Advances every path by one GBM step and updates its running statistics, in place.
+
+    `z` holds this step's standard normal shocks, one per path. `log_s` is the
+    cumulative log-return; prices are S0 * exp(log_s), with S0 applied at the end.
+    Working on returns keeps the arithmetic identical to the NumPy engine's cumsum.
+    """
+    for i in range(z.shape[0]):
+        x = log_s[i] + (diffusion * z[i] + drift)
+        log_s[i] = x
+        s = math.exp(x)
+        if s > running_max[i]:
+            running_max[i] = s
+        if s < running_min[i]:
+            running_min[i] = s
+        running_sum[i] += s
+
+def path_payoff_moments(s0, steps, log_s, running_max, running_min, running_sum,
+                        payoff_kind, sign, strike, barrier, barrier_kind):
+    """
+    Evaluates the payoff from per-path statistics gathered by `gbm_accumulate_step`.
+    Like the NumPy engine, statistics cover the simulated dates and exclude S0.
+
+    Returns:
+        (sum of payoffs, sum of squared payoffs)
+    """
+    total = 0.0
+    total_sq = 0.0
+    for i in range(log_s.shape[0]):
+        if payoff_kind == PAYOFF_ASIAN:
+            value = max(sign * (s0 * running_sum[i] / steps - strike), 0.0)
+        else:
+            value = max(sign * (s0 * math.exp(log_s[i]) - strike), 0.0)
+            if payoff_kind == PAYOFF_BARRIER:
+                if barrier_kind == BARRIER_UP_AND_OUT:
+                    active = s0 * running_max[i] < barrier
+                elif barrier_kind == BARRIER_DOWN_AND_OUT:
+                    active = s0 * running_min[i] > barrier
+                elif barrier_kind == BARRIER_UP_AND_IN:
+                    active = s0 * running_max[i] >= barrier
+                else:
+                    active = s0 * running_min[i] <= barrier
+                if not active:
+                    value = 0.0
+        total += value
+        total_sq += value * value
+    return total, total_sq
+
+# --- Compilation ---
+
+_SOURCES: Dict[str, Callable] = {
+    "binomial_rollback_batch": binomial_rollback_batch,
+    "gbm_accumulate_step": gbm_accumulate_step,
+    "path_payoff_moments": path_payoff_moments,
+}
+_compiled: Dict[str, Callable] = {}
+_compile_lock = threading.Lock()
+_numba_failed = False
+
+def get_kernel(name: str) -> Optional[Callable]:
+    """
+    Returns the Numba-compiled kernel, compiling it on first use.
+    Returns None if Numba is missing or fails to import.
+    """
+    global _numba_failed
+    kernel = _compiled.get(name)
+    if kernel is not None or not NUMBA_AVAILABLE or _numba_failed:
+        return kernel
+    with _compile_lock:
+        kernel = _compiled.get(name)
+        if kernel is None:
+            try:
+                import numba
+            except Exception:
+                _numba_failed = True
+                return None
+            kernel = _compiled[name] = numba.njit(cache=True)(_SOURCES[name])
+    return kernel
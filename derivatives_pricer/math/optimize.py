@@ -0,0 +1,91 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+ResidualFunction = Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+@dataclass(frozen=True)
+class LeastSquaresResult:
+    """
+    Attributes:
+        x: Best parameters found.
+        cost: Half the sum of squared residuals at `x`.
+        iterations: Jacobian evaluations performed.
+        converged: Whether a tolerance was met before `max_iterations`.
+        elapsed: Wall-clock seconds.
+    """
+    x: np.ndarray
+    cost: float
+    iterations: int
+    converged: bool
+    elapsed: float
+
+def levenberg_marquardt(residuals: ResidualFunction, x0: np.ndarray,
+                        lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+                        max_iterations: int = 100, ftol: float = 1e-12, xtol: float = 1e-10,
+                        gtol: float = 1e-12, damping: float = 1e-3) -> LeastSquaresResult:
+    """
+    Minimizes 0.5 * |r(x)|^2 by Levenberg-Marquardt with box bounds.
+
+    `residuals(x)` returns the residual vector r [m] and its Jacobian J [m, n]. Each
+    iteration solves (J'J + mu diag(J'J)) dx = -J'r, projects x + dx onto the bounds,
+    and accepts the step if the cost falls, shrinking mu, or raises mu and retries
+    (Nielsen's damping update). Scaling by diag(J'J) makes the steps invariant to
+    the units of the parameters.
+
+    Stops when the relative cost reduction is below `ftol`, the relative step below
+    `xtol`, or the gradient's largest component below `gtol`.
+    """
+    start = time.perf_counter()
+    n = len(x0)
+    lower = np.full(n, -np.inf) if lower is None else np.asarray(lower, dtype=float)
+    upper = np.full(n, np.inf) if upper is None else np.asarray(upper, dtype=float)
+    x = np.clip(np.asarray(x0, dtype=float), lower, upper)
+
+    r, J = residuals(x)
+    cost = 0.5 * float(r @ r)
+    mu = None
+    growth = 2.0
+    iterations = 1
+    converged = False
+
+    while iterations < max_iterations:
+        gradient = J.T @ r
+        if np.max(np.abs(gradient)) <= gtol:
+            converged = True
+            break
+        JTJ = J.T @ J
+        scale = np.maximum(np.diag(JTJ), 1e-12)
+        if mu is None:
+            mu = damping * float(np.max(scale))
+
+        # Inner loop: raise the damping until a step lowers the cost.
+        while True:
+            step = np.linalg.solve(JTJ + mu * np.diag(scale), -gradient)
+            trial = np.clip(x + step, lower, upper)
+            step = trial - x
+            trial_r, trial_J = residuals(trial)
+            trial_cost = 0.5 * float(trial_r @ trial_r)
+            if np.isfinite(trial_cost) and trial_cost < cost:
+                break
+            mu *= growth
+            growth *= 2.0
+            if mu > 1e16 or np.linalg.norm(step) <= xtol * (np.linalg.norm(x) + xtol):
+                return LeastSquaresResult(x, cost, iterations, True, time.perf_counter() - start)
+
+        # Gain ratio of the actual to the predicted reduction sets the next damping.
+        predicted = 0.5 * float(step @ (mu * scale * step - gradient))
+        rho = (cost - trial_cost) / predicted if predicted > 0 else 0.0
+        mu *= max(1.0 / 3.0, 1.0 - (2.0 * rho - 1.0) ** 3)
+        growth = 2.0
+
+        reduction = cost - trial_cost
+        x, r, J, previous_cost, cost = trial, trial_r, trial_J, cost, trial_cost
+        iterations += 1
+        if reduction <= ftol * previous_cost or np.linalg.norm(step) <= xtol * (np.linalg.norm(x) + xtol):
+            converged = True
+            break
+
+    return LeastSquaresResult(x, cost, iterations, converged, time.perf_counter() - start)
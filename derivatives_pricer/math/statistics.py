@@ -0,0 +1,59 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+@dataclass
+class RunningMoments:
+    """
+    Count, mean and sum of squared deviations (M2) of a sample seen in batches.
+
+    Batches are folded in with the pairwise update of Chan, Golub & LeVeque, so the
+    variance never goes through the cancellation-prone sum of squares of the whole
+    sample.
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_samples(cls, values: np.ndarray) -> "RunningMoments":
+        values = np.asarray(values)
+        n = values.size
+        if n == 0:
+            return cls()
+        mean = float(np.mean(values, dtype=np.float64))
+        deviations = values.astype(np.float64, copy=False) - mean
+        return cls(n, mean, float(np.dot(deviations.ravel(), deviations.ravel())))
+
+    @classmethod
+    def from_sums(cls, count: int, total: float, total_sq: float) -> "RunningMoments":
+        """From a batch's sum and sum of squares (e.g. as returned by a fused kernel)."""
+        if count == 0:
+            return cls()
+        mean = total / count
+        return cls(count, mean, max(total_sq - total * mean, 0.0))
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """Folds `other` into this accumulator in place and returns it."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return self
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / n
+        self.m2 += other.m2 + delta * delta * self.count * other.count / n
+        self.count = n
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Unbiased sample variance (NaN below two observations)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of the mean."""
+        return math.sqrt(self.variance / self.count) if self.count > 1 else math.inf
@@ -0,0 +1 @@
+from .quoting import PricingService, QuoteServer, ServiceStats, ServiceOverloaded, LatencyTracker, parse_quote
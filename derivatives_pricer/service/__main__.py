@@ -0,0 +1,45 @@
+"""
+Runs a local quote server:
+
+    python -m derivatives_pricer.service --engine binomial --port 8000
+"""
+import argparse
+import asyncio
+
+from derivatives_pricer.engines.analytic import BlackScholesEngine
+from derivatives_pricer.engines.binomial import BinomialPricingEngine
+from derivatives_pricer.engines.monte_carlo import MonteCarloEngine
+from derivatives_pricer.service.quoting import PricingService, QuoteServer
+
+ENGINES = {
+    "black_scholes": BlackScholesEngine,
+    "binomial": BinomialPricingEngine,
+    "monte_carlo": MonteCarloEngine,
+}
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Batched pricing service over HTTP")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="black_scholes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-wait", type=float, default=0.001, help="Batch window in seconds")
+    parser.add_argument("--max-pending", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    service = PricingService(
+        ENGINES[args.engine](),
+        max_batch=args.max_batch,
+        max_wait=args.max_wait,
+        max_pending=args.max_pending,
+        workers=args.workers,
+    )
+    server = QuoteServer(service, args.host, args.port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
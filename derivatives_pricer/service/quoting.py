@@ -0,0 +1,443 @@
+"""
+Asyncio quoting front end with request coalescing.
+
+Concurrent quote requests are queued and grouped into batches of up to `max_batch`
+requests, waiting at most `max_wait` seconds for a batch to fill. Each batch is
+priced with one `engine.price_batch` call on an executor thread, so the event loop
+keeps accepting requests while the CPU works, and throughput under burst load is
+governed by the number of batches rather than the number of requests.
+
+The queue is bounded (`max_pending`). `PricingService.quote` waits for space by
+default; with `wait=False` it raises ServiceOverloaded instead, which the HTTP
+front end reports as 503.
+
+QuoteServer exposes a service over plain HTTP/1.1 (standard library only):
+    POST /price   one JSON quote object, or a list of them
+    GET  /stats   counters and latency percentiles
+
+A quote object holds the InstrumentBatch and MarketState fields, e.g.
+    {"strike": 100, "expiry": 1.0, "option_type": "call", "exercise": "american",
+     "spot_price": 100, "risk_free_rate": 0.05, "volatility": 0.2}
+Categorical fields accept enum names (case-insensitive) or integer codes.
+"""
+import asyncio
+import json
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from derivatives_pricer.domain.interfaces import ValuationInstrument
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+from derivatives_pricer.domain.enums import OptionType, ExerciseStyle, BarrierType, PayoffKind
+from derivatives_pricer.instruments.batch import InstrumentBatch, EUROPEAN, VANILLA, NO_BARRIER
+from derivatives_pricer.engines.interface import PricingEngine
+from derivatives_pricer.common import instrumentation
+
+class ServiceOverloaded(RuntimeError):
+    """Raised when the request queue is full and the caller chose not to wait."""
+
+@dataclass(frozen=True)
+class ServiceStats:
+    """Point-in-time snapshot of service counters. Latencies are in milliseconds."""
+    requests: int
+    batches: int
+    rejected: int
+    errors: int
+    pending: int
+    mean_batch_size: float
+    max_batch_size: int
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+
+class LatencyTracker:
+    """Keeps the most recent `window` latencies and reports percentiles over them."""
+
+    def __init__(self, window: int = 10000):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentiles(self, q: Sequence[float] = (50.0, 95.0, 99.0)) -> np.ndarray:
+        """Percentiles in seconds; NaN when nothing has been recorded."""
+        if not self._samples:
+            return np.full(len(q), np.nan)
+        return np.percentile(np.fromiter(self._samples, dtype=float), q)
+
+# A queued request: instrument, market, result future, enqueue time.
+_Item = Tuple[ValuationInstrument, MarketState, asyncio.Future, float]
+
+class PricingService:
+    """
+    Coalesces concurrent single-contract quotes into batched engine calls.
+
+    Use as an async context manager (or call `start` / `stop`) inside a running
+    event loop, then await `quote` from any number of tasks.
+    """
+
+    def __init__(self,
+                 engine: PricingEngine,
+                 max_batch: int = 256,
+                 max_wait: float = 0.001,
+                 max_pending: int = 10000,
+                 workers: int = 1,
+                 executor: Optional[Executor] = None,
+                 latency_window: int = 10000):
+        """
+        Args:
+            engine: Engine used for every batch via `price_batch`.
+            max_batch: Largest number of requests priced in one call.
+            max_wait: Longest time in seconds a request waits for its batch to fill.
+            max_pending: Capacity of the request queue.
+            workers: Number of batches priced concurrently.
+            executor: Executor for the pricing calls. Defaults to a thread pool with
+                `workers` threads, owned and shut down by the service.
+            latency_window: Number of recent requests kept for latency percentiles.
+        """
+        if max_batch <= 0:
+            raise ValueError(f"Parameter 'max_batch' must be positive, got {max_batch}")
+        if max_wait < 0:
+            raise ValueError(f"Parameter 'max_wait' must be non-negative, got {max_wait}")
+        if max_pending <= 0:
+            raise ValueError(f"Parameter 'max_pending' must be positive, got {max_pending}")
+        if workers <= 0:
+            raise ValueError(f"Parameter 'workers' must be positive, got {workers}")
+
+        self._engine = engine
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._max_pending = max_pending
+        self._workers = workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._latency = LatencyTracker(latency_window)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        # Futures taken off the queue by a batch loop and not yet resolved.
+        self._in_flight: Set[asyncio.Future] = set()
+
+        self._requests = 0
+        self._batches = 0
+        self._rejected = 0
+        self._errors = 0
+        self._max_batch_seen = 0
+
+    @property
+    def engine(self) -> PricingEngine:
+        return self._engine
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="pricing")
+        self._queue = asyncio.Queue(maxsize=self._max_pending)
+        self._batch_ready = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._batch_loop()) for _ in range(self._workers)]
+
+    async def stop(self) -> None:
+        """
+        Cancels the batch loops. Requests still queued or in a batch that had not
+        finished fail with RuntimeError.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        pending = list(self._in_flight)
+        self._in_flight.clear()
+        if self._queue is not None:
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait()[2])
+            self._queue = None
+        for future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("PricingService stopped before the request was priced"))
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def __aenter__(self) -> "PricingService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def quote(self, instrument: ValuationInstrument, market: MarketState, wait: bool = True) -> float:
+        """
+        Prices one contract as part of the next batch.
+
+        Args:
+            wait: When the queue is full, wait for space (True) or raise
+                ServiceOverloaded immediately (False).
+        """
+        if not self._tasks:
+            raise RuntimeError("PricingService is not running; call start() first")
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        item = (instrument, market, loop.create_future(), loop.time())
+        if wait:
+            await queue.put(item)
+            if self._queue is not queue:
+                # The service stopped while this request waited for space.
+                raise RuntimeError("PricingService stopped before the request was priced")
+        else:
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self._rejected += 1
+                raise ServiceOverloaded(f"{self._max_pending} requests already pending") from None
+        # A batch loop already holds one request while it waits for the rest.
+        if queue.qsize() + 1 >= self._max_batch:
+            self._batch_ready.set()
+        return await item[2]
+
+    async def quote_many(self,
+                         requests: Sequence[Tuple[ValuationInstrument, MarketState]],
+                         wait: bool = True) -> List[float]:
+        """Submits every request at once so they share batches."""
+        return list(await asyncio.gather(*(self.quote(i, m, wait) for i, m in requests)))
+
+    def stats(self) -> ServiceStats:
+        p50, p95, p99 = self._latency.percentiles() * 1e3
+        return ServiceStats(
+            requests=self._requests,
+            batches=self._batches,
+            rejected=self._rejected,
+            errors=self._errors,
+            pending=self._queue.qsize() if self._queue is not None else 0,
+            mean_batch_size=self._requests / self._batches if self._batches else 0.0,
+            max_batch_size=self._max_batch_seen,
+            latency_p50_ms=float(p50),
+            latency_p95_ms=float(p95),
+            latency_p99_ms=float(p99),
+        )
+
+    # --- Batching ---
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            items = [await queue.get()]
+            self._in_flight.add(items[0][2])
+            # Give the batch up to max_wait to fill, unless it is already full.
+            if queue.qsize() + 1 < self._max_batch and self._max_wait > 0:
+                self._batch_ready.clear()
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self._max_wait)
+                except asyncio.TimeoutError:
+                    pass
+            while len(items) < self._max_batch and not queue.empty():
+                items.append(queue.get_nowait())
+                self._in_flight.add(items[-1][2])
+            # On cancellation the futures stay in flight for stop() to fail.
+            await self._price_items(loop, items)
+            self._in_flight.difference_update(item[2] for item in items)
+
+    async def _price_items(self, loop, items: List[_Item]) -> None:
+        instruments = [item[0] for item in items]
+        markets = [item[1] for item in items]
+        self._batches += 1
+        self._max_batch_seen = max(self._max_batch_seen, len(items))
+        instrumentation.increment("service.batches")
+        instrumentation.increment("service.requests", len(items))
+
+        try:
+            prices = await loop.run_in_executor(self._executor, self._price_batch, instruments, markets)
+            outcomes = [(float(p), None) for p in prices]
+        except Exception:
+            # Something in the batch is unsupported: price row by row so only the
+            # offending requests fail.
+            outcomes = await loop.run_in_executor(self._executor, self._price_each, instruments, markets)
+
+        now = loop.time()
+        for (_, _, future, submitted), (price, error) in zip(items, outcomes):
+            self._requests += 1
+            self._latency.record(now - submitted)
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(price)
+            else:
+                self._errors += 1
+                future.set_exception(error)
+
+    def _price_batch(self, instruments: List[ValuationInstrument], markets: List[MarketState]) -> np.ndarray:
+        with instrumentation.span("service.batch"):
+            batch = InstrumentBatch.from_instruments(instruments)
+            first = markets[0]
+            if all(m == first for m in markets):
+                return self._engine.price_batch(batch, first)
+            return self._engine.price_batch(batch, MarketStateBatch.from_states(markets))
+
+    def _price_each(self, instruments, markets) -> List[Tuple[Optional[float], Optional[Exception]]]:
+        outcomes = []
+        for instrument, market in zip(instruments, markets):
+            try:
+                outcomes.append((float(self._engine.price(instrument, market)), None))
+            except Exception as error:
+                outcomes.append((None, error))
+        return outcomes
+
+# --- HTTP front end ---
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+_CATEGORICAL = {
+    "option_type": (OptionType, None),
+    "exercise": (ExerciseStyle, EUROPEAN),
+    "payoff_kind": (PayoffKind, VANILLA),
+    "barrier_type": (BarrierType, NO_BARRIER),
+}
+
+def _decode_categorical(name: str, value: Any, enum, default: Optional[int]) -> int:
+    """Enum name (case-insensitive) or integer code of `enum` (or the field's default code)."""
+    if isinstance(value, str):
+        try:
+            return enum[value.upper()].value
+        except KeyError:
+            raise ValueError(f"Unknown value '{value}' for field '{name}'") from None
+    valid = {member.value for member in enum} | ({default} if default is not None else set())
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value not in valid:
+        raise ValueError(f"Unknown code {value!r} for field '{name}'; expected one of {sorted(valid)}")
+    return int(value)
+
+def parse_quote(payload: Dict[str, Any]) -> Tuple[ValuationInstrument, MarketState]:
+    """Decodes one JSON quote object into an instrument and a market state."""
+    if not isinstance(payload, dict):
+        raise ValueError("Each quote must be a JSON object")
+    codes = {}
+    for name, (enum, default) in _CATEGORICAL.items():
+        value = payload.get(name, default)
+        if value is None:
+            raise ValueError(f"Missing required field '{name}'")
+        codes[name] = _decode_categorical(name, value, enum, default)
+    try:
+        batch = InstrumentBatch.from_arrays(
+            strike=np.array([float(payload["strike"])]),
+            expiry=float(payload["expiry"]),
+            barrier=float(payload.get("barrier", np.nan)),
+            **codes,
+        )
+        market = MarketState(
+            spot_price=float(payload["spot_price"]),
+            risk_free_rate=float(payload["risk_free_rate"]),
+            volatility=float(payload["volatility"]),
+            dividend_yield=float(payload.get("dividend_yield", 0.0)),
+        )
+    except KeyError as missing:
+        raise ValueError(f"Missing required field {missing}") from None
+    return batch.instrument(0), market
+
+class QuoteServer:
+    """Minimal HTTP/1.1 server (keep-alive, JSON bodies) in front of a PricingService."""
+
+    def __init__(self, service: PricingService, host: str = "127.0.0.1", port: int = 0,
+                 max_body: int = 16 * 1024 * 1024):
+        self._service = service
+        self._host = host
+        self._port = port
+        self._max_body = max_body
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def port(self) -> int:
+        """Bound port; useful with port=0."""
+        return self._server.sockets[0].getsockname()[1] if self._server else self._port
+
+    async def start(self) -> None:
+        await self._service.start()
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self._service.stop()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def __aenter__(self) -> "QuoteServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > self._max_body:
+                    await self._respond(writer, 413, {"error": "request body too large"})
+                    break
+                body = await reader.readexactly(length)
+                status, payload = await self._dispatch(method, path.split("?", 1)[0], body)
+                await self._respond(writer, status, payload)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": "use GET"}
+            return 200, asdict(self._service.stats())
+        if path != "/price":
+            return 404, {"error": f"unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+
+        try:
+            payload = json.loads(body)
+            single = not isinstance(payload, list)
+            requests = [parse_quote(q) for q in ([payload] if single else payload)]
+        except (ValueError, KeyError, TypeError) as error:
+            return 400, {"error": str(error)}
+
+        try:
+            prices = await self._service.quote_many(requests, wait=False)
+        except ServiceOverloaded as error:
+            return 503, {"error": str(error)}
+        except Exception as error:
+            return 500, {"error": f"{type(error).__name__}: {error}"}
+        return 200, {"price": prices[0]} if single else {"prices": prices}
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode()
+        head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
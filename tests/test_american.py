@@ -0,0 +1,119 @@
+import sys
+import os
+import unittest
+import warnings
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.domain.analytic_formulas import black_scholes_price_vectorized
+from derivatives_pricer.domain.american_formulas import critical_price, barone_adesi_whaley
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.instruments.batch import InstrumentBatch, AMERICAN, EUROPEAN
+from derivatives_pricer.engines.american import AmericanApproximationEngine, AMERICAN_METHODS
+from derivatives_pricer.engines.binomial import rollback_vanilla_batch
+
+class TestAmericanApproximation(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        n = 60
+        self.strike = rng.uniform(80.0, 120.0, n)
+        self.expiry = rng.uniform(0.1, 1.5, n)
+        self.rate = rng.uniform(0.01, 0.08, n)
+        self.dividend = rng.uniform(0.0, 0.05, n)
+        self.vol = rng.uniform(0.15, 0.4, n)
+        self.is_call = rng.random(n) < 0.5
+        self.lattice, _, _ = rollback_vanilla_batch(
+            np.full(n, 100.0), self.strike, self.expiry, self.rate, self.vol, self.dividend,
+            self.is_call, np.ones(n, dtype=bool), steps=2000
+        )
+
+    def test_methods_close_to_lattice(self):
+        tolerance = {"baw": 0.15, "bjerksund_stensland": 0.15, "ju_zhong": 0.1}
+        for method, formula in AMERICAN_METHODS.items():
+            prices = formula(100.0, self.strike, self.expiry, self.rate, self.vol, self.dividend, self.is_call)
+            error = np.abs(prices - self.lattice)
+            self.assertLess(error.max(), tolerance[method], method)
+
+        # Bjerksund-Stensland exercises on a suboptimal boundary: a lower bound.
+        bs2002 = AMERICAN_METHODS["bjerksund_stensland"](
+            100.0, self.strike, self.expiry, self.rate, self.vol, self.dividend, self.is_call)
+        self.assertTrue(np.all(bs2002 <= self.lattice + 2e-3))
+
+    def test_critical_price_solves_boundary(self):
+        K, T, r, sigma, q = 100.0, 1.0, 0.06, 0.3, 0.02
+        s_star, _ = critical_price(K, T, r, sigma, q, False)
+        self.assertLess(s_star, K)
+        # At the boundary the approximation meets intrinsic value smoothly.
+        below, at = barone_adesi_whaley([s_star * 0.99, s_star * 1.0000001], K, T, r, sigma, q, False)
+        self.assertAlmostEqual(below, K - s_star * 0.99, places=10)
+        self.assertAlmostEqual(at, K - s_star, places=4)
+
+    def test_zero_rate_call_with_dividend(self):
+        # r = 0 < q: calls still exercise early, and the BAW exponent takes its r -> 0 limit.
+        spot = np.array([70.0, 100.0, 130.0])
+        n = len(spot)
+        lattice, _, _ = rollback_vanilla_batch(spot, np.full(n, 100.0), np.ones(n), np.zeros(n), np.full(n, 0.3),
+                                               np.full(n, 0.05), np.ones(n, dtype=bool), np.ones(n, dtype=bool),
+                                               steps=2000)
+        european = black_scholes_price_vectorized(spot, 100.0, 1.0, 0.0, 0.3, 0.05, True)
+        tolerance = {"baw": 0.2, "bjerksund_stensland": 0.1, "ju_zhong": 0.05}
+        for method, formula in AMERICAN_METHODS.items():
+            prices = formula(spot, 100.0, 1.0, 0.0, 0.3, 0.05, True)
+            self.assertTrue(np.all(prices >= european), method)
+            np.testing.assert_allclose(prices, lattice, atol=tolerance[method], err_msg=method)
+            np.testing.assert_allclose(prices, formula(spot, 100.0, 1.0, 1e-9, 0.3, 0.05, True), atol=1e-6)
+
+    def test_low_volatility_large_carry(self):
+        # The BAW seed and the BS2002 trigger both fall below the strike here; the
+        # approximations used to collapse to the European price with RuntimeWarnings.
+        # Columns: strike, expiry, rate, vol, dividend, is_call.
+        cases = np.array([(100.0, 1.0, 0.05, 0.05, 0.2, 1), (100.0, 3.0, 0.01, 0.05, 0.1, 1),
+                          (100.0, 10.0, 0.02, 0.1, 0.08, 1), (100.0, 1.0, 0.2, 0.05, 0.05, 0),
+                          (105.0, 5.0, 0.1, 0.03, 0.0, 0)])
+        K, T, r, vol, q = cases[:, :5].T
+        is_call = cases[:, 5] == 1
+        n = len(cases)
+        lattice, _, _ = rollback_vanilla_batch(np.full(n, 100.0), K, T, r, vol, q, is_call, np.ones(n, dtype=bool),
+                                               steps=2000)
+        np.testing.assert_allclose(lattice[:2], [0.304, 0.506], atol=1e-3)
+        tolerance = {"baw": 0.2, "bjerksund_stensland": 0.01, "ju_zhong": 0.01}
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for method, formula in AMERICAN_METHODS.items():
+                prices = formula(100.0, K, T, r, vol, q, is_call)
+                np.testing.assert_allclose(prices, lattice, atol=tolerance[method], err_msg=method)
+            s_star, _ = critical_price(K, T, r, vol, q, is_call)
+        self.assertTrue(np.all(np.where(is_call, s_star > K, (s_star > 0) & (s_star < K))))
+
+    def test_no_early_exercise_reduces_to_european(self):
+        args = (100.0, np.array([90.0, 110.0]), 1.0)
+        for formula in AMERICAN_METHODS.values():
+            call = formula(*args, 0.05, 0.2, 0.0, True)
+            put = formula(*args, 0.0, 0.2, 0.02, False)
+            np.testing.assert_allclose(call, black_scholes_price_vectorized(*args, 0.05, 0.2, 0.0, True))
+            np.testing.assert_allclose(put, black_scholes_price_vectorized(*args, 0.0, 0.2, 0.02, False))
+
+    def test_engine_scalar_and_batch(self):
+        market = MarketState(100.0, 0.05, 0.25, 0.01)
+        engine = AmericanApproximationEngine("ju_zhong")
+        batch = InstrumentBatch.from_arrays(np.array([90.0, 100.0, 110.0]), 1.0, 2,
+                                            exercise=np.array([AMERICAN, EUROPEAN, AMERICAN], dtype=np.int8))
+        prices = engine.price_batch(batch, market)
+        expected = [engine.price(o, market) for o in batch.to_instruments()]
+        np.testing.assert_allclose(prices, expected, rtol=1e-12)
+        self.assertAlmostEqual(prices[1], black_scholes_price_vectorized(100.0, 100.0, 1.0, 0.05, 0.25, 0.01, False))
+        self.assertGreater(engine.price(VanillaOption.american_put(100.0, 1.0), market), prices[1])
+
+        self.assertNotEqual(engine.configuration, AmericanApproximationEngine("baw").configuration)
+        with self.assertRaises(ValueError):
+            AmericanApproximationEngine("lsm")
+        with self.assertRaises(TypeError):
+            engine.price(ExoticOption.asian_call(100.0, 1.0), market)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.batch import InstrumentBatch, CALL, PUT, AMERICAN
+from derivatives_pricer.engines.american_table import AmericanPriceTable, AmericanTableEngine
+from derivatives_pricer.engines.binomial import BinomialPricingEngine, rollback_vanilla_batch
+
+RATE, DIVIDEND = 0.05, 0.03
+
+class TestAmericanPriceTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = AmericanPriceTable.build(
+            RATE, DIVIDEND,
+            moneyness=np.linspace(-0.5, 0.5, 41),
+            expiries=np.linspace(0.3, 1.2, 7) ** 2,
+            volatilities=np.linspace(0.1, 0.5, 9),
+            steps=200,
+        )
+        cls.engine = AmericanTableEngine(cls.table)
+
+    def _random_book(self, n, seed=5):
+        rng = np.random.default_rng(seed)
+        strike = rng.uniform(75.0, 125.0, n)
+        expiry = rng.uniform(0.1, 1.4, n)
+        vol = rng.uniform(0.12, 0.48, n)
+        is_call = rng.random(n) < 0.5
+        batch = InstrumentBatch.from_arrays(strike, expiry, np.where(is_call, CALL, PUT), exercise=AMERICAN)
+        market = MarketStateBatch(np.full(n, 100.0), np.full(n, RATE), vol, np.full(n, DIVIDEND))
+        return batch, market
+
+    def test_prices_within_error_bound(self):
+        batch, market = self._random_book(200)
+        reference, _, _ = rollback_vanilla_batch(
+            market.spot_price, batch.strike, batch.expiry, market.risk_free_rate, market.volatility,
+            market.dividend_yield, batch.is_call, batch.is_american, steps=400
+        )
+        prices = self.engine.price_batch(batch, market)
+        self.assertGreater(self.table.error_bound, 0.0)
+        self.assertLess(self.table.error_bound, 5e-3)
+        self.assertTrue(np.all(np.abs(prices - reference) <= self.table.error_bound * batch.strike * 1.5))
+
+    def test_greeks_match_lattice(self):
+        batch, market = self._random_book(40, seed=9)
+        greeks = self.engine.price_with_greeks_batch(batch, market)
+        for row in range(0, 40, 8):
+            instrument = batch.instrument(row)
+            state = market.state(row)
+            lattice = BinomialPricingEngine(step_count=400)
+            tree = lattice.price_with_greeks(instrument, state)
+            self.assertAlmostEqual(greeks.delta[row], tree.delta, delta=0.02)
+            self.assertAlmostEqual(greeks.gamma[row], tree.gamma, delta=0.005)
+            self.assertAlmostEqual(greeks.theta[row], tree.theta, delta=0.05 * abs(tree.theta) + 0.2)
+            bumped = MarketState(state.spot_price, state.risk_free_rate, state.volatility + 0.01, state.dividend_yield)
+            lattice_vega = (lattice.price(instrument, bumped) - lattice.price(instrument, state)) / 0.01
+            self.assertAlmostEqual(greeks.vega[row], lattice_vega, delta=0.05 * abs(lattice_vega) + 0.5)
+
+    def test_exercise_boundary(self):
+        # Puts: the table price equals intrinsic just below S*, and exceeds it above.
+        T, sigma = 0.5, 0.3
+        s_star = float(self.table.exercise_boundary(T, sigma, False))
+        self.assertTrue(0.5 < s_star < 1.0)
+        below = self.table.interpolate("price", np.log(s_star) - 0.05, T, sigma, False)
+        above = self.table.interpolate("price", np.log(s_star) + 0.05, T, sigma, False)
+        self.assertAlmostEqual(float(below), 1.0 - s_star * np.exp(-0.05), delta=1e-3)
+        self.assertGreater(float(above), 1.0 - s_star * np.exp(0.05) + 1e-3)
+
+    def test_outside_grid_uses_fallback(self):
+        market = MarketState(100.0, RATE, 0.3, DIVIDEND)
+        deep = VanillaOption.american_put(300.0, 1.0)
+        expected = BinomialPricingEngine(step_count=self.table.steps).price(deep, market)
+        self.assertAlmostEqual(self.engine.price(deep, market), expected, places=10)
+        european = VanillaOption.european_put(100.0, 1.0)
+        self.assertGreater(self.engine.price(VanillaOption.american_put(100.0, 1.0), market),
+                           self.engine.price(european, market))
+
+    def test_rejects_other_market(self):
+        with self.assertRaises(ValueError):
+            self.engine.price(VanillaOption.american_put(100.0, 1.0), MarketState(100.0, 0.01, 0.3, DIVIDEND))
+
+    def test_save_and_load_memory_mapped(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.table.save(directory)
+            loaded = AmericanPriceTable.load(directory)
+            self.assertIsInstance(loaded.price, np.memmap)
+            self.assertEqual(loaded.error_bound, self.table.error_bound)
+            batch, market = self._random_book(20)
+            np.testing.assert_array_equal(
+                AmericanTableEngine(loaded).price_batch(batch, market), self.engine.price_batch(batch, market)
+            )
+            del loaded
+
+if __name__ == '__main__':
+    unittest.main()
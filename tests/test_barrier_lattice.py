@@ -0,0 +1,103 @@
+import sys
+import os
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.enums import BarrierType
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.domain.barrier_formulas import barrier_price
+from derivatives_pricer.domain.analytic_formulas import black_scholes_price
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.instruments.batch import InstrumentBatch
+from derivatives_pricer.engines.barrier_lattice import BarrierLatticeEngine
+from derivatives_pricer.engines.binomial import BinomialPricingEngine
+
+UP = (BarrierType.UP_AND_OUT, BarrierType.UP_AND_IN)
+KNOCK_IN = (BarrierType.UP_AND_IN, BarrierType.DOWN_AND_IN)
+
+class TestBarrierFormulas(unittest.TestCase):
+
+    def test_in_out_parity(self):
+        for is_up, barrier in ((True, 120.0), (False, 85.0)):
+            for is_call in (True, False):
+                knock_in = barrier_price(100.0, 100.0, barrier, 1.0, 0.05, 0.25, 0.02, is_call, is_up, True)
+                knock_out = barrier_price(100.0, 100.0, barrier, 1.0, 0.05, 0.25, 0.02, is_call, is_up, False)
+                vanilla = black_scholes_price(100.0, 100.0, 1.0, 0.05, 0.25, 0.02, is_call)
+                self.assertAlmostEqual(float(knock_in + knock_out), vanilla, places=10)
+                self.assertGreater(float(knock_in), 0.0)
+                self.assertGreater(float(knock_out), 0.0)
+
+    def test_reference_values(self):
+        # QuantLib AnalyticBarrierEngine, S=100, K=90, T=1, r=0.08, q=0.04, sigma=0.25.
+        down_out = barrier_price(100.0, 90.0, 95.0, 1.0, 0.08, 0.25, 0.04, True, False, False)
+        up_in = barrier_price(100.0, 90.0, 105.0, 1.0, 0.08, 0.25, 0.04, True, True, True)
+        self.assertAlmostEqual(float(down_out), 6.635233733716632, places=10)
+        self.assertAlmostEqual(float(up_in), 16.7432266198476, places=10)
+
+class TestBarrierLatticeEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.25, 0.02)
+
+    def _closed_form(self, strike, barrier, barrier_type, is_call):
+        return float(barrier_price(100.0, strike, barrier, 1.0, 0.05, 0.25, 0.02, is_call,
+                                   barrier_type in UP, barrier_type in KNOCK_IN))
+
+    def test_european_matches_closed_form(self):
+        tolerance = {"trinomial": 0.01, "adaptive": 0.005}
+        for mesh, tol in tolerance.items():
+            engine = BarrierLatticeEngine(step_count=400, mesh=mesh)
+            for barrier_type in BarrierType:
+                # 115 puts the barrier at a non-integer number of unstretched layers.
+                barrier = 115.0 if barrier_type in UP else 85.0
+                for is_call in (True, False):
+                    for strike in (90.0, 105.0):
+                        option = ExoticOption.barrier_option(strike, barrier, barrier_type, 1.0, is_call)
+                        expected = self._closed_form(strike, barrier, barrier_type, is_call)
+                        self.assertAlmostEqual(engine.price(option, self.market), expected, delta=tol,
+                                               msg=f"{mesh} {barrier_type.name} call={is_call} K={strike}")
+
+    def test_american_meshes_agree(self):
+        trinomial = BarrierLatticeEngine(step_count=800)
+        adaptive = BarrierLatticeEngine(step_count=400, mesh="adaptive")
+        for barrier_type, barrier, is_call in ((BarrierType.DOWN_AND_OUT, 80.0, False),
+                                               (BarrierType.UP_AND_OUT, 120.0, True),
+                                               (BarrierType.UP_AND_IN, 115.0, False)):
+            american = ExoticOption.barrier_option(100.0, barrier, barrier_type, 1.0, is_call, american=True)
+            european = ExoticOption.barrier_option(100.0, barrier, barrier_type, 1.0, is_call)
+            price = trinomial.price(american, self.market)
+            self.assertAlmostEqual(price, adaptive.price(american, self.market), delta=0.01)
+            self.assertGreaterEqual(price, trinomial.price(european, self.market) - 1e-9)
+
+    def test_unreachable_barrier_is_vanilla(self):
+        option = ExoticOption.barrier_option(100.0, 1e4, BarrierType.UP_AND_OUT, 1.0, False, american=True)
+        vanilla = BinomialPricingEngine(step_count=2000).price(VanillaOption.american_put(100.0, 1.0), self.market)
+        for mesh in ("trinomial", "adaptive"):
+            self.assertAlmostEqual(BarrierLatticeEngine(800, mesh).price(option, self.market), vanilla, delta=0.005)
+
+    def test_spot_through_barrier(self):
+        engine = BarrierLatticeEngine(step_count=400)
+        knocked_out = ExoticOption.barrier_option(100.0, 95.0, BarrierType.UP_AND_OUT, 1.0, False)
+        knocked_in = ExoticOption.barrier_option(100.0, 95.0, BarrierType.UP_AND_IN, 1.0, False)
+        self.assertEqual(engine.price(knocked_out, self.market), 0.0)
+        self.assertAlmostEqual(engine.price(knocked_in, self.market),
+                               black_scholes_price(100.0, 100.0, 1.0, 0.05, 0.25, 0.02, False), delta=0.01)
+
+    def test_batch_keeps_american_exercise(self):
+        option = ExoticOption.barrier_option(100.0, 80.0, BarrierType.DOWN_AND_OUT, 1.0, False, american=True)
+        batch = InstrumentBatch.from_instruments([option])
+        self.assertEqual(batch.instrument(0), option)
+        engine = BarrierLatticeEngine(step_count=200)
+        self.assertEqual(engine.price_batch(batch, self.market)[0], engine.price(option, self.market))
+
+    def test_rejects_other_instruments(self):
+        with self.assertRaises(TypeError):
+            BarrierLatticeEngine().price(VanillaOption.european_call(100.0, 1.0), self.market)
+        with self.assertRaises(ValueError):
+            BarrierLatticeEngine(mesh="binomial")
+
+if __name__ == '__main__':
+    unittest.main()
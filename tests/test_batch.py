@@ -0,0 +1,90 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.instruments.batch import InstrumentBatch, PUT, AMERICAN
+from derivatives_pricer.domain.payoff import AsianPayoff
+from derivatives_pricer.domain.exercise import AmericanExercise
+from derivatives_pricer.engines.analytic import BlackScholesEngine
+from derivatives_pricer.engines.binomial import BinomialPricingEngine
+from derivatives_pricer.engines.monte_carlo import MonteCarloEngine
+
+class TestColumnarBatches(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.01)
+        self.vanillas = [
+            VanillaOption.european_call(100.0, 1.0),
+            VanillaOption.european_put(90.0, 0.5),
+            VanillaOption.american_put(110.0, 2.0),
+        ]
+        self.exotics = [
+            ExoticOption.barrier_up_out_call(100.0, 150.0, 1.0),
+            ExoticOption.asian_call(95.0, 0.75),
+        ]
+
+    def test_round_trip(self):
+        instruments = self.vanillas + self.exotics
+        batch = InstrumentBatch.from_instruments(instruments)
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch.to_instruments(), instruments)
+
+        # Every column survives, including the exercise style of Asian rows.
+        american_asian = ExoticOption(AsianPayoff(100.0, "Put"), 1.0, AmericanExercise())
+        batch = InstrumentBatch.from_instruments([american_asian])
+        self.assertEqual(batch.exercise[0], AMERICAN)
+        self.assertEqual(batch.to_instruments(), [american_asian])
+
+        markets = [self.market, MarketState(50.0, 0.01, 0.3)]
+        self.assertEqual(MarketStateBatch.from_states(markets).to_states(), markets)
+
+    def test_zero_copy_construction(self):
+        strikes = np.linspace(80.0, 120.0, 41)
+        expiries = np.ones(41)
+        types = np.full(41, PUT, dtype=np.int8)
+        batch = InstrumentBatch.from_arrays(strikes, expiries, types, exercise=AMERICAN)
+
+        self.assertIs(batch.strike, strikes)
+        self.assertIs(batch.option_type, types)
+        self.assertTrue(np.all(batch.is_american))
+        self.assertTrue(np.shares_memory(batch[5:10].strike, strikes))
+
+        spots = np.linspace(90.0, 110.0, 41)
+        markets = MarketStateBatch(spots, np.full(41, 0.05), np.full(41, 0.2), np.zeros(41))
+        self.assertIs(markets.spot_price, spots)
+
+    def test_black_scholes_batch_matches_loop(self):
+        engine = BlackScholesEngine()
+        batch = InstrumentBatch.from_instruments(self.vanillas)
+        expected = [engine.price(o, self.market) for o in self.vanillas]
+        np.testing.assert_allclose(engine.price_batch(batch, self.market), expected, rtol=1e-12)
+
+        with self.assertRaises(TypeError):
+            engine.price_batch(InstrumentBatch.from_instruments(self.exotics), self.market)
+
+    def test_binomial_batch_per_row_markets(self):
+        engine = BinomialPricingEngine(step_count=200)
+        batch = InstrumentBatch.from_instruments(self.vanillas)
+        states = [self.market, MarketState(95.0, 0.03, 0.25), MarketState(120.0, 0.08, 0.15, 0.02)]
+        expected = [engine.price(o, m) for o, m in zip(self.vanillas, states)]
+        prices = engine.price_batch(batch, MarketStateBatch.from_states(states))
+        np.testing.assert_allclose(prices, expected, rtol=1e-9)
+
+    def test_default_batch_materializes(self):
+        engine = MonteCarloEngine(num_paths=2000, num_steps=10, seed=4)
+        batch = InstrumentBatch.from_instruments(self.exotics)
+        expected = [engine.price(o, self.market) for o in self.exotics]
+        np.testing.assert_allclose(engine.price_batch(batch, self.market), expected)
+
+        with self.assertRaises(ValueError):
+            engine.price_batch(batch, MarketStateBatch.broadcast(self.market, 3))
+
+if __name__ == '__main__':
+    unittest.main()
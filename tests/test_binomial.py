@@ -1,15 +1,23 @@
 import sys
 import os
 import unittest
+import threading
+import tracemalloc
 from datetime import date
 
+import numpy as np
+
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from derivatives_pricer.domain.enums import OptionType, ExerciseStyle
 from derivatives_pricer.domain.market import MarketState
 from derivatives_pricer.instruments.options import VanillaOption
-from derivatives_pricer.engines.binomial import BinomialPricingEngine
+from derivatives_pricer.engines.binomial import (
+    BinomialPricingEngine, BinomialLattice, BinomialParameterizer, rollback_vanilla_batch
+)
+from derivatives_pricer.domain.payoff import Payoff, PutPayoff
+from derivatives_pricer.domain.exercise import AmericanExercise
 
 class TestBinomialPricing(unittest.TestCase):
     
@@ -53,5 +61,134 @@ class TestBinomialPricing(unittest.TestCase):
         
         self.assertGreater(amer_price, euro_price)
 
+    def test_tree_greeks_match_black_scholes(self):
+        """European tree Greeks converge to the closed-form values."""
+        option = VanillaOption.european_call(strike=100.0, expiry=1.0)
+        greeks = self.engine.price_with_greeks(option, self.market)
+
+        # Closed-form: delta = N(d1) = 0.6368, gamma = 0.01876, theta = -6.414
+        self.assertAlmostEqual(greeks.price, self.engine.price(option, self.market), places=12)
+        self.assertAlmostEqual(greeks.delta, 0.6368, delta=0.002)
+        self.assertAlmostEqual(greeks.gamma, 0.01876, delta=0.0005)
+        self.assertAlmostEqual(greeks.theta, -6.414, delta=0.05)
+
+    def test_tree_greeks_match_bumped_american(self):
+        """American put delta agrees with bump-and-reprice; gamma exceeds the European one."""
+        option = VanillaOption.american_put(strike=100.0, expiry=1.0)
+        greeks = self.engine.price_with_greeks(option, self.market)
+
+        h = 1.0
+        up = self.engine.price(option, MarketState(100.0 + h, 0.05, 0.20, 0.0))
+        down = self.engine.price(option, MarketState(100.0 - h, 0.05, 0.20, 0.0))
+        self.assertAlmostEqual(greeks.delta, (up - down) / (2 * h), delta=0.005)
+        # Bumped lattice gamma oscillates with node alignment, so compare to BS instead.
+        self.assertGreater(greeks.gamma, 0.01876)
+        self.assertLess(greeks.delta, 0.0)
+
+    def test_greeks_batch_matches_single(self):
+        """The column-batched lattice agrees with one rollback per contract."""
+        options = [
+            VanillaOption.american_put(90.0, 0.5),
+            VanillaOption.european_call(100.0, 1.0),
+            VanillaOption.american_put(110.0, 2.0),
+            VanillaOption.european_put(105.0, 0.25),
+        ]
+        batch = self.engine.price_with_greeks_batch(options, self.market)
+        for option, result in zip(options, batch):
+            single = self.engine.price_with_greeks(option, self.market)
+            self.assertAlmostEqual(result.price, single.price, places=9)
+            self.assertAlmostEqual(result.delta, single.delta, places=9)
+            self.assertAlmostEqual(result.gamma, single.gamma, places=9)
+            self.assertAlmostEqual(result.theta, single.theta, places=7)
+
+class _SquaredPut(Payoff):
+    """A payoff without an in-place implementation."""
+    def __call__(self, prices):
+        return np.maximum(100.0 - prices, 0.0) ** 2
+
+    @property
+    def name(self):
+        return "Squared put"
+
+class TestInPlaceLattice(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.02)
+        self.engine = BinomialPricingEngine(step_count=300, backend="numpy")
+
+    def test_matches_column_lattice(self):
+        options = [VanillaOption.american_put(95.0, 0.75), VanillaOption.european_call(105.0, 1.5)]
+        columns = dict(
+            spot=np.full(2, 100.0), strike=np.array([95.0, 105.0]), expiry=np.array([0.75, 1.5]),
+            rate=np.full(2, 0.05), volatility=np.full(2, 0.20), dividend_yield=np.full(2, 0.02),
+            is_call=np.array([False, True]), is_american=np.array([True, False]),
+        )
+        expected, _, _ = rollback_vanilla_batch(**columns, steps=300)
+        for option, price in zip(options, expected):
+            self.assertAlmostEqual(self.engine.price(option, self.market), price, places=10)
+
+    def test_lattice_reused_per_thread(self):
+        lattice = BinomialLattice.acquire(300)
+        self.engine.price(VanillaOption.american_put(100.0, 1.0), self.market)
+        self.assertIs(BinomialLattice.acquire(300), lattice)
+        self.assertIsNot(BinomialLattice.acquire(301), lattice)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(BinomialLattice.acquire(300)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], lattice)
+
+    def test_lattice_caller_managed_rollback(self):
+        """The (market, params, steps) constructor and value-passing steps still work."""
+        option = VanillaOption.american_put(100.0, 1.0)
+        steps = 200
+        lattice = BinomialLattice(self.market, BinomialParameterizer.calculate(self.market, 1.0, steps), steps)
+        values = lattice.terminal_values(option).copy()
+        for _ in range(steps):
+            # A caller-owned array is copied in; the input itself is left untouched.
+            before = values.copy()
+            rolled = lattice.backward_induction_step(values, option)
+            np.testing.assert_array_equal(values, before)
+            values = rolled.copy()
+        engine = BinomialPricingEngine(step_count=steps, backend="numpy")
+        self.assertAlmostEqual(values[0], engine.price(option, self.market), places=12)
+
+    def test_rollback_does_not_allocate_per_step(self):
+        option = VanillaOption.american_put(100.0, 1.0)
+        engine = BinomialPricingEngine(step_count=2000, backend="numpy")
+        engine.price(option, self.market)  # warm the lattice and parameter caches
+        tracemalloc.start()
+        try:
+            engine.price(option, self.market)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # One 2001-node layer is 16 KB; a full-sized temporary per step would show up here.
+        self.assertLess(peak, 8 * 1024)
+
+    def test_custom_payoff_falls_back_to_copy(self):
+        """Payoffs without `evaluate_into` still roll back correctly through the default."""
+        option = VanillaOption(_SquaredPut(), AmericanExercise(), 1.0, 100.0)
+        params = BinomialParameterizer.calculate(self.market, 1.0, 300)
+        # Allocating reference rollback.
+        spots = 100.0 * params.u ** (300 - 2.0 * np.arange(301))
+        values = option.calculate_payoff(spots)
+        for _ in range(300):
+            spots = spots[:-1] / params.u
+            continuation = params.df * (params.p * values[:-1] + (1 - params.p) * values[1:])
+            values = np.maximum(option.calculate_payoff(spots), continuation)
+        self.assertAlmostEqual(self.engine.price(option, self.market), values[0], places=9)
+
+    def test_in_place_strategies_match_allocating_ones(self):
+        spots = np.linspace(80.0, 120.0, 9)
+        continuation = np.linspace(0.5, 15.0, 9)
+        intrinsic = PutPayoff(100.0).evaluate_into(spots, np.empty(9))
+        np.testing.assert_array_equal(intrinsic, PutPayoff(100.0)(spots))
+        expected = AmericanExercise().apply(intrinsic, continuation)
+        result = AmericanExercise().apply_inplace(intrinsic, continuation)
+        self.assertIs(result, continuation)
+        np.testing.assert_array_equal(result, expected)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,115 @@
+import sys
+import os
+import threading
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.engines.interface import PricingEngine
+from derivatives_pricer.engines.binomial import BinomialPricingEngine
+from derivatives_pricer.engines.monte_carlo import MonteCarloEngine
+from derivatives_pricer.engines.cache import CachedPricingEngine
+
+class CountingEngine(PricingEngine):
+    """Returns the spot price and records how often it was asked."""
+    def __init__(self):
+        self.calls = 0
+
+    def price(self, instrument, market_state):
+        self.calls += 1
+        return market_state.spot_price
+
+class TestPricingCache(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.0)
+        self.option = VanillaOption.american_put(strike=100.0, expiry=1.0)
+
+    def test_repeated_quote_hits_cache(self):
+        inner = CountingEngine()
+        engine = CachedPricingEngine(inner)
+
+        first = engine.price(self.option, self.market)
+        second = engine.price(VanillaOption.american_put(strike=100.0, expiry=1.0),
+                              MarketState(100.0, 0.05, 0.20, 0.0))
+
+        self.assertEqual(first, second)
+        self.assertEqual(inner.calls, 1)
+        stats = engine.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+        self.assertAlmostEqual(stats.hit_rate, 0.5)
+
+    def test_matches_uncached_binomial(self):
+        engine = BinomialPricingEngine(step_count=200)
+        cached = CachedPricingEngine(engine)
+        self.assertEqual(cached.price(self.option, self.market),
+                         engine.price(self.option, self.market))
+
+    def test_lru_eviction(self):
+        inner = CountingEngine()
+        engine = CachedPricingEngine(inner, max_size=2)
+        markets = [MarketState(s, 0.05, 0.2) for s in (90.0, 100.0, 110.0)]
+
+        engine.price(self.option, markets[0])
+        engine.price(self.option, markets[1])
+        engine.price(self.option, markets[0])  # refresh 90
+        engine.price(self.option, markets[2])  # evicts 100
+        engine.price(self.option, markets[0])
+
+        self.assertEqual(inner.calls, 3)
+        self.assertEqual(engine.stats().evictions, 1)
+        self.assertEqual(engine.stats().size, 2)
+
+    def test_ttl_expiry(self):
+        inner = CountingEngine()
+        engine = CachedPricingEngine(inner, ttl=0.01)
+        engine.price(self.option, self.market)
+        time.sleep(0.02)
+        engine.price(self.option, self.market)
+        self.assertEqual(inner.calls, 2)
+
+    def test_quantization_shares_bucket(self):
+        inner = CountingEngine()
+        engine = CachedPricingEngine(inner, market_quantum={"spot_price": 0.01})
+        a = engine.price(self.option, MarketState(100.001, 0.05, 0.2))
+        b = engine.price(self.option, MarketState(99.999, 0.05, 0.2))
+        self.assertEqual(inner.calls, 1)
+        self.assertAlmostEqual(a, 100.0)
+        self.assertEqual(a, b)
+
+        with self.assertRaises(ValueError):
+            CachedPricingEngine(inner, market_quantum={"spot": 0.01})
+
+    def test_seed_is_part_of_key(self):
+        option = VanillaOption.european_call(100.0, 1.0)
+        a = CachedPricingEngine(MonteCarloEngine(num_paths=2000, num_steps=10, seed=1))
+        b = MonteCarloEngine(num_paths=2000, num_steps=10, seed=2)
+        self.assertEqual(a.price(option, self.market), a.engine.price(option, self.market))
+        self.assertNotEqual(a.configuration, b.configuration)
+
+    def test_thread_safety(self):
+        inner = CountingEngine()
+        engine = CachedPricingEngine(inner, max_size=8)
+        markets = [MarketState(float(s), 0.05, 0.2) for s in range(1, 17)]
+
+        def worker():
+            for _ in range(50):
+                for m in markets:
+                    self.assertEqual(engine.price(self.option, m), m.spot_price)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = engine.stats()
+        self.assertEqual(stats.hits + stats.misses, 4 * 50 * 16)
+        self.assertLessEqual(stats.size, 8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.calibration import (
+    OptionChain, HestonParameters, HestonCalibrator, heston_price,
+    MertonParameters, MertonCalibrator, merton_price, SVIParameters, SVICalibrator,
+)
+from derivatives_pricer.domain.analytic_formulas import black_scholes_price_vectorized, implied_volatility_vectorized
+from derivatives_pricer.math import dual
+from derivatives_pricer.math.optimize import levenberg_marquardt
+
+SPOT, RATE, DIVIDEND = 100.0, 0.03, 0.01
+HESTON = HestonParameters(v0=0.04, kappa=1.5, theta=0.06, xi=0.6, rho=-0.7)
+MERTON = MertonParameters(sigma=0.15, jump_intensity=0.8, jump_mean=-0.12, jump_volatility=0.18)
+
+def _grid(expiries=(0.1, 0.25, 0.5, 1.0, 2.0), strikes=np.linspace(70.0, 140.0, 15)):
+    expiry, strike = (a.ravel() for a in np.meshgrid(expiries, strikes, indexing="ij"))
+    is_call = strike >= SPOT * np.exp((RATE - DIVIDEND) * expiry)
+    return strike, expiry, is_call
+
+def _model_chain(pricer, parameters) -> OptionChain:
+    """Chain quoted at the model's own prices, so a calibration should recover `parameters`."""
+    strike, expiry, is_call = _grid()
+    template = OptionChain(SPOT, RATE, DIVIDEND, strike, expiry, is_call, np.ones_like(strike))
+    return OptionChain(SPOT, RATE, DIVIDEND, strike, expiry, is_call, pricer(parameters, template))
+
+def _finite_difference(pricer, x, chain, h=1e-6):
+    return np.stack([(pricer(x + h * e, chain) - pricer(x - h * e, chain)) / (2.0 * h)
+                     for e in np.eye(len(x))], axis=1)
+
+class TestCalibrationTools(unittest.TestCase):
+
+    def test_implied_volatility_round_trip(self):
+        strike, expiry, is_call = _grid()
+        vol = np.linspace(0.15, 1.5, len(strike))
+        price = black_scholes_price_vectorized(SPOT, strike, expiry, RATE, vol, DIVIDEND, is_call)
+        recovered = implied_volatility_vectorized(price, SPOT, strike, expiry, RATE, DIVIDEND, is_call)
+        np.testing.assert_allclose(recovered, vol, atol=1e-8)
+        # Below intrinsic value there is no implied volatility.
+        self.assertTrue(np.isnan(implied_volatility_vectorized(np.array([0.0]), SPOT, np.array([50.0]),
+                                                               np.array([1.0]), RATE, DIVIDEND,
+                                                               np.array([True])))[0])
+        # Volatilities outside the search bracket are not clipped to its edges.
+        outside = black_scholes_price_vectorized(SPOT, 100.0, 1.0, RATE, np.array([1e-5, 6.0]), DIVIDEND, True)
+        self.assertTrue(np.all(np.isnan(implied_volatility_vectorized(outside, SPOT, 100.0, 1.0, RATE, DIVIDEND, True))))
+
+    def test_levenberg_marquardt_rosenbrock(self):
+        def residuals(x):
+            r = np.array([10.0 * (x[1] - x[0] ** 2), 1.0 - x[0]])
+            return r, np.array([[-20.0 * x[0], 10.0], [-1.0, 0.0]])
+
+        result = levenberg_marquardt(residuals, np.array([-1.2, 1.0]))
+        self.assertTrue(result.converged)
+        np.testing.assert_allclose(result.x, [1.0, 1.0], atol=1e-8)
+        # Bounds are respected: the constrained optimum sits on the boundary.
+        bounded = levenberg_marquardt(residuals, np.array([0.0, 0.0]), upper=np.array([0.5, np.inf]))
+        self.assertAlmostEqual(bounded.x[0], 0.5, places=8)
+
+    def test_dual_gradient(self):
+        a, b = dual.Dual.variables([0.7, -0.3])
+        u = np.linspace(0.1, 3.0, 5)
+        f = dual.exp(a * u) / (1.0 + b * b) + dual.sqrt(a) * dual.log(u + a)
+        expected_a = u * np.exp(0.7 * u) / 1.09 + 0.5 / np.sqrt(0.7) * np.log(u + 0.7) + np.sqrt(0.7) / (u + 0.7)
+        expected_b = -np.exp(0.7 * u) * 2.0 * -0.3 / 1.09 ** 2
+        np.testing.assert_allclose(f.gradient, [expected_a, expected_b], rtol=1e-12)
+
+class TestHeston(unittest.TestCase):
+
+    def test_matches_reference_prices(self):
+        # QuantLib AnalyticHestonEngine, Actual/365 day counts.
+        strike = np.array([80.0, 100.0, 120.0, 100.0])
+        expiry = np.array([91.0, 365.0, 365.0, 1095.0]) / 365.0
+        chain = OptionChain(SPOT, RATE, DIVIDEND, strike, expiry, strike >= 100.0, np.ones(4))
+        expected = [0.2673824174, 8.8192082643, 1.3526769269, 16.8960565295]
+        np.testing.assert_allclose(heston_price(HESTON, chain), expected, atol=1e-8)
+
+    def test_gradient_matches_finite_differences(self):
+        chain = _model_chain(heston_price, HESTON)
+        x = np.array([0.04, 1.5, 0.06, 0.6, -0.7])
+        _, jacobian = heston_price(x, chain, gradient=True)
+        np.testing.assert_allclose(jacobian, _finite_difference(heston_price, x, chain), atol=1e-5)
+
+    def test_recovers_parameters_and_warm_starts(self):
+        calibrator = HestonCalibrator()
+        first = calibrator.calibrate(_model_chain(heston_price, HESTON))
+        self.assertTrue(first.converged)
+        np.testing.assert_allclose([first.parameters.v0, first.parameters.kappa, first.parameters.theta,
+                                    first.parameters.xi, first.parameters.rho],
+                                   [0.04, 1.5, 0.06, 0.6, -0.7], rtol=1e-5)
+        self.assertLess(first.elapsed, 1.0)
+
+        # Next snapshot: start from the previous fit rather than the generic guess.
+        moved = _model_chain(heston_price, HestonParameters(0.045, 1.5, 0.06, 0.6, -0.7))
+        warm = calibrator.calibrate(moved)
+        cold = HestonCalibrator().calibrate(moved)
+        self.assertAlmostEqual(warm.parameters.v0, 0.045, places=6)
+        self.assertLessEqual(warm.iterations, cold.iterations)
+
+class TestMerton(unittest.TestCase):
+
+    def test_gradient_matches_finite_differences(self):
+        chain = _model_chain(merton_price, MERTON)
+        x = np.array([0.15, 0.8, -0.12, 0.18])
+        _, jacobian = merton_price(x, chain, gradient=True)
+        np.testing.assert_allclose(jacobian, _finite_difference(merton_price, x, chain), atol=1e-6)
+
+    def test_series_length_follows_jump_intensity(self):
+        strike = np.array([80.0, 100.0, 120.0])
+        chain = OptionChain(SPOT, RATE, DIVIDEND, strike, np.full(3, 5.0), strike >= 100.0, np.ones(3))
+        for intensity in (0.8, 5.0, 20.0):
+            parameters = MertonParameters(0.2, intensity, -0.1, 0.2)
+            np.testing.assert_allclose(merton_price(parameters, chain), merton_price(parameters, chain, terms=2000),
+                                       atol=1e-10, err_msg=str(intensity))
+
+    def test_recovers_parameters(self):
+        result = MertonCalibrator().calibrate(_model_chain(merton_price, MERTON))
+        self.assertTrue(result.converged)
+        np.testing.assert_allclose([result.parameters.sigma, result.parameters.jump_intensity,
+                                    result.parameters.jump_mean, result.parameters.jump_volatility],
+                                   [0.15, 0.8, -0.12, 0.18], rtol=1e-5)
+
+class TestSVI(unittest.TestCase):
+
+    def setUp(self):
+        strike, expiry, _ = _grid(expiries=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0), strikes=np.linspace(60.0, 150.0, 30))
+        self.slices = {t: SVIParameters(a=0.01 * t + 0.005, b=0.1 * np.sqrt(t) + 0.02, rho=-0.4, m=0.05, sigma=0.2)
+                       for t in np.unique(expiry)}
+        k = np.log(strike / (SPOT * np.exp((RATE - DIVIDEND) * expiry)))
+        vol = np.array([self.slices[t].implied_volatility(x, t) for t, x in zip(expiry, k)])
+        self.chain = OptionChain.from_implied_vols(SPOT, RATE, DIVIDEND, strike, expiry, vol)
+
+    def test_jacobian_matches_finite_differences(self):
+        k = np.linspace(-0.8, 0.6, 25)
+        x = np.array([0.02, 0.1, -0.3, 0.05, 0.2])
+        h = 1e-7
+        expected = np.stack([(SVIParameters(*(x + h * e)).total_variance(k)
+                              - SVIParameters(*(x - h * e)).total_variance(k)) / (2.0 * h) for e in np.eye(5)], axis=1)
+        np.testing.assert_allclose(SVIParameters(*x).jacobian(k), expected, atol=1e-7)
+
+    def test_recovers_every_slice(self):
+        result = SVICalibrator().calibrate(self.chain)
+        surface = result.parameters
+        self.assertEqual(surface.expiries, tuple(sorted(self.slices)))
+        self.assertLess(result.rmse, 1e-8)
+        self.assertLess(result.elapsed, 1.0)
+        k = np.linspace(-0.4, 0.3, 9)
+        for expiry, fitted in zip(surface.expiries, surface.slices):
+            np.testing.assert_allclose(fitted.total_variance(k), self.slices[expiry].total_variance(k), atol=1e-9)
+
+        # Between slices total variance is linear in expiry.
+        midpoint = surface.total_variance(k, 0.75)
+        expected = 0.5 * (self.slices[0.5].total_variance(k) + self.slices[1.0].total_variance(k))
+        np.testing.assert_allclose(midpoint, expected, atol=1e-9)
+
+    def test_warm_start_reuses_previous_slices(self):
+        calibrator = SVICalibrator()
+        cold = calibrator.calibrate(self.chain)
+        warm = calibrator.calibrate(self.chain)
+        self.assertLess(warm.iterations, cold.iterations)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import sys
+import os
+import subprocess
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.math.analytics import norm_cdf, norm_cdf_array
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Seconds allowed for importing the engines after NumPy is loaded. The lazy layout
+# takes well under 0.1s; importing scipy.stats alone takes over a second.
+IMPORT_BUDGET = 0.5
+
+HEAVY_MODULES = ("scipy", "numba", "pyarrow", "asyncio", "multiprocessing.shared_memory")
+
+COLD_START = f"""
+import sys, time
+import numpy
+start = time.perf_counter()
+from derivatives_pricer.engines import BlackScholesEngine, BinomialPricingEngine, MonteCarloEngine
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+"""
+
+class TestImportTime(unittest.TestCase):
+
+    def test_cold_start_within_budget(self):
+        # Best of three fresh interpreters, to ride out a noisy machine.
+        timings = []
+        for _ in range(3):
+            result = subprocess.run([sys.executable, "-c", COLD_START], cwd=PROJECT_ROOT,
+                                    capture_output=True, text=True, check=True)
+            elapsed, loaded = result.stdout.splitlines()
+            self.assertEqual(loaded, "", f"heavy modules imported eagerly: {loaded}")
+            timings.append(float(elapsed))
+        self.assertLess(min(timings), IMPORT_BUDGET)
+
+    def test_lazy_package_attributes(self):
+        import derivatives_pricer.engines as engines
+        self.assertIn("MonteCarloEngine", dir(engines))
+        self.assertIs(engines.BlackScholesEngine, engines.analytic.BlackScholesEngine)
+        with self.assertRaises(AttributeError):
+            engines.NoSuchEngine
+
+    def test_normal_cdf(self):
+        x = np.linspace(-8.0, 8.0, 161)
+        np.testing.assert_allclose([norm_cdf(v) for v in x], norm_cdf_array(x), rtol=1e-13, atol=0.0)
+        self.assertAlmostEqual(norm_cdf(0.0), 0.5, places=15)
+        self.assertAlmostEqual(norm_cdf(1.959963984540054), 0.975, places=14)
+
+if __name__ == '__main__':
+    unittest.main()
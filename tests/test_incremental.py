@@ -0,0 +1,108 @@
+import sys
+import os
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.engines.analytic import BlackScholesEngine
+from derivatives_pricer.engines.binomial import BinomialPricingEngine
+from derivatives_pricer.engines.incremental import IncrementalValuator
+
+def _inputs(underlying, spot, vol, dividend=0.0):
+    return {f"{underlying}.spot": spot, f"{underlying}.vol": vol, f"{underlying}.dividend": dividend}
+
+class TestIncrementalValuator(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = BlackScholesEngine()
+        self.valuator = IncrementalValuator(self.engine)
+        for n, strike in enumerate((90.0, 100.0, 110.0)):
+            self.valuator.add_position(("SPX", n), VanillaOption.european_call(strike, 1.0), "SPX",
+                                       inputs={"rate": "USD.rate"})
+            self.valuator.add_position(("NDX", n), VanillaOption.european_put(strike, 0.5), "NDX",
+                                       quantity=-2.0, inputs={"rate": "USD.rate"})
+        self.valuator.update({**_inputs("SPX", 100.0, 0.2), **_inputs("NDX", 105.0, 0.25), "USD.rate": 0.05})
+
+    def test_tick_reprices_only_dependents(self):
+        result = self.valuator.update({"SPX.spot": 101.0})
+        self.assertEqual(set(result.repriced), {("SPX", n) for n in range(3)})
+        self.assertEqual(result.approximated, ())
+        option = VanillaOption.european_call(100.0, 1.0)
+        self.assertAlmostEqual(self.valuator.value(("SPX", 1)).price,
+                               self.engine.price(option, MarketState(101.0, 0.05, 0.2)), places=12)
+
+        # The shared rate input reaches every position; an unchanged value reaches none.
+        self.assertEqual(self.valuator.update({"USD.rate": 0.04}).affected, 6)
+        self.assertEqual(self.valuator.update({"USD.rate": 0.04}).affected, 0)
+
+    def test_book_value(self):
+        expected = 0.0
+        for n, strike in enumerate((90.0, 100.0, 110.0)):
+            expected += self.engine.price(VanillaOption.european_call(strike, 1.0), MarketState(100.0, 0.05, 0.2))
+            expected -= 2.0 * self.engine.price(VanillaOption.european_put(strike, 0.5), MarketState(105.0, 0.05, 0.25))
+        self.assertAlmostEqual(self.valuator.book_value(), expected, places=10)
+        self.valuator.remove_position(("NDX", 0))
+        self.assertNotIn(("NDX", 0), self.valuator.dependents("NDX.spot"))
+
+    def test_missing_input(self):
+        self.valuator.add_position("new", VanillaOption.european_call(100.0, 1.0), "RUT")
+        with self.assertRaises(KeyError):
+            self.valuator.update()
+        self.valuator.update({**_inputs("RUT", 50.0, 0.3), "RUT.rate": 0.05})
+        self.assertTrue(self.valuator.value("new").exact)
+
+    def test_failed_update_applies_no_changes(self):
+        before = self.valuator.value(("SPX", 0)).price
+        self.valuator.add_position("new", VanillaOption.european_call(100.0, 1.0), "RUT")
+        with self.assertRaises(KeyError):
+            self.valuator.update({"SPX.spot": 110.0})
+        self.assertEqual(self.valuator.value(("SPX", 0)).price, before)
+
+        # The rejected change is still a change once the missing inputs arrive.
+        result = self.valuator.update({"SPX.spot": 110.0, **_inputs("RUT", 50.0, 0.3), "RUT.rate": 0.05})
+        self.assertIn(("SPX", 0), result.repriced)
+        self.assertAlmostEqual(self.valuator.value(("SPX", 0)).price,
+                               self.engine.price(VanillaOption.european_call(90.0, 1.0), MarketState(110.0, 0.05, 0.2)),
+                               places=10)
+
+class TestGreekApproximation(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = BinomialPricingEngine(step_count=400)
+        self.option = VanillaOption.american_put(100.0, 1.0)
+        self.valuator = IncrementalValuator(self.engine, approximation_thresholds={"spot": 0.02, "vol": 0.01})
+        self.valuator.add_position("put", self.option, "SPX")
+        self.valuator.update({**_inputs("SPX", 100.0, 0.2), "SPX.rate": 0.05})
+
+    def test_small_moves_use_greeks(self):
+        value = self.valuator.value("put")
+        self.assertLess(value.delta, 0.0)
+        self.assertGreater(value.gamma, 0.0)
+        self.assertGreater(value.vega, 0.0)
+
+        result = self.valuator.update({"SPX.spot": 101.0, "SPX.vol": 0.205})
+        self.assertEqual(result.approximated, ("put",))
+        approximated = self.valuator.value("put")
+        self.assertFalse(approximated.exact)
+        exact = self.engine.price(self.option, MarketState(101.0, 0.05, 0.205))
+        self.assertAlmostEqual(approximated.price, exact, delta=0.01)
+
+    def test_threshold_measured_from_anchor(self):
+        # Each tick is 1%, but the second one takes spot 2.5% away from the anchor.
+        self.assertEqual(self.valuator.update({"SPX.spot": 101.0}).approximated, ("put",))
+        self.assertEqual(self.valuator.update({"SPX.spot": 102.5}).repriced, ("put",))
+        self.assertEqual(self.valuator.value("put").anchor.spot_price, 102.5)
+        # Inputs without a threshold always reprice.
+        self.assertEqual(self.valuator.update({"SPX.rate": 0.051}).repriced, ("put",))
+
+    def test_rejects_bad_thresholds(self):
+        with self.assertRaises(ValueError):
+            IncrementalValuator(self.engine, approximation_thresholds={"dividend": 0.01})
+        with self.assertRaises(ValueError):
+            IncrementalValuator(self.engine, approximation_thresholds={"spot": 0.0})
+
+if __name__ == '__main__':
+    unittest.main()
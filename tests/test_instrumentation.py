@@ -0,0 +1,91 @@
+import sys
+import os
+import unittest
+import tracemalloc
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.common import instrumentation
+from derivatives_pricer.common.instrumentation import InMemorySink, CallbackSink
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.engines.binomial import BinomialPricingEngine
+from derivatives_pricer.engines.monte_carlo import MonteCarloEngine
+from derivatives_pricer.engines.cache import CachedPricingEngine
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.0)
+        self.option = VanillaOption.european_call(100.0, 1.0)
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def test_disabled_records_nothing(self):
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(instrumentation.span("a"), instrumentation.span("b"))
+        with instrumentation.span("a"):
+            instrumentation.increment("a")
+
+    def test_engine_phases_and_counters(self):
+        sink = InMemorySink()
+        instrumentation.enable(sink)
+
+        BinomialPricingEngine(step_count=50, backend="numpy").price(self.option, self.market)
+        MonteCarloEngine(num_paths=1000, num_steps=10, seed=1, backend="numpy").price(self.option, self.market)
+
+        for name in ("binomial.setup", "binomial.rollback", "monte_carlo.simulate",
+                     "monte_carlo.payoff", "monte_carlo.discount", "validation.bind"):
+            self.assertIn(name, sink.spans)
+        self.assertEqual(sink.spans["binomial.rollback"].count, 1)
+        self.assertEqual(sink.counters["binomial.steps"], 50)
+        self.assertEqual(sink.counters["binomial.nodes"], 51 * 52 // 2)
+        self.assertEqual(sink.counters["monte_carlo.paths"], 1000)
+        self.assertIn("monte_carlo.simulate", sink.report())
+
+    def test_cache_counters(self):
+        sink = InMemorySink()
+        engine = CachedPricingEngine(BinomialPricingEngine(step_count=10))
+        instrumentation.enable(sink)
+        engine.price(self.option, self.market)
+        engine.price(self.option, self.market)
+        self.assertEqual(sink.counters["cache.misses"], 1)
+        self.assertEqual(sink.counters["cache.hits"], 1)
+
+    def test_callback_sink_with_memory(self):
+        spans = []
+        instrumentation.enable(CallbackSink(lambda *args: spans.append(args)), track_memory=True)
+
+        with instrumentation.span("outer"):
+            with instrumentation.span("inner"):
+                buffer = bytearray(1_000_000)
+            del buffer
+
+        inner, outer = spans
+        self.assertEqual((inner[0], outer[0]), ("inner", "outer"))
+        self.assertGreaterEqual(inner[2], 1_000_000)
+        # The inner allocation is also the outer span's peak.
+        self.assertGreaterEqual(outer[2], 1_000_000)
+
+    def test_memory_leaves_outside_tracemalloc_alone(self):
+        spans = []
+        tracemalloc.start()
+        try:
+            buffer = bytearray(2_000_000)
+            del buffer
+            instrumentation.enable(CallbackSink(lambda *args: spans.append(args)), track_memory=True)
+            with instrumentation.span("a"):
+                pass
+            instrumentation.disable()
+            # The caller's peak survives and its session is still running.
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[1], 2_000_000)
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(spans[0][0], "a")
+        self.assertIsNone(spans[0][2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.engines.binomial import BinomialPricingEngine, rollback_vanilla_batch
+from derivatives_pricer.engines.monte_carlo import MonteCarloEngine
+from derivatives_pricer.math import kernels
+
+class TestKernelSource(unittest.TestCase):
+    """The kernel source runs as plain Python too, so it is checked without Numba."""
+
+    def test_python_rollback_matches_numpy_lattice(self):
+        n, steps = 4, 60
+        spot = np.full(n, 100.0)
+        strike = np.array([90.0, 100.0, 110.0, 100.0])
+        expiry = np.array([0.5, 1.0, 2.0, 1.0])
+        rate, vol, div = np.full(n, 0.05), np.full(n, 0.2), np.full(n, 0.01)
+        is_call = np.array([True, False, False, True])
+        is_american = np.array([False, True, True, True])
+
+        expected = rollback_vanilla_batch(spot, strike, expiry, rate, vol, div, is_call, is_american, steps)
+
+        dt = expiry / steps
+        u = np.exp(vol * np.sqrt(dt))
+        p = (np.exp((rate - div) * dt) - 1.0 / u) / (u - 1.0 / u)
+        df = np.exp(-rate * dt)
+        price, layer_1, layer_2 = np.empty(n), np.empty((2, n)), np.empty((3, n))
+        kernels.binomial_rollback_batch(spot, strike, np.where(is_call, 1.0, -1.0), is_american,
+                                        u, p * df, (1.0 - p) * df, steps, price, layer_1, layer_2)
+
+        np.testing.assert_allclose(price, expected[0], rtol=1e-10)
+        np.testing.assert_allclose(layer_1, expected[1], rtol=1e-10)
+        np.testing.assert_allclose(layer_2, expected[2], rtol=1e-10)
+
+    def test_backend_resolution(self):
+        self.assertEqual(kernels.resolve_backend("numpy"), "numpy")
+        self.assertIn(kernels.resolve_backend("auto"), ("numpy", "numba"))
+        with self.assertRaises(ValueError):
+            kernels.resolve_backend("cuda")
+
+@unittest.skipUnless(kernels.NUMBA_AVAILABLE, "numba not installed")
+class TestNumbaBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.02)
+
+    def test_binomial_backends_agree(self):
+        numba_engine = BinomialPricingEngine(step_count=300, backend="numba")
+        numpy_engine = BinomialPricingEngine(step_count=300, backend="numpy")
+        for option in (VanillaOption.american_put(100.0, 1.0),
+                       VanillaOption.european_call(95.0, 0.5),
+                       VanillaOption.european_put(120.0, 2.0)):
+            self.assertAlmostEqual(numba_engine.price(option, self.market),
+                                   numpy_engine.price(option, self.market), places=9)
+            a = numba_engine.price_with_greeks(option, self.market)
+            b = numpy_engine.price_with_greeks(option, self.market)
+            self.assertAlmostEqual(a.delta, b.delta, places=9)
+            self.assertAlmostEqual(a.gamma, b.gamma, places=9)
+
+    def test_monte_carlo_backends_agree(self):
+        """Both backends consume the same shocks, so prices match to rounding."""
+        options = (VanillaOption.european_call(100.0, 1.0),
+                   VanillaOption.european_put(100.0, 1.0),
+                   ExoticOption.barrier_up_out_call(100.0, 130.0, 1.0),
+                   ExoticOption.asian_call(100.0, 1.0))
+        for dtype, places in ((np.float64, 9), (np.float32, 3)):
+            numba_engine = MonteCarloEngine(5000, 50, seed=11, dtype=dtype, backend="numba")
+            numpy_engine = MonteCarloEngine(5000, 50, seed=11, dtype=dtype, backend="numpy")
+            for option in options:
+                self.assertAlmostEqual(numba_engine.price(option, self.market),
+                                       numpy_engine.price(option, self.market), places=places)
+
+    def test_fused_state_uses_engine_dtype(self):
+        engine = MonteCarloEngine(1000, 10, seed=2, dtype=np.float32, backend="numba")
+        for state in engine._accumulate_fused(1.0, self.market, engine.make_rng()):
+            self.assertEqual(state.dtype, np.float32)
+
+    def test_global_seed_reproducible(self):
+        option = VanillaOption.european_call(100.0, 1.0)
+        np.random.seed(5)
+        a = MonteCarloEngine(2000, 20, backend="numba").price(option, self.market)
+        np.random.seed(5)
+        b = MonteCarloEngine(2000, 20, backend="numpy").price(option, self.market)
+        self.assertAlmostEqual(a, b, places=9)
+
+if __name__ == '__main__':
+    unittest.main()
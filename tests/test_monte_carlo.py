@@ -0,0 +1,164 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.engines.monte_carlo import MonteCarloEngine, GeometricBrownianMotion
+from derivatives_pricer.math.statistics import RunningMoments
+from derivatives_pricer.domain.enums import BarrierType
+from derivatives_pricer.domain.payoff import Payoff
+from derivatives_pricer.domain.payoff_set import PayoffSet
+
+class TestMonteCarloPrecision(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.0)
+        self.option = VanillaOption.european_call(strike=100.0, expiry=1.0)
+
+    def test_float32_paths(self):
+        process = GeometricBrownianMotion(self.market, dtype=np.float32)
+        paths = process.simulate_paths(T=1.0, steps=10, paths=1000, rng=np.random.default_rng(0))
+        self.assertEqual(paths.dtype, np.float32)
+        self.assertEqual(paths.shape, (10, 1000))
+
+    def test_float32_price_converges(self):
+        """Single precision stays well inside the statistical error."""
+        engine = MonteCarloEngine(num_paths=50000, num_steps=50, seed=3, dtype=np.float32)
+        price = engine.price(self.option, self.market)
+        print(f"Monte Carlo float32 Price (N=50k): {price:.4f}")
+        self.assertAlmostEqual(price, 10.4506, delta=0.15)
+
+    def test_float32_exotics(self):
+        engine = MonteCarloEngine(num_paths=20000, num_steps=50, seed=5, dtype=np.float32)
+        barrier = engine.price(ExoticOption.barrier_up_out_call(100.0, 150.0, 1.0), self.market)
+        asian = engine.price(ExoticOption.asian_call(100.0, 1.0), self.market)
+        self.assertLess(barrier, 10.4506)
+        self.assertLess(asian, 10.4506)
+        self.assertGreater(asian, 0.0)
+
+    def test_float64_default_is_unchanged_by_global_seed(self):
+        np.random.seed(42)
+        a = MonteCarloEngine(num_paths=5000, num_steps=10).price(self.option, self.market)
+        np.random.seed(42)
+        b = MonteCarloEngine(num_paths=5000, num_steps=10).price(self.option, self.market)
+        self.assertEqual(a, b)
+
+    def test_rejects_other_dtypes(self):
+        with self.assertRaises(ValueError):
+            MonteCarloEngine(dtype=np.int32)
+
+    def test_rejects_american_exercise(self):
+        engine = MonteCarloEngine(num_paths=1000, num_steps=10, seed=1)
+        option = ExoticOption.barrier_option(100.0, 130.0, BarrierType.UP_AND_OUT, 1.0, False, american=True)
+        with self.assertRaises(TypeError):
+            engine.price(option, self.market)
+        with self.assertRaises(TypeError):
+            engine.price_many([self.option, option], self.market)
+
+class TestAdaptiveMonteCarlo(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.0)
+        self.option = VanillaOption.european_call(strike=100.0, expiry=1.0)
+
+    def test_running_moments_merge_matches_full_sample(self):
+        values = np.random.default_rng(1).lognormal(3.0, 1.0, 10001)
+        merged = RunningMoments()
+        for chunk in np.array_split(values, 7):
+            merged.merge(RunningMoments.from_samples(chunk))
+        self.assertEqual(merged.count, len(values))
+        self.assertAlmostEqual(merged.mean, values.mean(), places=9)
+        self.assertAlmostEqual(merged.variance / values.var(ddof=1), 1.0, places=10)
+        sums = RunningMoments.from_sums(len(values), values.sum(), np.dot(values, values))
+        self.assertAlmostEqual(sums.variance / values.var(ddof=1), 1.0, places=8)
+
+    def test_fixed_mode_reports_error(self):
+        estimate = MonteCarloEngine(num_paths=20000, num_steps=10, seed=2).estimate(self.option, self.market)
+        self.assertEqual((estimate.paths, estimate.batches), (20000, 1))
+        self.assertTrue(estimate.converged)
+        # Payoff standard deviation is about 14.7 for this call.
+        self.assertAlmostEqual(estimate.standard_error, 14.7 / np.sqrt(20000), delta=0.01)
+
+    def test_stops_at_error_target(self):
+        for backend in ("numpy", "numba"):
+            engine = MonteCarloEngine(num_paths=2000, num_steps=10, seed=4, backend=backend, abs_tol=0.05)
+            estimate = engine.estimate(self.option, self.market)
+            self.assertTrue(estimate.converged)
+            self.assertLessEqual(estimate.standard_error, 0.05)
+            self.assertEqual(estimate.paths, 2000 * estimate.batches)
+            # One batch fewer would not have met the target.
+            self.assertGreater(14.7 / np.sqrt(estimate.paths - 2000), 0.05 * 0.95)
+            self.assertAlmostEqual(estimate.price, 10.4506, delta=4 * estimate.standard_error + 0.1)
+            self.assertEqual(engine.price(self.option, self.market), estimate.price)
+
+    def test_relative_target_and_path_cap(self):
+        engine = MonteCarloEngine(num_paths=1000, num_steps=5, seed=6, rel_tol=1e-6, max_paths=5000)
+        estimate = engine.estimate(self.option, self.market)
+        self.assertFalse(estimate.converged)
+        self.assertEqual(estimate.paths, 5000)
+
+    def test_time_budget(self):
+        engine = MonteCarloEngine(num_paths=1000, num_steps=5, seed=6, time_budget=0.05)
+        estimate = engine.estimate(self.option, self.market)
+        self.assertFalse(estimate.converged)
+        self.assertGreaterEqual(estimate.elapsed, 0.05)
+        self.assertGreater(estimate.batches, 1)
+
+    def test_rejects_non_positive_targets(self):
+        with self.assertRaises(ValueError):
+            MonteCarloEngine(abs_tol=0.0)
+
+class _DigitalCall(Payoff):
+    """A payoff PayoffSet has no fused form for."""
+    def __call__(self, prices):
+        return (prices[-1] > 100.0).astype(float)
+
+    @property
+    def name(self):
+        return "Digital"
+
+class TestPayoffSet(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.01)
+        self.book = [
+            ExoticOption.barrier_option(100.0, level, barrier_type, 1.0, is_call=is_call)
+            for level in (85.0, 95.0, 110.0, 125.0) for barrier_type in BarrierType for is_call in (True, False)
+        ] + [VanillaOption.european_call(strike, 1.0) for strike in (90.0, 100.0, 110.0)] + [
+            ExoticOption.asian_call(100.0, 1.0),
+            ExoticOption(_DigitalCall(), 1.0),
+            VanillaOption.european_put(100.0, 0.5),
+        ]
+
+    def test_matches_individual_payoffs(self):
+        paths = GeometricBrownianMotion(self.market).simulate_paths(1.0, 50, 5000, np.random.default_rng(2))
+        payoffs = [option.payoff_strategy for option in self.book]
+        payoff_set = PayoffSet(payoffs)
+        self.assertTrue(payoff_set.needs_paths)
+        self.assertEqual(payoff_set.required_statistics, {"terminal", "maximum", "minimum", "average"})
+        fused = payoff_set.evaluate(paths)
+        for row, payoff in enumerate(payoffs):
+            np.testing.assert_array_equal(fused[row], payoff(paths))
+
+    def test_price_many_matches_price(self):
+        for backend in ("numpy", "numba"):
+            engine = MonteCarloEngine(num_paths=4000, num_steps=20, seed=8, backend=backend)
+            many = engine.price_many(self.book, self.market)
+            for option, price in zip(self.book, many):
+                self.assertAlmostEqual(price, engine.price(option, self.market), places=10)
+
+    def test_adaptive_estimates_all_converge(self):
+        engine = MonteCarloEngine(num_paths=2000, num_steps=10, seed=3, abs_tol=0.05)
+        estimates = engine.estimate_many(self.book[:6], self.market)
+        self.assertTrue(all(estimate.converged for estimate in estimates))
+        self.assertTrue(all(estimate.standard_error <= 0.05 for estimate in estimates))
+        self.assertEqual(len({estimate.paths for estimate in estimates}), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+import os
+import time
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MultiAssetMarketState
+from derivatives_pricer.domain.analytic_formulas import black_scholes_price
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.engines.multi_asset import (
+    MultiAssetMonteCarloEngine, CorrelatedGBM, correlation_factor
+)
+from derivatives_pricer.math.analytics import norm_cdf_array
+
+def _equicorrelated(n, rho):
+    matrix = np.full((n, n), rho)
+    np.fill_diagonal(matrix, 1.0)
+    return matrix
+
+class TestMultiAssetMarketState(unittest.TestCase):
+
+    def test_hashable_and_validated(self):
+        a = MultiAssetMarketState([100.0, 50.0], [0.2, 0.3], [[1.0, 0.5], [0.5, 1.0]], 0.05)
+        b = MultiAssetMarketState((100.0, 50.0), (0.2, 0.3), np.array([[1.0, 0.5], [0.5, 1.0]]), 0.05, (0.0, 0.0))
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(a.asset(1).spot_price, 50.0)
+        with self.assertRaises(ValueError):
+            MultiAssetMarketState([100.0, 50.0], [0.2], [[1.0, 0.5], [0.5, 1.0]], 0.05)
+        with self.assertRaises(ValueError):
+            MultiAssetMarketState([100.0, 50.0], [0.2, 0.3], [[1.0, 0.5], [0.4, 1.0]], 0.05)
+
+class TestCorrelatedGBM(unittest.TestCase):
+
+    def test_factor_reproduces_correlation(self):
+        matrix = _equicorrelated(5, 0.4)
+        factor = correlation_factor(tuple(map(tuple, matrix)))
+        np.testing.assert_allclose(factor @ factor.T, matrix, atol=1e-12)
+        # Perfect correlation is singular; the eigen fallback still reproduces it.
+        singular = _equicorrelated(3, 1.0)
+        factor = correlation_factor(tuple(map(tuple, singular)))
+        np.testing.assert_allclose(factor @ factor.T, singular, atol=1e-12)
+
+    def test_sample_correlation_and_drift(self):
+        correlation = [[1.0, 0.7, -0.3], [0.7, 1.0, 0.1], [-0.3, 0.1, 1.0]]
+        market = MultiAssetMarketState([100.0, 80.0, 120.0], [0.2, 0.3, 0.25], correlation, 0.05, [0.0, 0.02, 0.01])
+        paths = CorrelatedGBM(market).simulate_paths(1.0, 4, 200_000, np.random.default_rng(3))
+        self.assertEqual(paths.shape, (4, 3, 200_000))
+        log_returns = np.log(paths[-1] / market.spot_array[:, None])
+        np.testing.assert_allclose(np.corrcoef(log_returns), correlation, atol=0.01)
+        forwards = market.spot_array * np.exp(0.05 - market.dividend_array)
+        np.testing.assert_allclose(paths[-1].mean(axis=1), forwards, rtol=0.005)
+
+class TestMultiAssetPayoffs(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = MultiAssetMonteCarloEngine(num_paths=200_000, seed=11)
+
+    def test_spread_matches_margrabe(self):
+        s1, s2, v1, v2, q1, q2, rho, T = 100.0, 95.0, 0.25, 0.20, 0.01, 0.03, 0.4, 1.0
+        market = MultiAssetMarketState([s1, s2], [v1, v2], [[1.0, rho], [rho, 1.0]], 0.05, [q1, q2])
+        estimate = self.engine.estimate(ExoticOption.spread_option(0.0, T), market)
+        sigma = np.sqrt(v1**2 + v2**2 - 2 * rho * v1 * v2)
+        d1 = (np.log(s1 / s2) + (q2 - q1 + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+        d2 = d1 - sigma * np.sqrt(T)
+        exact = s1 * np.exp(-q1 * T) * norm_cdf_array(d1) - s2 * np.exp(-q2 * T) * norm_cdf_array(d2)
+        self.assertLess(abs(estimate.price - exact), 4 * estimate.standard_error)
+
+    def test_perfectly_correlated_basket_is_vanilla(self):
+        # Identical assets with rho = 1 make the basket a single underlying.
+        market = MultiAssetMarketState([100.0] * 4, [0.2] * 4, _equicorrelated(4, 1.0), 0.05, [0.01] * 4)
+        estimate = self.engine.estimate(ExoticOption.basket_option([0.25] * 4, 105.0, 1.0), market)
+        exact = black_scholes_price(100.0, 105.0, 1.0, 0.05, 0.2, 0.01, True)
+        self.assertLess(abs(estimate.price - exact), 4 * estimate.standard_error)
+
+    def test_worst_of_put_bounds(self):
+        market = MultiAssetMarketState([100.0] * 3, [0.25] * 3, _equicorrelated(3, 0.5), 0.05)
+        worst = self.engine.price(ExoticOption.worst_of_option([100.0] * 3, 1.0, 1.0, is_call=False), market)
+        single = black_scholes_price(100.0, 100.0, 1.0, 0.05, 0.25, 0.0, False) / 100.0
+        self.assertGreater(worst, single)
+        self.assertLess(worst, 3 * single)
+
+    def test_chunking_is_deterministic(self):
+        market = MultiAssetMarketState([100.0, 90.0], [0.2, 0.3], _equicorrelated(2, 0.3), 0.05)
+        option = ExoticOption.basket_option([0.5, 0.5], 95.0, 1.0)
+        engine = MultiAssetMonteCarloEngine(num_paths=50_000, seed=4, chunk_size=7_000)
+        first = engine.estimate(option, market)
+        self.assertEqual(first.batches, 8)
+        self.assertEqual(first.paths, 50_000)
+        self.assertEqual(engine.price(option, market), first.price)
+
+    def test_twenty_assets_hundred_thousand_paths(self):
+        n = 20
+        market = MultiAssetMarketState([100.0] * n, [0.25] * n, _equicorrelated(n, 0.3), 0.05, [0.01] * n)
+        option = ExoticOption.basket_option([1.0 / n] * n, 100.0, 1.0)
+        engine = MultiAssetMonteCarloEngine(num_paths=100_000, seed=1)
+        start = time.perf_counter()
+        estimate = engine.estimate(option, market)
+        self.assertLess(time.perf_counter() - start, 2.0)
+        self.assertLess(estimate.standard_error, 0.05)
+
+if __name__ == '__main__':
+    unittest.main()
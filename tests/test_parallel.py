@@ -0,0 +1,50 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+from derivatives_pricer.instruments.batch import InstrumentBatch, PUT, AMERICAN
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.engines.binomial import BinomialPricingEngine
+from derivatives_pricer.engines.monte_carlo import MonteCarloEngine
+from derivatives_pricer.engines.parallel import ParallelPortfolioPricer
+
+class TestParallelPortfolioPricer(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.01)
+        n = 37
+        self.book = InstrumentBatch.from_arrays(np.linspace(80.0, 120.0, n), np.linspace(0.25, 2.0, n), PUT,
+                                                exercise=AMERICAN)
+        rng = np.random.default_rng(0)
+        self.markets = MarketStateBatch(rng.uniform(90, 110, n), rng.uniform(0.0, 0.05, n),
+                                        rng.uniform(0.1, 0.4, n), np.zeros(n))
+
+    def test_matches_serial_lattice(self):
+        engine = BinomialPricingEngine(step_count=100, backend="numpy")
+        with ParallelPortfolioPricer(engine, processes=2, chunk_size=5) as pricer:
+            np.testing.assert_allclose(pricer.price(self.book, self.market),
+                                       engine.price_batch(self.book, self.market), rtol=1e-12)
+            # Second call reuses the pool with a new shared block and per-row markets.
+            np.testing.assert_allclose(pricer.price(self.book, self.markets),
+                                       engine.price_batch(self.book, self.markets), rtol=1e-12)
+            self.assertEqual(len(pricer.price(self.book[:0], self.market)), 0)
+            with self.assertRaises(ValueError):
+                pricer.price(self.book, self.markets[:3])
+
+    def test_spawned_workers_match_seeded_monte_carlo(self):
+        engine = MonteCarloEngine(num_paths=500, num_steps=10, seed=11)
+        book = InstrumentBatch.from_instruments([
+            ExoticOption.barrier_up_out_call(100.0, 130.0, 1.0),
+            ExoticOption.asian_call(95.0, 0.5),
+            ExoticOption.asian_call(105.0, 1.5),
+        ])
+        with ParallelPortfolioPricer(engine, processes=2, chunk_size=1, start_method="spawn") as pricer:
+            np.testing.assert_array_equal(pricer.price(book, self.market), engine.price_batch(book, self.market))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+import os
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.engines.interface import PricingEngine
+from derivatives_pricer.engines.analytic import BlackScholesEngine
+from derivatives_pricer.engines.binomial import BinomialPricingEngine
+from derivatives_pricer.engines.monte_carlo import MonteCarloEngine
+from derivatives_pricer.engines.scenario import ScenarioEngine
+
+class TestScenarioEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.01)
+        self.spot_shocks = np.linspace(-0.2, 0.2, 5)
+        self.vol_shocks = [-0.05, 0.0, 0.05]
+        self.rate_shocks = [0.0, 0.01]
+        self.options = [
+            VanillaOption.european_call(100.0, 1.0),
+            VanillaOption.european_put(90.0, 0.5),
+            VanillaOption.american_put(110.0, 2.0),
+        ]
+
+    def _check_against_single_prices(self, engine, grid, places):
+        for i, ds in enumerate(grid.spot_shocks):
+            for j, dv in enumerate(grid.vol_shocks):
+                for k, dr in enumerate(grid.rate_shocks):
+                    market = MarketState(100.0 * (1 + ds), 0.05 + dr, 0.20 + dv, 0.01)
+                    for n, option in enumerate(grid.instruments):
+                        self.assertAlmostEqual(grid.values[i, j, k, n],
+                                               engine.price(option, market), places=places)
+
+    def test_black_scholes_grid(self):
+        engine = BlackScholesEngine()
+        grid = ScenarioEngine(engine).run(self.options, self.market,
+                                          self.spot_shocks, self.vol_shocks, self.rate_shocks)
+        self.assertEqual(grid.values.shape, (5, 3, 2, 3))
+        self.assertEqual(grid.dims, ("spot", "vol", "rate", "instrument"))
+        self._check_against_single_prices(engine, grid, places=10)
+        np.testing.assert_allclose(grid.sel(spot=0.0, vol=0.0, rate=0.0), grid.base)
+        self.assertAlmostEqual(float(np.abs(grid.pnl()[2, 1, 0]).max()), 0.0, places=12)
+
+    def test_lattice_grid(self):
+        engine = BinomialPricingEngine(step_count=100)
+        grid = ScenarioEngine(engine).run(self.options, self.market,
+                                          self.spot_shocks, self.vol_shocks, self.rate_shocks)
+        self._check_against_single_prices(engine, grid, places=8)
+
+    def test_monte_carlo_common_random_numbers(self):
+        engine = MonteCarloEngine(num_paths=4000, num_steps=20, seed=9)
+        options = [VanillaOption.european_call(100.0, 1.0), ExoticOption.asian_call(100.0, 1.0)]
+        grid = ScenarioEngine(engine).run(options, self.market, spot_shocks=[-0.01, 0.0, 0.01])
+
+        # Base scenario equals a stand-alone seeded price.
+        self.assertAlmostEqual(grid.base[0], engine.price(options[0], self.market), places=10)
+        # With shared shocks the ladder is monotone and smooth.
+        ladder = grid.values[:, 0, 0, 0]
+        self.assertTrue(np.all(np.diff(ladder) > 0))
+        delta = (ladder[2] - ladder[0]) / 2.0
+        self.assertAlmostEqual(delta, 0.6, delta=0.05)
+
+    def test_monte_carlo_respects_engine_settings(self):
+        # American exercise is rejected as by the engine itself.
+        with self.assertRaises(TypeError):
+            ScenarioEngine(MonteCarloEngine(num_paths=1000, seed=1)).run(self.options, self.market)
+
+        # Adaptive engines price each point to their own error target.
+        engine = MonteCarloEngine(num_paths=2000, num_steps=10, seed=4, abs_tol=0.05, max_paths=50000)
+        option = VanillaOption.european_call(100.0, 1.0)
+        grid = ScenarioEngine(engine).run([option], self.market, spot_shocks=[-0.05, 0.05])
+        for i, ds in enumerate(grid.spot_shocks):
+            market = MarketState(100.0 * (1 + ds), 0.05, 0.20, 0.01)
+            self.assertEqual(grid.values[i, 0, 0, 0], engine.price(option, market))
+        self.assertEqual(grid.base[0], engine.price(option, self.market))
+
+    def test_generic_fallback(self):
+        """Engines without a broadcast path are priced scenario by scenario."""
+        class SpotTimesVolEngine(PricingEngine):
+            calls = 0
+
+            def price(self, instrument, market_state):
+                self.calls += 1
+                return market_state.spot_price * market_state.volatility
+
+        engine = SpotTimesVolEngine()
+        grid = ScenarioEngine(engine).run(
+            self.options[:1], self.market, spot_shocks=[0.1, 0.2], vol_shocks=[0.05]
+        )
+        self.assertAlmostEqual(grid.values[0, 0, 0, 0], 110.0 * 0.25)
+        self.assertAlmostEqual(grid.base[0], 100.0 * 0.20)
+        # Two grid points plus the base scenario, nothing padded.
+        self.assertEqual(engine.calls, 3)
+
+    def test_rejects_negative_vol(self):
+        with self.assertRaises(ValueError):
+            ScenarioEngine(BlackScholesEngine()).run(self.options, self.market, vol_shocks=[-0.3])
+
+if __name__ == '__main__':
+    unittest.main()
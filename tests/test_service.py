@@ -0,0 +1,131 @@
+import sys
+import os
+import asyncio
+import json
+import threading
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.engines.analytic import BlackScholesEngine
+from derivatives_pricer.engines.binomial import BinomialPricingEngine
+from derivatives_pricer.service import PricingService, QuoteServer, ServiceOverloaded, parse_quote
+
+async def http_request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode().partition(":")
+        headers[name.strip().lower()] = value.strip()
+    data = await reader.readexactly(int(headers["content-length"]))
+    writer.close()
+    return int(status_line.split()[1]), json.loads(data)
+
+class TestPricingService(unittest.TestCase):
+
+    def setUp(self):
+        self.market = MarketState(100.0, 0.05, 0.20, 0.01)
+        self.options = [VanillaOption.european_call(k, 1.0) for k in np.linspace(80.0, 120.0, 200)]
+
+    def test_burst_is_coalesced_into_batches(self):
+        engine = BinomialPricingEngine(step_count=100, backend="numpy")
+
+        async def run():
+            async with PricingService(engine, max_batch=64, max_wait=0.05) as service:
+                prices = await service.quote_many([(o, self.market) for o in self.options])
+                return prices, service.stats()
+
+        prices, stats = asyncio.run(run())
+        expected = [engine.price(o, self.market) for o in self.options]
+        np.testing.assert_allclose(prices, expected, rtol=1e-9)
+        self.assertEqual(stats.requests, 200)
+        self.assertLessEqual(stats.batches, 5)
+        self.assertEqual(stats.max_batch_size, 64)
+        self.assertGreater(stats.latency_p99_ms, 0.0)
+
+    def test_unsupported_rows_fail_individually(self):
+        async def run():
+            async with PricingService(BlackScholesEngine(), max_wait=0.01) as service:
+                return await asyncio.gather(
+                    service.quote(self.options[0], self.market),
+                    service.quote(ExoticOption.asian_call(100.0, 1.0), self.market),
+                    return_exceptions=True,
+                )
+
+        good, bad = asyncio.run(run())
+        self.assertAlmostEqual(good, BlackScholesEngine().price(self.options[0], self.market), places=10)
+        self.assertIsInstance(bad, TypeError)
+
+    def test_backpressure_rejects_when_full(self):
+        async def run():
+            async with PricingService(BlackScholesEngine(), max_batch=4, max_wait=0.01, max_pending=8) as service:
+                return await service.quote_many([(o, self.market) for o in self.options[:50]], wait=False)
+
+        with self.assertRaises(ServiceOverloaded):
+            asyncio.run(run())
+
+    def test_stop_fails_pending_requests(self):
+        started, release = threading.Event(), threading.Event()
+
+        class BlockingEngine(BlackScholesEngine):
+            def price_batch(self, batch, market):
+                started.set()
+                release.wait(5.0)
+                return super().price_batch(batch, market)
+
+        async def run():
+            service = PricingService(BlockingEngine(), max_batch=1, max_wait=0.0, workers=1)
+            await service.start()
+            in_flight = asyncio.create_task(service.quote(self.options[0], self.market))
+            queued = asyncio.create_task(service.quote(self.options[1], self.market))
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            await service.stop()
+            release.set()
+            return await asyncio.wait_for(asyncio.gather(in_flight, queued, return_exceptions=True), 1.0)
+
+        for outcome in asyncio.run(run()):
+            self.assertIsInstance(outcome, RuntimeError)
+
+    def test_http_front_end(self):
+        quote = {"strike": 100, "expiry": 1.0, "option_type": "put", "exercise": "american",
+                 "spot_price": 100, "risk_free_rate": 0.05, "volatility": 0.2}
+        engine = BinomialPricingEngine(step_count=100, backend="numpy")
+
+        async def run():
+            async with QuoteServer(PricingService(engine, max_wait=0.01)) as server:
+                single = await http_request(server.port, "POST", "/price", quote)
+                many = await http_request(server.port, "POST", "/price", [quote, dict(quote, strike=90)])
+                bad = await http_request(server.port, "POST", "/price", {"strike": 100})
+                stats = await http_request(server.port, "GET", "/stats")
+                return single, many, bad, stats
+
+        single, many, bad, stats = asyncio.run(run())
+        instrument, market = parse_quote(quote)
+        self.assertEqual(instrument, VanillaOption.american_put(100.0, 1.0))
+        self.assertEqual(single[0], 200)
+        self.assertAlmostEqual(single[1]["price"], engine.price(instrument, market), places=10)
+        self.assertEqual(many[0], 200)
+        self.assertEqual(len(many[1]["prices"]), 2)
+        self.assertEqual(bad[0], 400)
+        self.assertEqual(stats[1]["requests"], 3)
+
+    def test_parse_quote_rejects_unknown_codes(self):
+        quote = {"strike": 100, "expiry": 1.0, "option_type": 2, "spot_price": 100, "risk_free_rate": 0.05,
+                 "volatility": 0.2}
+        self.assertEqual(parse_quote(quote)[0], VanillaOption.european_put(100.0, 1.0))
+        for field, value in (("option_type", 7), ("exercise", -1), ("barrier_type", 9), ("option_type", "straddle")):
+            with self.assertRaises(ValueError, msg=field):
+                parse_quote(dict(quote, **{field: value}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import sys
+import os
+import tempfile
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.domain.market import MarketState, MarketStateBatch
+from derivatives_pricer.instruments.options import VanillaOption
+from derivatives_pricer.instruments.exotics import ExoticOption
+from derivatives_pricer.instruments.batch import InstrumentBatch
+from derivatives_pricer.engines.analytic import BlackScholesEngine
+from derivatives_pricer.data import storage
+
+def assert_batches_equal(test, left, right):
+    test.assertEqual(type(left), type(right))
+    for name in storage._column_names(type(left)):
+        np.testing.assert_array_equal(getattr(left, name), getattr(right, name), err_msg=name)
+
+class TestStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.market = MarketState(100.0, 0.05, 0.20, 0.01)
+        self.trades = InstrumentBatch.from_instruments([
+            VanillaOption.european_call(100.0, 1.0),
+            VanillaOption.american_put(110.0, 2.0),
+            ExoticOption.barrier_up_out_call(100.0, 150.0, 1.0),
+            ExoticOption.asian_call(95.0, 0.75),
+        ])
+        self.markets = MarketStateBatch.from_states([self.market, MarketState(50.0, 0.01, 0.3)])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_csv_round_trip(self):
+        storage.write_trades_csv(self.trades, self.path("trades.csv"))
+        storage.write_markets_csv(self.markets, self.path("markets.csv"))
+        assert_batches_equal(self, storage.read_trades_csv(self.path("trades.csv")), self.trades)
+        assert_batches_equal(self, storage.read_markets_csv(self.path("markets.csv")), self.markets)
+
+        # The NumPy parser (used without pyarrow and for chunked reads) agrees.
+        chunks = list(storage.iter_trades_csv(self.path("trades.csv"), chunk_rows=3))
+        self.assertEqual([len(c) for c in chunks], [3, 1])
+        merged = InstrumentBatch(**{
+            name: np.concatenate([getattr(c, name) for c in chunks]) for name in storage._column_names(InstrumentBatch)
+        })
+        assert_batches_equal(self, merged, self.trades)
+
+    def test_csv_names_codes_and_defaults(self):
+        with open(self.path("book.csv"), "w") as fh:
+            fh.write("strike,expiry,option_type,exercise\n100,1.0,put,American\n90,0.5,2,\n")
+        batch = storage.read_trades_csv(self.path("book.csv"))
+        self.assertEqual(batch.to_instruments(), [
+            VanillaOption.american_put(100.0, 1.0),
+            VanillaOption.european_put(90.0, 0.5),
+        ])
+        with open(self.path("bad.csv"), "w") as fh:
+            fh.write("strike,expiry,option_type\n100,1.0,straddle\n")
+        with self.assertRaises(ValueError):
+            storage.read_trades_csv(self.path("bad.csv"))
+        with self.assertRaises(ValueError):
+            next(storage.iter_trades_csv(self.path("bad.csv")))
+
+    def test_csv_header_spaces_and_unknown_codes(self):
+        with open(self.path("book.csv"), "w") as fh:
+            fh.write("strike, expiry, option_type\n100,1.0,CALL\n")
+        expected = [VanillaOption.european_call(100.0, 1.0)]
+        self.assertEqual(storage.read_trades_csv(self.path("book.csv")).to_instruments(), expected)
+        self.assertEqual(next(storage.iter_trades_csv(self.path("book.csv"))).to_instruments(), expected)
+
+        # Integer codes outside the enum are rejected rather than priced as some other type.
+        with open(self.path("bad.csv"), "w") as fh:
+            fh.write("strike,expiry,option_type\n100,1.0,7\n")
+        with self.assertRaises(ValueError):
+            storage.read_trades_csv(self.path("bad.csv"))
+        with self.assertRaises(ValueError):
+            next(storage.iter_trades_csv(self.path("bad.csv")))
+
+    def test_memory_mapped_columns(self):
+        storage.save_columns(self.trades, self.path("book"))
+        loaded = storage.load_columns(self.path("book"), InstrumentBatch)
+        assert_batches_equal(self, loaded, self.trades)
+        self.assertIsInstance(loaded.strike.base, np.memmap)
+
+        storage.save_npz(self.markets, self.path("markets.npz"))
+        assert_batches_equal(self, storage.load_npz(self.path("markets.npz"), MarketStateBatch), self.markets)
+
+    def test_binary_readers_reject_unknown_codes(self):
+        bad = InstrumentBatch(**{name: getattr(self.trades, name).copy()
+                                 for name in storage._column_names(InstrumentBatch)})
+        bad.exercise[0] = 9
+        storage.save_columns(bad, self.path("book"))
+        with self.assertRaises(ValueError):
+            storage.load_columns(self.path("book"), InstrumentBatch)
+        storage.save_npz(bad, self.path("book.npz"))
+        with self.assertRaises(ValueError):
+            storage.load_npz(self.path("book.npz"), InstrumentBatch)
+        if storage.PYARROW_AVAILABLE:
+            storage.write_parquet(bad, self.path("book.parquet"))
+            with self.assertRaises(ValueError):
+                storage.read_parquet(self.path("book.parquet"), InstrumentBatch)
+            with self.assertRaises(ValueError):
+                next(storage.iter_parquet(self.path("book.parquet"), InstrumentBatch))
+
+    @unittest.skipUnless(storage.PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_parquet_round_trip(self):
+        storage.write_parquet(self.trades, self.path("trades.parquet"))
+        assert_batches_equal(self, storage.read_parquet(self.path("trades.parquet"), InstrumentBatch), self.trades)
+        chunks = list(storage.iter_parquet(self.path("trades.parquet"), InstrumentBatch, chunk_rows=2))
+        self.assertEqual([len(c) for c in chunks], [2, 2])
+
+    def test_price_chunks_streams_results(self):
+        vanillas = InstrumentBatch.from_arrays(np.linspace(80.0, 120.0, 25), 1.0, 1)
+        storage.write_trades_csv(vanillas, self.path("vanillas.csv"))
+        engine = BlackScholesEngine()
+        expected = engine.price_batch(vanillas, self.market)
+
+        chunks = storage.iter_trades_csv(self.path("vanillas.csv"), chunk_rows=10)
+        with storage.NpyResultWriter(self.path("prices.npy"), len(vanillas)) as writer:
+            self.assertEqual(storage.price_chunks(engine, chunks, self.market, writer), 25)
+        np.testing.assert_allclose(np.load(self.path("prices.npy")), expected, rtol=1e-12)
+
+        chunks = storage.iter_trades_csv(self.path("vanillas.csv"), chunk_rows=10)
+        with storage.CsvResultWriter(self.path("prices.csv")) as writer:
+            storage.price_chunks(engine, chunks, self.market, writer)
+        np.testing.assert_allclose(np.loadtxt(self.path("prices.csv"), skiprows=1), expected, rtol=1e-9)
+
+    def test_price_chunks_empty_sources(self):
+        engine = BlackScholesEngine()
+        with storage.CsvResultWriter(self.path("none.csv")) as writer:
+            self.assertEqual(storage.price_chunks(engine, iter([]), self.market, writer), 0)
+            # More trade chunks than market chunks is an error, not a leaked StopIteration.
+            with self.assertRaises(ValueError):
+                storage.price_chunks(engine, [self.trades[:2]], iter([]), writer)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys
+import os
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from derivatives_pricer.common.validation import validate_positive, validate_probability
+from derivatives_pricer.domain.market import MarketState
+from derivatives_pricer.domain.analytic_formulas import black_scholes_price, black_scholes_price_vectorized
+from derivatives_pricer.engines.binomial import BinomialParameterizer
+from derivatives_pricer.math import analytics
+from derivatives_pricer.engines.monte_carlo import MonteCarloEngine
+
+class Model:
+    @validate_positive("steps")
+    @validate_probability("weight")
+    def __init__(self, name, steps=10, weight=0.5, *, tag=None):
+        self.steps = steps
+
+class TestValidation(unittest.TestCase):
+
+    def test_positional_keyword_and_default_arguments(self):
+        self.assertEqual(Model("a").steps, 10)
+        self.assertEqual(Model("a", 3).steps, 3)
+        self.assertEqual(Model("a", steps=4, tag="x").steps, 4)
+        with self.assertRaises(ValueError):
+            Model("a", 0)
+        with self.assertRaises(ValueError):
+            Model("a", steps=-1)
+        with self.assertRaises(ValueError):
+            Model("a", 5, 1.5)
+        with self.assertRaises(ValueError):
+            MonteCarloEngine(num_paths=0)
+
+    def test_unknown_parameter_fails_at_decoration(self):
+        with self.assertRaises(TypeError):
+            validate_positive("missing")(lambda x: x)
+
+class TestScalarFastPaths(unittest.TestCase):
+
+    def test_scalar_black_scholes_matches_vectorized(self):
+        for is_call in (True, False):
+            for strike in (60.0, 100.0, 150.0):
+                scalar = black_scholes_price(100.0, strike, 0.75, 0.03, 0.25, 0.01, is_call)
+                vector = black_scholes_price_vectorized(100.0, strike, 0.75, 0.03, 0.25, 0.01, is_call)
+                self.assertAlmostEqual(scalar, float(vector), places=12)
+
+    def test_scalar_black_scholes_degenerate_inputs(self):
+        # Zero volatility: discounted intrinsic value of the forward.
+        self.assertAlmostEqual(black_scholes_price(100.0, 90.0, 1.0, 0.05, 0.0, 0.0, True), 14.389351794935735)
+        self.assertEqual(black_scholes_price(100.0, 90.0, 1.0, 0.05, 0.0, 0.0, False), 0.0)
+        # Expired: intrinsic value.
+        self.assertEqual(black_scholes_price(100.0, 90.0, 0.0, 0.05, 0.2, 0.0, True), 10.0)
+        # The math-module entry point (used by BlackScholesEngine) takes the same limits.
+        self.assertAlmostEqual(analytics.black_scholes_price(100.0, 90.0, 1.0, 0.05, 0.0), 14.389351794935735)
+        self.assertEqual(analytics.black_scholes_price(100.0, 90.0, 1.0, 0.05, 0.0, is_call=False), 0.0)
+
+    def test_lattice_parameters_are_cached(self):
+        BinomialParameterizer.cache_clear()
+        market = MarketState(100.0, 0.05, 0.2)
+        first = BinomialParameterizer.calculate(market, 1.0, 100)
+        self.assertIs(BinomialParameterizer.calculate(MarketState(100.0, 0.05, 0.2), 1.0, 100), first)
+        self.assertIsNot(BinomialParameterizer.calculate(market, 1.0, 101), first)
+
+if __name__ == '__main__':
+    unittest.main()